@@ -12,6 +12,8 @@ from openbb_core.api.router.system import router as router_system
 from openbb_core.app.service.auth_service import AuthService
 from openbb_core.app.service.system_service import SystemService
 from openbb_core.env import Env
+from openbb_core.provider.utils.executor import shutdown_executors
+from openbb_core.provider.utils.session_pool import close_sessions
 
 logger = logging.getLogger("uvicorn.error")
 
@@ -20,7 +22,7 @@ system = SystemService().system_settings
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    """Startup event."""
+    """Startup and shutdown events."""
     auth = "ENABLED" if Env().API_AUTH else "DISABLED"
     banner = rf"""
 
@@ -40,6 +42,8 @@ Investment research for everyone, anywhere.
 """
     logger.info(banner)
     yield
+    await close_sessions()
+    shutdown_executors(wait=False)
 
 
 app = FastAPI(
@@ -5,8 +5,12 @@ from functools import partial, wraps
 from inspect import Parameter, Signature, signature
 from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
 
-from fastapi import APIRouter, Depends, Header
+from fastapi import APIRouter, Depends, Header, Request
 from fastapi.routing import APIRoute
+from openbb_core.api.router.helpers.response_helpers import (
+    build_response,
+    get_response_format,
+)
 from openbb_core.app.command_runner import CommandRunner
 from openbb_core.app.model.command_context import CommandContext
 from openbb_core.app.model.obbject import OBBject
@@ -111,6 +115,18 @@ def build_new_signature(path: str, func: Callable) -> Signature:
         )
         var_kw_pos += 1
 
+    # The request is used to pick the response format, see `get_response_format`.
+    new_parameter_list.insert(
+        var_kw_pos,
+        Parameter(
+            "__request",
+            kind=Parameter.POSITIONAL_OR_KEYWORD,
+            default=None,
+            annotation=Request,
+        ),
+    )
+    var_kw_pos += 1
+
     return Signature(
         parameters=new_parameter_list,
         return_annotation=return_annotation,
@@ -195,9 +211,12 @@ def build_api_wrapper(
                 UserService.read_default_user_settings(),
             )
         )
+        response_format = get_response_format(kwargs.pop("__request", None))  # type: ignore[arg-type]
         execute = partial(command_runner.run, path, user_settings)
         output: OBBject = await execute(*args, **kwargs)
 
+        if response_format:
+            return build_response(validate_output(output), response_format)  # type: ignore[return-value]
         return validate_output(output)
 
     return wrapper
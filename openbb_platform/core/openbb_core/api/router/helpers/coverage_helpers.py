@@ -9,8 +9,6 @@ from pydantic import BaseModel, Field, create_model
 if TYPE_CHECKING:
     from openbb_core.app.static.app_factory import BaseApp
 
-provider_interface = ProviderInterface()
-
 
 def get_route_callable(app: "BaseApp", route: str) -> Callable:
     """Get the callable for a route."""
@@ -54,7 +52,7 @@ def signature_to_fields(app: "BaseApp", route: str) -> Dict[str, Tuple[Any, Fiel
 
 def dataclass_to_fields(model_name: str) -> Dict[str, Tuple[Any, Field]]:  # type: ignore
     """Convert a dataclass to pydantic fields."""
-    dataclass = provider_interface.params[model_name]["extra"]
+    dataclass = ProviderInterface().params[model_name]["extra"]
     fields = {}
     for name, field in dataclass.__dataclass_fields__.items():
         type_annotation = field.default.annotation if field.default is not None else Any  # type: ignore
@@ -108,7 +106,7 @@ def get_route_schema_map(
             dataclass_to_fields(model),
             filter_by_provider=filter_by_provider,
         )
-        output_model = provider_interface.return_schema[model]
+        output_model = ProviderInterface().return_schema[model]
         return_callable = get_route_callable(app, route)
 
         route_schema_map[route] = {
@@ -0,0 +1,142 @@
+"""Response format API router helper functions."""
+
+import json
+from itertools import chain
+from typing import Any, Iterator, List, Optional
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_core.app.model.obbject import OBBject
+from openbb_core.provider.abstract.columnar_result import ColumnarResult
+from pydantic_core import to_json
+
+# Response formats other than JSON, by name and media type.
+RESPONSE_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+# Records encoded in each chunk of a streamed NDJSON response.
+CHUNK_SIZE = 1000
+# Rows in each record batch, or row group, of a streamed Arrow or Parquet response.
+BATCH_SIZE = 65536
+
+
+def get_response_format(request: Optional[Request]) -> Optional[str]:
+    """Get the response format from the `format` query parameter or the Accept header.
+
+    Returns
+    -------
+    Optional[str]
+        The format name, None for the default JSON response.
+    """
+    if request is None:
+        return None
+    response_format = request.query_params.get("format")
+    if response_format:
+        response_format = response_format.lower()
+        if response_format == "json":
+            return None
+        if response_format not in RESPONSE_FORMATS:
+            raise OpenBBError(
+                f"Unsupported response format '{response_format}'. Choose from: "
+                + ", ".join(["json", *RESPONSE_FORMATS])
+            )
+        return response_format
+    accept = request.headers.get("accept", "")
+    for name, media_type in RESPONSE_FORMATS.items():
+        if media_type in accept:
+            return name
+    return None
+
+
+def _iter_ndjson(results: Any) -> Iterator[bytes]:
+    """Encode the results as newline delimited JSON, one record per line."""
+    if isinstance(results, ColumnarResult):
+        for batch in results.table.to_batches(CHUNK_SIZE):
+            yield b"".join(to_json(row) + b"\n" for row in batch.to_pylist())
+        return
+    if not isinstance(results, list):
+        results = [] if results is None else [results]
+    for start in range(0, len(results), CHUNK_SIZE):
+        yield b"".join(
+            to_json(item, by_alias=True) + b"\n"
+            for item in results[start : start + CHUNK_SIZE]
+        )
+
+
+class _ChunkSink:
+    """File-like object collecting what the Arrow writers write."""
+
+    def __init__(self) -> None:
+        """Initialize the sink."""
+        self.chunks: List[bytes] = []
+        self.closed = False
+
+    def write(self, data: Any) -> int:
+        """Collect the written bytes."""
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        """Nothing to flush, the chunks are taken by the response."""
+
+    def take(self) -> bytes:
+        """Take the collected bytes."""
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def _iter_arrow(obbject: OBBject, response_format: str) -> Iterator[bytes]:
+    """Encode the results as an Arrow IPC stream or a Parquet file, a record batch at a time."""
+    try:
+        import pyarrow as pa  # type: ignore # pylint: disable=import-outside-toplevel
+        import pyarrow.parquet as pq  # type: ignore # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise OpenBBError(
+            f"The '{response_format}' response format requires pyarrow on the server."
+        ) from exc
+
+    table = obbject.to_arrow() if obbject.results else pa.table({})
+    sink = _ChunkSink()
+    writer = (
+        pa.ipc.new_stream(sink, table.schema)
+        if response_format == "arrow"
+        else pq.ParquetWriter(sink, table.schema)
+    )
+    with writer:
+        for batch in table.to_batches(BATCH_SIZE):
+            if response_format == "arrow":
+                writer.write_batch(batch)
+            else:
+                writer.write_table(pa.Table.from_batches([batch]))
+            yield sink.take()
+    yield sink.take()
+
+
+def build_response(obbject: OBBject, response_format: str) -> StreamingResponse:
+    """Stream the results of a command in the requested format.
+
+    The provider and warnings are sent in the `X-OpenBB-Provider` and
+    `X-OpenBB-Warnings` headers, since these formats only hold the results.
+    """
+    if response_format == "ndjson":
+        content = _iter_ndjson(obbject.results)
+    else:
+        content = _iter_arrow(obbject, response_format)
+        # Fail before the response starts if the results can't be converted.
+        first = next(content)
+        content = chain([first], content)
+
+    headers = {}
+    if obbject.provider:
+        headers["X-OpenBB-Provider"] = obbject.provider
+    if obbject.warnings:
+        headers["X-OpenBB-Warnings"] = json.dumps(
+            [w.model_dump() for w in obbject.warnings]
+        )
+    return StreamingResponse(
+        content, media_type=RESPONSE_FORMATS[response_format], headers=headers
+    )
@@ -0,0 +1,139 @@
+"""Execution of CPU-bound commands out of the event loop."""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from warnings import catch_warnings, simplefilter, warn_explicit
+
+from openbb_core.app.model.abstract.warning import record_warnings
+from openbb_core.app.model.obbject import OBBject
+from openbb_core.env import Env
+from openbb_core.provider.abstract.columnar_result import ColumnarResult
+from openbb_core.provider.abstract.data import Data
+from openbb_core.provider.utils.executor import ExecutorKind, run_blocking
+from openbb_core.provider.utils.helpers import maybe_coroutine, run_async
+
+
+def is_cpu_bound(func: Callable) -> bool:
+    """Check if a command is tagged as CPU-bound, with `@router.command(cpu_bound=True)`."""
+    return getattr(func, "cpu_bound", False)
+
+
+def _is_list_of_data(value: Any) -> bool:
+    """Check if a value is a non-empty list of Data."""
+    return (
+        isinstance(value, list)
+        and bool(value)
+        and all(isinstance(item, Data) for item in value)
+    )
+
+
+def to_arrow_buffer(data: List[Data]) -> Optional[bytes]:
+    """Serialize a list of Data as an Arrow IPC stream.
+
+    Returns None when pyarrow is not installed or the columns have mixed types,
+    the list is then sent as it is.
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        import pyarrow as pa  # type: ignore
+
+        table = pa.Table.from_pylist([item.model_dump() for item in data])
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+    except (ImportError, ValueError, TypeError, ArithmeticError):
+        # pyarrow.ArrowInvalid and ArrowTypeError are ValueError and TypeError.
+        return None
+
+
+def from_arrow_buffer(buffer: bytes) -> ColumnarResult:
+    """Read an Arrow IPC stream as a columnar result of Data, without copying the columns."""
+    # pylint: disable=import-outside-toplevel
+    import pyarrow as pa  # type: ignore
+
+    return ColumnarResult(pa.ipc.open_stream(pa.py_buffer(buffer)).read_all())
+
+
+class _ArrowData:
+    """A list of Data sent to a worker process as an Arrow IPC stream."""
+
+    def __init__(self, buffer: bytes) -> None:
+        """Initialize the payload."""
+        self.buffer = buffer
+
+
+def _pack(value: Any) -> Any:
+    """Replace a list of Data with its Arrow IPC stream."""
+    if _is_list_of_data(value) and (buffer := to_arrow_buffer(value)) is not None:
+        return _ArrowData(buffer)
+    return value
+
+
+def _unpack(value: Any) -> Any:
+    """Replace an Arrow IPC stream with a columnar result."""
+    return from_arrow_buffer(value.buffer) if isinstance(value, _ArrowData) else value
+
+
+def _run_command(
+    func: Callable, kwargs: Dict[str, Any], pack: bool
+) -> Tuple[OBBject, Any, List[Tuple[Any, type, str, int]]]:
+    """Run a command in a worker and return its output and warnings.
+
+    The results are returned apart from the output, as an Arrow IPC stream if
+    `pack` is set and they are a list of Data.
+    """
+    kwargs = {name: _unpack(value) for name, value in kwargs.items()}
+    if pack:
+        # A worker process runs one command at a time, so it can swap the global
+        # filters to record all the warnings, the caller filters them again.
+        with catch_warnings(record=True) as warning_list:
+            simplefilter("always")
+            obbject = run_async(func, **kwargs)
+    else:
+        with record_warnings() as warning_list:
+            obbject = run_async(func, **kwargs)
+    results, obbject.results = obbject.results, None
+    return (
+        obbject,
+        _pack(results) if pack else results,
+        [(w.message, w.category, w.filename, w.lineno) for w in warning_list],
+    )
+
+
+async def run_cpu_bound(
+    func: Callable,
+    kwargs: Dict[str, Any],
+    kind: Optional[ExecutorKind] = None,
+) -> OBBject:
+    """Run a CPU-bound command out of the event loop.
+
+    In a process pool, the lists of Data in the arguments and the results are
+    sent as Arrow IPC streams instead of pickled Data, the command receives them
+    as columnar results, which it can read like lists.
+
+    Parameters
+    ----------
+    func : Callable
+        The command, a module level function, so the workers can import it.
+    kwargs : Dict[str, Any]
+        The arguments of the command.
+    kind : Optional[Literal["process", "thread", "inline"]]
+        Where to run the command, by default the OPENBB_CPU_BOUND_EXECUTOR
+        environment variable, "inline" in the event loop unless it is set.
+    """
+    if kind is None:
+        kind = Env().CPU_BOUND_EXECUTOR  # type: ignore[assignment]
+    if kind == "inline":
+        return await maybe_coroutine(func, **kwargs)
+
+    pack = kind == "process"
+    if pack:
+        kwargs = {name: _pack(value) for name, value in kwargs.items()}
+    obbject, results, warning_list = await run_blocking(
+        func.__module__.split(".")[0], _run_command, func, kwargs, pack, kind=kind
+    )
+    obbject.results = _unpack(results)
+    # The warnings of the worker are raised again for the caller to record them.
+    for message, category, filename, lineno in warning_list:
+        warn_explicit(message, category, filename, lineno)
+    return obbject
@@ -2,20 +2,26 @@
 
 # pylint: disable=R0903
 
+import asyncio
 from copy import deepcopy
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from inspect import Parameter, signature
 from sys import exc_info
 from time import perf_counter_ns
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type
-from warnings import catch_warnings, showwarning, warn
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from warnings import showwarning, warn
 
 from pydantic import BaseModel, ConfigDict, create_model
 
+from openbb_core.app.command_executor import is_cpu_bound, run_cpu_bound
 from openbb_core.app.logs.logging_service import LoggingService
 from openbb_core.app.model.abstract.error import OpenBBError
-from openbb_core.app.model.abstract.warning import OpenBBWarning, cast_warning
+from openbb_core.app.model.abstract.warning import (
+    OpenBBWarning,
+    cast_warning,
+    record_warnings,
+)
 from openbb_core.app.model.command_context import CommandContext
 from openbb_core.app.model.metadata import Metadata
 from openbb_core.app.model.obbject import OBBject
@@ -27,6 +33,8 @@ from openbb_core.app.service.system_service import SystemService
 from openbb_core.app.service.user_service import UserService
 from openbb_core.env import Env
 from openbb_core.provider.utils.helpers import maybe_coroutine, run_async
+from openbb_core.provider.utils.result_cache import get_result_cache
+from openbb_core.provider.utils.session_pool import close_sessions
 
 
 class ExecutionContext:
@@ -59,13 +67,13 @@ class ParametersBuilder:
 
     @staticmethod
     def get_polished_func(func: Callable) -> Callable:
-        """Remove __authenticated_user_settings from the function signature and annotations."""
+        """Remove the API only parameters from the function signature and annotations."""
         func = deepcopy(func)
         sig = signature(func)
         parameter_map = dict(sig.parameters)
 
-        if "__authenticated_user_settings" in parameter_map:
-            parameter_map.pop("__authenticated_user_settings")
+        for name in ("__authenticated_user_settings", "__request"):
+            parameter_map.pop(name, None)
 
         parameter_list = list(parameter_map.values())
         new_signature = signature(func).replace(parameters=parameter_list)
@@ -221,7 +229,10 @@ class StaticCommandRunner:
         show_warnings: bool = True,  # pylint: disable=unused-argument   # type: ignore
     ) -> OBBject:
         """Run a command and return the output."""
-        obbject = await maybe_coroutine(func, **kwargs)
+        if is_cpu_bound(func):
+            obbject = await run_cpu_bound(func, kwargs)
+        else:
+            obbject = await maybe_coroutine(func, **kwargs)
         obbject.provider = getattr(kwargs.get("provider_choices"), "provider", None)
         return obbject
 
@@ -279,7 +290,7 @@ class StaticCommandRunner:
         user_settings = execution_context.user_settings
         system_settings = execution_context.system_settings
 
-        with catch_warnings(record=True) as warning_list:
+        with record_warnings() as warning_list:
             # If we're on Jupyter we need to pop here because we will lose "chart" after
             # ParametersBuilder.build. This needs to be fixed in a way that chart is
             # added to the function signature and shared for jupyter and api
@@ -395,7 +406,8 @@ class CommandRunner:
         user_settings: Optional[UserSettings] = None,
     ) -> None:
         """Initialize the command runner."""
-        self._command_map = command_map or CommandMap()
+        # The command map imports every extension, so it is loaded on first use.
+        self._command_map = command_map
         self._system_settings = system_settings or SystemService().system_settings
         self._user_settings = user_settings or UserService.read_default_user_settings()
 
@@ -408,6 +420,8 @@ class CommandRunner:
     @property
     def command_map(self) -> CommandMap:
         """Command map."""
+        if self._command_map is None:
+            self._command_map = CommandMap()
         return self._command_map
 
     @property
@@ -437,7 +451,7 @@ class CommandRunner:
         self._user_settings = user_settings or self._user_settings
 
         execution_context = ExecutionContext(
-            command_map=self._command_map,
+            command_map=self.command_map,
             route=route,
             system_settings=self._system_settings,
             user_settings=self._user_settings,
@@ -445,6 +459,59 @@ class CommandRunner:
 
         return await StaticCommandRunner.run(execution_context, *args, **kwargs)
 
+    async def run_many(
+        self,
+        commands: List[Tuple[str, Dict[str, Any]]],
+        user_settings: Optional[UserSettings] = None,
+        max_concurrency: int = 10,
+        provider_limits: Optional[Dict[str, int]] = None,
+    ) -> List[Union[OBBject, Exception]]:
+        """Run many commands concurrently on the running event loop.
+
+        Parameters
+        ----------
+        commands : List[Tuple[str, Dict[str, Any]]]
+            Routes and their keyword arguments, as passed to `run`.
+        user_settings : Optional[UserSettings]
+            User settings for all the commands, by default the runner ones.
+        max_concurrency : int
+            Maximum number of commands running at the same time, by default 10.
+        provider_limits : Optional[Dict[str, int]]
+            Maximum number of commands running at the same time per provider,
+            for example {"fmp": 5}.
+
+        Returns
+        -------
+        List[Union[OBBject, Exception]]
+            The outputs in the same order as the commands.
+            A command that fails returns its exception instead of raising it.
+        """
+        semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+        provider_semaphores = {
+            p: asyncio.Semaphore(max(limit, 1))
+            for p, limit in (provider_limits or {}).items()
+        }
+
+        async def _run_one(route: str, kwargs: Dict[str, Any]) -> OBBject:
+            provider_choices = kwargs.get("provider_choices") or {}
+            provider = (
+                provider_choices.get("provider")
+                if isinstance(provider_choices, dict)
+                else getattr(provider_choices, "provider", None)
+            )
+            provider_semaphore = provider_semaphores.get(provider)
+            if provider_semaphore is None:
+                async with semaphore:
+                    return await self.run(route, user_settings, **kwargs)
+            # Wait for the provider first, so it doesn't hold a global slot meanwhile.
+            async with provider_semaphore, semaphore:
+                return await self.run(route, user_settings, **kwargs)
+
+        return await asyncio.gather(
+            *[_run_one(route, kwargs) for route, kwargs in commands],
+            return_exceptions=True,
+        )
+
     # pylint: disable=W1113
     def sync_run(
         self,
@@ -455,4 +522,56 @@ class CommandRunner:
         **kwargs,
     ) -> OBBject:
         """Run a command and return the OBBject as output."""
-        return run_async(self.run, route, user_settings, *args, **kwargs)
+        return run_async(self._run_in_loop, route, user_settings, *args, **kwargs)
+
+    # pylint: disable=W1113
+    async def _run_in_loop(
+        self,
+        route: str,
+        user_settings: Optional[UserSettings] = None,
+        /,
+        *args,
+        **kwargs,
+    ) -> OBBject:
+        """Run a command in a short-lived event loop, releasing its pending work."""
+        try:
+            return await self.run(route, user_settings, *args, **kwargs)
+        finally:
+            await self._release_loop()
+
+    def sync_run_many(
+        self,
+        commands: List[Tuple[str, Dict[str, Any]]],
+        user_settings: Optional[UserSettings] = None,
+        max_concurrency: int = 10,
+        provider_limits: Optional[Dict[str, int]] = None,
+    ) -> List[Union[OBBject, Exception]]:
+        """Run many commands concurrently and return their outputs in order."""
+        return run_async(
+            self._run_many_in_loop,
+            commands,
+            user_settings,
+            max_concurrency,
+            provider_limits,
+        )
+
+    async def _run_many_in_loop(
+        self,
+        commands: List[Tuple[str, Dict[str, Any]]],
+        user_settings: Optional[UserSettings] = None,
+        max_concurrency: int = 10,
+        provider_limits: Optional[Dict[str, int]] = None,
+    ) -> List[Union[OBBject, Exception]]:
+        """Run many commands in a short-lived event loop, releasing its pending work."""
+        try:
+            return await self.run_many(
+                commands, user_settings, max_concurrency, provider_limits
+            )
+        finally:
+            await self._release_loop()
+
+    @staticmethod
+    async def _release_loop() -> None:
+        """Release the work bound to a short-lived event loop before it closes."""
+        await get_result_cache().cancel_refreshes()
+        await close_sessions()
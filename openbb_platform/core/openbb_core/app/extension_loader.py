@@ -8,6 +8,7 @@ from importlib_metadata import EntryPoint, EntryPoints, entry_points
 
 from openbb_core.app.model.abstract.singleton import SingletonMeta
 from openbb_core.app.model.extension import Extension
+from openbb_core.env import Env
 
 if TYPE_CHECKING:
     from openbb_core.app.router import Router
@@ -115,10 +116,28 @@ class ExtensionLoader(metaclass=SingletonMeta):
     @property
     @lru_cache
     def provider_objects(self) -> Dict[str, "Provider"]:
-        """Return a dict of provider extension objects."""
-        self._provider_objects = self._load_entry_points(
-            self._provider_entry_points, OpenBBGroups.provider
-        )
+        """Return a dict of provider extension objects.
+
+        With lazy providers enabled, the providers are registered from the provider
+        manifest and each provider package is imported when its fetchers are used.
+        """
+        if not Env().LAZY_PROVIDERS:
+            self._provider_objects = self._load_entry_points(
+                self._provider_entry_points, OpenBBGroups.provider
+            )
+            return self._provider_objects
+
+        # pylint: disable=import-outside-toplevel
+        from openbb_core.provider.manifest import ProviderManifest
+
+        manifest = ProviderManifest(self._provider_entry_points)
+        providers = manifest.load()
+        if providers is None:
+            providers = self._load_entry_points(
+                self._provider_entry_points, OpenBBGroups.provider
+            )
+            manifest.save(providers)
+        self._provider_objects = providers
         return self._provider_objects
 
     @staticmethod
@@ -1,9 +1,21 @@
 """Module for warnings."""
 
+import threading
+import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, List, Optional
 from warnings import WarningMessage
 
 from pydantic import BaseModel
 
+# Warnings recorded in the current context, None when they are shown as usual.
+_RECORDED: ContextVar[Optional[List[WarningMessage]]] = ContextVar(
+    "_RECORDED", default=None
+)
+_SHOW_LOCK = threading.Lock()
+_show_previous: Optional[Callable[..., Any]] = None
+
 
 class Warning_(BaseModel):
     """Model for Warning."""
@@ -20,5 +32,40 @@ def cast_warning(w: WarningMessage) -> Warning_:
     )
 
 
+def _show_or_record(message, category, filename, lineno, file=None, line=None):
+    """Record a warning in the current context, or show it as before."""
+    recorded = _RECORDED.get()
+    if recorded is not None:
+        recorded.append(WarningMessage(message, category, filename, lineno, file, line))
+    elif _show_previous is not None:
+        _show_previous(message, category, filename, lineno, file, line)
+
+
+@contextmanager
+def record_warnings() -> Iterator[List[WarningMessage]]:
+    """Record the warnings raised in the current context.
+
+    Works like `catch_warnings(record=True)`, but the warnings are recorded in
+    a context variable instead of swapping the global state, so concurrent
+    tasks and threads each record their own warnings.
+    """
+    global _show_previous  # pylint: disable=global-statement  # noqa: PLW0603
+    with _SHOW_LOCK:
+        if warnings.showwarning is not _show_or_record:
+            _show_previous = warnings.showwarning
+            warnings.showwarning = _show_or_record
+        # Like catch_warnings, show again the warnings that were already shown once.
+        mutated = getattr(warnings, "_filters_mutated", None)
+        if mutated is not None:
+            mutated()
+
+    recorded: List[WarningMessage] = []
+    token = _RECORDED.set(recorded)
+    try:
+        yield recorded
+    finally:
+        _RECORDED.reset(token)
+
+
 class OpenBBWarning(Warning):
     """Base class for OpenBB warnings."""
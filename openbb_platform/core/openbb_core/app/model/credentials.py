@@ -16,8 +16,8 @@ from typing_extensions import Annotated
 
 from openbb_core.app.extension_loader import ExtensionLoader
 from openbb_core.app.model.abstract.warning import OpenBBWarning
-from openbb_core.app.provider_interface import ProviderInterface
 from openbb_core.env import Env
+from openbb_core.provider.registry import RegistryLoader
 
 
 class LoadingError(Exception):
@@ -79,7 +79,11 @@ class CredentialsLoader:
 
     def from_providers(self) -> None:
         """Load credentials from providers."""
-        self.credentials = ProviderInterface().credentials
+        # The registry is enough here, building the provider interface imports every provider.
+        self.credentials = {
+            name: provider.credentials
+            for name, provider in RegistryLoader.from_extensions().providers.items()
+        }
 
     def load(self) -> BaseModel:
         """Load credentials from providers."""
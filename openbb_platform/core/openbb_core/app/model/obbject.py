@@ -12,13 +12,14 @@ from typing import (
     Literal,
     Optional,
     Set,
+    Tuple,
     TypeVar,
     Union,
 )
 
 import pandas as pd
 from numpy import ndarray
-from pydantic import BaseModel, Field, PrivateAttr
+from pydantic import BaseModel, Field, PrivateAttr, field_serializer
 
 from openbb_core.app.model.abstract.error import OpenBBError
 from openbb_core.app.model.abstract.tagged import Tagged
@@ -26,6 +27,7 @@ from openbb_core.app.model.abstract.warning import Warning_
 from openbb_core.app.model.charts.chart import Chart
 from openbb_core.app.utils import basemodel_to_df
 from openbb_core.provider.abstract.annotated_result import AnnotatedResult
+from openbb_core.provider.abstract.columnar_result import ColumnarResult
 from openbb_core.provider.abstract.data import Data
 
 if TYPE_CHECKING:
@@ -33,8 +35,10 @@ if TYPE_CHECKING:
 
     try:
         from polars import DataFrame as PolarsDataFrame  # type: ignore
+        from pyarrow import Table as ArrowTable  # type: ignore
     except ImportError:
         PolarsDataFrame = None
+        ArrowTable = None
 
 T = TypeVar("T")
 
@@ -72,6 +76,19 @@ class OBBject(Tagged, Generic[T]):
     _standard_params: Optional[Dict[str, Any]] = PrivateAttr(
         default_factory=dict,
     )
+    _dataframes: Dict[Tuple[Optional[str], Optional[str]], pd.DataFrame] = PrivateAttr(
+        default_factory=dict
+    )
+    _dataframes_results: Any = PrivateAttr(
+        default=None,
+    )
+
+    @field_serializer("results", mode="wrap")
+    def _serialize_results(self, results: Any, handler: Callable):
+        """Serialize columnar results as a list of records."""
+        if isinstance(results, ColumnarResult):
+            return results.to_records()
+        return handler(results)
 
     def __repr__(self) -> str:
         """Human readable representation of the object."""
@@ -96,6 +113,7 @@ class OBBject(Tagged, Generic[T]):
         serializable data formats:
 
         - List[BaseModel]
+        - ColumnarResult
         - List[Dict]
         - List[List]
         - List[str]
@@ -118,7 +136,8 @@ class OBBject(Tagged, Generic[T]):
         Returns
         -------
         pd.DataFrame
-            Pandas dataframe.
+            Pandas dataframe. It is built once for each index and sort_by,
+            until the results are reassigned, and a copy is returned on each call.
         """
 
         def is_list_of_basemodel(items: Union[List[T], T]) -> bool:
@@ -132,6 +151,12 @@ class OBBject(Tagged, Generic[T]):
         if isinstance(self.results, pd.DataFrame):
             return self.results
 
+        if self._dataframes_results is not self.results:
+            self._dataframes = {}
+            self._dataframes_results = self.results
+        if (index, sort_by) in self._dataframes:
+            return self._dataframes[(index, sort_by)].copy()
+
         try:
             res = self.results
             df = None
@@ -153,6 +178,10 @@ class OBBject(Tagged, Generic[T]):
 
                 df = pd.concat(dict_of_df, axis=1)
 
+            # ColumnarResult
+            elif isinstance(res, ColumnarResult):
+                df = basemodel_to_df(res, index)
+                sort_columns = False
             # List[BaseModel]
             elif is_list_of_basemodel(res):
                 dt: Union[List[Data], Data] = res  # type: ignore
@@ -198,7 +227,8 @@ class OBBject(Tagged, Generic[T]):
         except Exception as ex:
             raise OpenBBError(f"An unexpected error occurred: {ex}") from ex
 
-        return df
+        self._dataframes[(index, sort_by)] = df
+        return df.copy()
 
     def to_polars(self) -> "PolarsDataFrame":
         """Convert results field to polars dataframe."""
@@ -209,12 +239,29 @@ class OBBject(Tagged, Generic[T]):
                 "Please install polars: `pip install polars pyarrow`  to use this method."
             ) from exc
 
+        if isinstance(self.results, ColumnarResult):
+            return self.results.to_polars()
         return from_pandas(self.to_dataframe(index=None))
 
     def to_numpy(self) -> ndarray:
         """Convert results field to numpy array."""
+        if isinstance(self.results, ColumnarResult):
+            return self.results.to_numpy()
         return self.to_dataframe(index=None).to_numpy()
 
+    def to_arrow(self) -> "ArrowTable":
+        """Convert results field to an Arrow table."""
+        try:
+            from pyarrow import Table  # type: ignore # pylint: disable=import-outside-toplevel
+        except ImportError as exc:
+            raise ImportError(
+                "Please install pyarrow: `pip install pyarrow` to use this method."
+            ) from exc
+
+        if isinstance(self.results, ColumnarResult):
+            return self.results.to_arrow()
+        return Table.from_pandas(self.to_dataframe(index=None), preserve_index=False)
+
     def to_dict(
         self,
         orient: Literal[
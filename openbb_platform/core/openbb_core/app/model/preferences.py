@@ -1,21 +1,25 @@
 """Preferences for the OpenBB platform."""
 
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, PositiveInt
+from pydantic import BaseModel, ConfigDict, Field, NonNegativeInt, PositiveInt
 
 
 class Preferences(BaseModel):
     """Preferences for the OpenBB platform."""
 
     cache_directory: str = str(Path.home() / "OpenBBUserData" / "cache")
+    cache_ttl: Optional[NonNegativeInt] = Field(
+        default=None,
+        description="Seconds to cache HTTP responses, overrides the provider defaults. 0 disables the cache.",
+    )
     chart_style: Literal["dark", "light"] = "dark"
     data_directory: str = str(Path.home() / "OpenBBUserData")
     export_directory: str = str(Path.home() / "OpenBBUserData" / "exports")
     metadata: bool = True
     output_type: Literal[
-        "OBBject", "dataframe", "polars", "numpy", "dict", "chart", "llm"
+        "OBBject", "dataframe", "polars", "numpy", "dict", "chart", "llm", "arrow"
     ] = Field(
         default="OBBject",
         description="Python default output type.",
@@ -30,6 +34,9 @@ class Preferences(BaseModel):
     request_timeout: PositiveInt = 60
     show_warnings: bool = True
     table_style: Literal["dark", "light"] = "dark"
+    use_cache: bool = Field(
+        default=True, description="Whether to cache HTTP responses."
+    )
     user_styles_directory: str = str(Path.home() / "OpenBBUserData" / "styles" / "user")
 
     model_config = ConfigDict(validate_assignment=True)
@@ -250,8 +250,11 @@ class Router:
         api_router = self._api_router
 
         model = kwargs.pop("model", "")
+        cpu_bound = kwargs.pop("cpu_bound", False)
 
         if func := SignatureInspector.complete(func, model):
+            # Pure computations can be run in a process pool by the command runner.
+            func.cpu_bound = cpu_bound  # type: ignore[attr-defined]
 
             kwargs["response_model_exclude_unset"] = True
             kwargs["openapi_extra"] = kwargs.get("openapi_extra", {})
@@ -1,6 +1,6 @@
 """App factory."""
 
-from typing import Dict, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
 
 from openbb_core.app.command_runner import CommandRunner
 from openbb_core.app.model.system_settings import SystemSettings
@@ -58,6 +58,63 @@ class BaseApp:
         """Return reference data."""
         return self._reference
 
+    def batch(
+        self,
+        calls: List[Callable[[], Any]],
+        max_concurrency: int = 10,
+        provider_limits: Optional[Dict[str, int]] = None,
+    ) -> List[Any]:
+        """Run many commands concurrently.
+
+        Parameters
+        ----------
+        calls : List[Callable[[], Any]]
+            Command calls without arguments, for example
+            functools.partial(obb.equity.price.historical, "AAPL", provider="fmp").
+        max_concurrency : int
+            Maximum number of commands running at the same time, by default 10.
+        provider_limits : Optional[Dict[str, int]]
+            Maximum number of commands running at the same time per provider,
+            for example {"fmp": 5}.
+
+        Returns
+        -------
+        List[Any]
+            The outputs in the same order as the calls, in the preferred output type.
+            A call that fails returns its exception instead of raising it.
+
+        Examples
+        --------
+        >>> from functools import partial
+        >>> from openbb import obb
+        >>> calls = [partial(obb.equity.price.historical, s) for s in ["AAPL", "MSFT"]]
+        >>> aapl, msft = obb.batch(calls, max_concurrency=5)
+        """
+        outputs: List[Any] = [None] * len(calls)
+        captured = []
+        for i, call in enumerate(calls):
+            try:
+                captured.append((i, Container._capture(call)))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                outputs[i] = e
+
+        results = self._command_runner.sync_run_many(
+            [(c.route, c.kwargs) for _, c in captured],
+            max_concurrency=max_concurrency,
+            provider_limits=provider_limits,
+        )
+        container = Container(self._command_runner)
+        for (i, _), result in zip(captured, results):
+            try:
+                outputs[i] = (
+                    result
+                    if isinstance(result, Exception)
+                    else container._to_output_type(result)  # pylint: disable=W0212
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                outputs[i] = e
+        return outputs
+
 
 def create_app(extensions: Optional[E] = None) -> Type[BaseApp]:
     """Create the app."""
@@ -1,11 +1,22 @@
 """Container class."""
 
-from typing import Any, Optional, Tuple
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
 
 from openbb_core.app.command_runner import CommandRunner
 from openbb_core.app.model.abstract.error import OpenBBError
 from openbb_core.app.model.obbject import OBBject
 
+# Whether Container._run records commands instead of running them.
+_CAPTURE_COMMANDS: ContextVar[bool] = ContextVar("_CAPTURE_COMMANDS", default=False)
+
+
+class CapturedCommand(NamedTuple):
+    """A command recorded to be run later."""
+
+    route: str
+    kwargs: Dict[str, Any]
+
 
 class Container:
     """Container class for the command runner session."""
@@ -18,12 +29,35 @@ class Container:
 
     def _run(self, *args, **kwargs) -> Any:
         """Run a command in the container."""
+        if _CAPTURE_COMMANDS.get():
+            # The command is only recorded, to be run later in a batch.
+            route, *_ = args
+            return CapturedCommand(route=route, kwargs=kwargs)
         obbject = self._command_runner.sync_run(*args, **kwargs)
+        return self._to_output_type(obbject)
+
+    def _to_output_type(self, obbject: OBBject) -> Any:
+        """Convert the command output to the user preferred output type."""
         output_type = self._command_runner.user_settings.preferences.output_type
         if output_type == "OBBject":
             return obbject
         return getattr(obbject, "to_" + output_type)()
 
+    @staticmethod
+    def _capture(call: Callable[[], Any]) -> "CapturedCommand":
+        """Call a command without running it and return what it would run."""
+        token = _CAPTURE_COMMANDS.set(True)
+        try:
+            captured = call()
+        finally:
+            _CAPTURE_COMMANDS.reset(token)
+        if not isinstance(captured, CapturedCommand):
+            raise OpenBBError(
+                "Batch items must be calls to OpenBB commands, for example "
+                "functools.partial(obb.equity.price.historical, 'AAPL')."
+            )
+        return captured
+
     def _check_credentials(self, provider: str) -> Optional[bool]:
         """Check required credentials are populated."""
         credentials = self._command_runner.user_settings.credentials
@@ -1,5 +1,6 @@
 """Coverage module."""
 
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from openbb_core.api.router.helpers.coverage_helpers import get_route_schema_map
@@ -23,10 +24,18 @@ class Coverage:  # noqa: D205, D400
     def __init__(self, app: "BaseApp"):
         """Initialize coverage."""
         self._app = app
-        self._command_map = CommandMap(coverage_sep=".")
-        self._provider_interface = ProviderInterface()
         self._reference_loader = ReferenceLoader()
 
+    @cached_property
+    def _command_map(self) -> CommandMap:
+        """Command map, loaded on first use since it imports every extension."""
+        return CommandMap(coverage_sep=".")
+
+    @cached_property
+    def _provider_interface(self) -> ProviderInterface:
+        """Provider interface, loaded on first use since it imports every provider."""
+        return ProviderInterface()
+
     def __repr__(self) -> str:
         """Return docstring."""
         return self.__doc__ or ""
@@ -1,26 +1,77 @@
 """Utility functions for the OpenBB Core app."""
 
 import ast
+import gc
 import json
+import warnings
+from contextlib import contextmanager
 from datetime import time
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 
 import numpy as np
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
 from pydantic import ValidationError
 
 from openbb_core.app.model.abstract.error import OpenBBError
 from openbb_core.app.model.preferences import Preferences
 from openbb_core.app.model.system_settings import SystemSettings
+from openbb_core.provider.abstract.columnar_result import ColumnarResult
 from openbb_core.provider.abstract.data import Data
 
 
+def _to_datetime(values: pd.Series) -> pd.Series:
+    """Convert a column to datetimes, element by element if it mixes formats or time zones."""
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            dates = pd.to_datetime(values)
+        if is_datetime64_any_dtype(dates):
+            return dates
+    except (ValueError, TypeError):
+        pass
+    return values.apply(pd.to_datetime)
+
+
+def _is_date_only(dates: pd.Series) -> bool:
+    """Check if all the datetimes of a column are at midnight."""
+    if is_datetime64_any_dtype(dates):
+        return bool((dates == dates.dt.normalize()).all())
+    return all(t.time() == time(0, 0) for t in dates)
+
+
+def _format_dates(values: pd.Series) -> pd.Series:
+    """Format dates with no time element as strings, to avoid adding T00:00:00 to them."""
+    dates = _to_datetime(values)
+    if not _is_date_only(dates):
+        return dates
+    if is_datetime64_any_dtype(dates):
+        return dates.dt.strftime("%Y-%m-%d")
+    return dates.apply(lambda x: x.strftime("%Y-%m-%d"))
+
+
+def _column_to_list(values: pd.Series) -> list:
+    """Convert a column to a list of Python objects, with None for missing values."""
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind == "M":
+        # Naive datetimes are converted by numpy, much faster than boxing Timestamps.
+        return values.to_numpy().astype("datetime64[us]").tolist()
+    array = values.to_numpy(dtype=object)
+    missing = values.isna().to_numpy()
+    if values.dtype.kind == "f":
+        missing |= np.isinf(values.to_numpy())
+    if missing.any():
+        array[missing] = None
+    return array.tolist()
+
+
 def basemodel_to_df(
-    data: Union[List[Data], Data],
+    data: Union[List[Data], Data, ColumnarResult],
     index: Optional[str] = None,
 ) -> pd.DataFrame:
     """Convert list of BaseModel to a Pandas DataFrame."""
-    if isinstance(data, list):
+    if isinstance(data, ColumnarResult):
+        df = data.to_pandas()
+    elif isinstance(data, list):
         df = pd.DataFrame([d.model_dump() for d in data])
     else:
         try:
@@ -35,9 +86,12 @@ def basemodel_to_df(
 
     # If the date column contains dates only, convert them to a date to avoid encoding time data.
     if "date" in df.columns:
-        df["date"] = df["date"].apply(pd.to_datetime)
-        if all(t.time() == time(0, 0) for t in df["date"]):
-            df["date"] = df["date"].apply(lambda x: x.date())
+        df["date"] = _to_datetime(df["date"])
+        if _is_date_only(df["date"]):
+            if is_datetime64_any_dtype(df["date"]):
+                df["date"] = df["date"].dt.date
+            else:
+                df["date"] = df["date"].apply(lambda x: x.date())
 
     if index and index in df.columns:
         if index == "date":
@@ -49,10 +103,44 @@ def basemodel_to_df(
     return df
 
 
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause the cyclic garbage collector, unless it is already paused."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _construct_data(record: Dict) -> Data:
+    """Build a record without validation, as `Data.model_construct` does.
+
+    Data has no fields of its own, so all the values are extra fields. Setting
+    the state directly skips the per-field loop of `model_construct`.
+    """
+    data = Data.__new__(Data)
+    data.__setstate__(
+        {
+            "__dict__": {},
+            "__pydantic_extra__": record,
+            "__pydantic_fields_set__": set(record),
+            "__pydantic_private__": None,
+        }
+    )
+    return data
+
+
 def df_to_basemodel(
-    df: Union[pd.DataFrame, pd.Series], index: bool = False
+    df: Union[pd.DataFrame, pd.Series], index: bool = False, validate: bool = True
 ) -> List[Data]:
-    """Convert from a Pandas DataFrame to list of BaseModel."""
+    """Convert from a Pandas DataFrame to list of BaseModel.
+
+    With `validate` set to False, the records are built without validating
+    them, for data computed internally, such as the output of an indicator.
+    """
     is_multiindex = isinstance(df.index, pd.MultiIndex)
 
     if not is_multiindex and (index or df.index.name):
@@ -66,15 +154,17 @@ def df_to_basemodel(
         df["multiindex_names"] = str(df.index.names)
         df = df.reset_index()
 
-    # Converting to JSON will add T00:00:00.000 to all dates with no time element unless we format it as a string first.
-    if "date" in df.columns:
-        df["date"] = df["date"].apply(pd.to_datetime)
-        if all(t.time() == time(0, 0) for t in df["date"]):
-            df["date"] = df["date"].apply(lambda x: x.date().strftime("%Y-%m-%d"))
+    columns = {
+        str(name): _column_to_list(_format_dates(column) if name == "date" else column)
+        for name, column in df.items()
+    }
 
-    return [
-        Data(**d) for d in json.loads(df.to_json(orient="records", date_format="iso"))
-    ]
+    # Build the records from the columns instead of serializing the frame row by row.
+    names = list(columns)
+    build = Data.model_validate if validate else _construct_data
+    # Millions of new objects would trigger many collections, none of them cyclic garbage.
+    with _gc_paused():
+        return [build(dict(zip(names, row))) for row in zip(*columns.values())]
 
 
 def list_to_basemodel(data_list: List) -> List[Data]:
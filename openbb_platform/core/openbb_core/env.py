@@ -1,8 +1,9 @@
 """Environment variables."""
 
+import json
 import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 import dotenv
 
@@ -60,6 +61,79 @@ class Env(metaclass=SingletonMeta):
         """Hub backend: sets the backend for the OpenBB Hub."""
         return self._environ.get("OPENBB_HUB_BACKEND", "https://payments.openbb.co")
 
+    @property
+    def HTTP_POOL_LIMIT(self) -> int:
+        """HTTP pool limit: total simultaneous connections per shared session."""
+        return int(self._environ.get("OPENBB_HTTP_POOL_LIMIT", 100))
+
+    @property
+    def HTTP_POOL_LIMIT_PER_HOST(self) -> int:
+        """HTTP pool limit per host: simultaneous connections per endpoint, 0 is unlimited."""
+        return int(self._environ.get("OPENBB_HTTP_POOL_LIMIT_PER_HOST", 0))
+
+    @property
+    def HTTP_KEEPALIVE_TIMEOUT(self) -> float:
+        """HTTP keep-alive timeout: seconds an idle pooled connection is kept open."""
+        return float(self._environ.get("OPENBB_HTTP_KEEPALIVE_TIMEOUT", 30))
+
+    @property
+    def LAZY_PROVIDERS(self) -> bool:
+        """Lazy providers: registers providers from a manifest and imports them on first use."""
+        return self.str2bool(self._environ.get("OPENBB_LAZY_PROVIDERS", True))
+
+    @property
+    def EXECUTOR(self) -> str:
+        """Executor: where synchronous provider functions run, "thread", "process" or "inline"."""
+        value = self._environ.get("OPENBB_EXECUTOR", "thread").lower()
+        if value not in {"thread", "process", "inline"}:
+            raise ValueError(
+                f"OPENBB_EXECUTOR must be 'thread', 'process' or 'inline', got '{value}'."
+            )
+        return value
+
+    @property
+    def EXECUTOR_MAX_WORKERS(self) -> int:
+        """Executor max workers: threads or processes running provider functions, 0 is the default."""
+        return int(self._environ.get("OPENBB_EXECUTOR_MAX_WORKERS", 0))
+
+    @property
+    def CPU_BOUND_EXECUTOR(self) -> str:
+        """CPU-bound executor: where CPU-bound commands run, "process", "thread" or "inline"."""
+        value = self._environ.get("OPENBB_CPU_BOUND_EXECUTOR", "inline").lower()
+        if value not in {"thread", "process", "inline"}:
+            raise ValueError(
+                "OPENBB_CPU_BOUND_EXECUTOR must be 'process', 'thread' or 'inline',"
+                f" got '{value}'."
+            )
+        return value
+
+    @property
+    def PRICE_CACHE(self) -> bool:
+        """Price cache: stores historical prices locally and fetches only the missing dates."""
+        return self.str2bool(self._environ.get("OPENBB_PRICE_CACHE", False))
+
+    @property
+    def RATE_LIMITS(self) -> Dict[str, Dict[str, Any]]:
+        """Rate limits: JSON object of the quotas of providers, replacing the declared ones.
+
+        For example {"fmp": {"requests_per_second": 12.5, "burst": 25}}, the
+        fields are those of `RateLimit`, the missing ones keep the declared values.
+        """
+        value = self._environ.get("OPENBB_RATE_LIMITS", "")
+        if not value:
+            return {}
+        try:
+            limits = json.loads(value)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"OPENBB_RATE_LIMITS must be a JSON object: {e}") from e
+        if not isinstance(limits, dict) or not all(
+            isinstance(v, dict) for v in limits.values()
+        ):
+            raise ValueError(
+                "OPENBB_RATE_LIMITS must map the provider names to JSON objects."
+            )
+        return limits
+
     @staticmethod
     def str2bool(value) -> bool:
         """Match a value to its boolean correspondent."""
@@ -0,0 +1,158 @@
+"""Columnar result."""
+
+from typing import (
+    TYPE_CHECKING,
+    Iterator,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+import numpy as np
+
+from openbb_core.provider.abstract.data import Data
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+    try:
+        from polars import DataFrame as PolarsDataFrame  # type: ignore
+        from pyarrow import Table  # type: ignore
+    except ImportError:
+        PolarsDataFrame = None
+        Table = None
+
+D = TypeVar("D", bound=Data)
+
+
+def _import_pyarrow():
+    """Import pyarrow, which is an optional dependency."""
+    try:
+        import pyarrow  # type: ignore # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError(
+            "Please install pyarrow: `pip install pyarrow` to use columnar results."
+        ) from exc
+    return pyarrow
+
+
+class ColumnarResult(Sequence[D]):
+    """Results stored as an Arrow table instead of a list of Data.
+
+    Fetchers can return it from `transform_data` for large payloads. It behaves
+    like a read-only list of Data, the rows are only built when they are
+    accessed, and exports to pandas, polars, numpy and Arrow read the columns
+    directly.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+        The results, one column per field of the data model.
+    data_type : Type[Data]
+        The data model of the rows, by default Data.
+    """
+
+    def __init__(self, table: "Table", data_type: Type[D] = Data) -> None:  # type: ignore[assignment]
+        """Initialize the columnar result."""
+        self._table = table
+        self._data_type = data_type
+
+    @classmethod
+    def from_pandas(
+        cls, df: "DataFrame", data_type: Type[D] = Data  # type: ignore[assignment]
+    ) -> "ColumnarResult[D]":
+        """Create a columnar result from a pandas DataFrame, the index is dropped."""
+        pa = _import_pyarrow()
+        return cls(pa.Table.from_pandas(df, preserve_index=False), data_type)
+
+    @classmethod
+    def from_pydict(
+        cls, columns: dict, data_type: Type[D] = Data  # type: ignore[assignment]
+    ) -> "ColumnarResult[D]":
+        """Create a columnar result from a dictionary of columns."""
+        pa = _import_pyarrow()
+        return cls(pa.Table.from_pydict(columns), data_type)
+
+    @property
+    def table(self) -> "Table":
+        """The Arrow table holding the results."""
+        return self._table
+
+    @property
+    def data_type(self) -> Type[D]:
+        """The data model of the rows."""
+        return self._data_type
+
+    def __len__(self) -> int:
+        """Get the number of rows."""
+        return self._table.num_rows
+
+    @overload
+    def __getitem__(self, index: int) -> D: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ColumnarResult[D]": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[D, "ColumnarResult[D]"]:
+        """Get a row as Data, or a slice of the rows as a columnar result."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                table = self._table.slice(start, max(stop - start, 0))
+            else:
+                table = self._table.take(list(range(start, stop, step)))
+            return self.__class__(table, self._data_type)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ColumnarResult index out of range")
+        return self._data_type.model_validate(
+            self._table.slice(index, 1).to_pylist()[0]
+        )
+
+    def __iter__(self) -> Iterator[D]:
+        """Iterate over the rows, built one record batch at a time."""
+        for batch in self._table.to_batches():
+            for row in batch.to_pylist():
+                yield self._data_type.model_validate(row)
+
+    def __repr__(self) -> str:
+        """Human readable representation of the object."""
+        return (
+            f"{self.__class__.__name__}[{self._data_type.__name__}]"
+            f"({len(self)} rows, columns={self._table.column_names})"
+        )
+
+    def to_records(self) -> list:
+        """Convert the results to a list of dictionaries, without building Data."""
+        return self._table.to_pylist()
+
+    def to_arrow(self) -> "Table":
+        """Get the results as an Arrow table."""
+        return self._table
+
+    def to_pandas(self) -> "DataFrame":
+        """Convert the results to a pandas DataFrame."""
+        return self._table.to_pandas()
+
+    def to_polars(self) -> "PolarsDataFrame":
+        """Convert the results to a polars DataFrame, sharing the Arrow buffers."""
+        try:
+            from polars import from_arrow  # type: ignore # pylint: disable=import-outside-toplevel
+        except ImportError as exc:
+            raise ImportError(
+                "Please install polars: `pip install polars pyarrow`  to use this method."
+            ) from exc
+
+        return from_arrow(self._table)
+
+    def to_numpy(self) -> np.ndarray:
+        """Convert the results to a 2D numpy array, with one column per field."""
+        columns = [c.to_numpy() for c in self._table.columns]
+        try:
+            return np.column_stack(columns)
+        except TypeError:
+            # The columns have no common dtype, for example dates and floats.
+            return np.column_stack([c.astype(object) for c in columns])
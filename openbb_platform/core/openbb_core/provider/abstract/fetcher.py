@@ -3,6 +3,7 @@
 # ruff: noqa: S101, E501
 # pylint: disable=E1101, C0301
 
+from inspect import iscoroutinefunction
 from typing import (
     Any,
     Dict,
@@ -17,9 +18,12 @@ from typing import (
 from pandas import DataFrame
 
 from openbb_core.provider.abstract.annotated_result import AnnotatedResult
+from openbb_core.provider.abstract.columnar_result import ColumnarResult
 from openbb_core.provider.abstract.data import Data
 from openbb_core.provider.abstract.query_params import QueryParams
-from openbb_core.provider.utils.helpers import maybe_coroutine, run_async
+from openbb_core.provider.utils.executor import ExecutorKind, run_blocking
+from openbb_core.provider.utils.helpers import run_async
+from openbb_core.provider.utils.price_cache import PriceCache, fetch_with_price_cache
 
 Q = TypeVar("Q", bound=QueryParams)
 D = TypeVar("D", bound=Data)
@@ -43,6 +47,15 @@ class Fetcher(Generic[Q, R]):
 
     # Tell query executor if credentials are required. Can be overridden by subclasses.
     require_credentials = True
+    # Seconds to cache the HTTP responses of this fetcher, None falls back to the provider.
+    cache_ttl: Optional[int] = None
+    # Seconds to memoize the transformed results of identical queries, None disables it.
+    result_ttl: Optional[int] = None
+    # Extra seconds an expired result is served while it is refreshed in the background.
+    result_stale_ttl: int = 0
+    # Where a synchronous extract_data runs: "thread", "process" for CPU-bound
+    # extraction, or "inline" in the event loop. None falls back to OPENBB_EXECUTOR.
+    extract_executor: Optional[ExecutorKind] = None
 
     @staticmethod
     def transform_query(params: Dict[str, Any]) -> Q:
@@ -83,10 +96,54 @@ class Fetcher(Generic[Q, R]):
         **kwargs,
     ) -> Union[R, AnnotatedResult[R]]:
         """Fetch data from a provider."""
-        query = cls.transform_query(params=params)
-        data = await maybe_coroutine(
-            cls.extract_data, query=query, credentials=credentials, **kwargs
+        return await cls.fetch_query(
+            cls.transform_query(params=params), credentials, **kwargs
         )
+
+    @classmethod
+    async def fetch_query(
+        cls,
+        query: Q,
+        credentials: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ) -> Union[R, AnnotatedResult[R]]:
+        """Fetch the data of a query already made by `transform_query`."""
+        preferences = kwargs.get("preferences") or {}
+        if preferences.get("use_cache", True) and PriceCache.supports(query):
+            # pylint: disable=import-outside-toplevel
+            from openbb_core.env import Env
+
+            if Env().PRICE_CACHE:
+
+                async def fetch(q: Q) -> Union[R, AnnotatedResult[R]]:
+                    return await cls._fetch_query(q, credentials, **kwargs)
+
+                return await fetch_with_price_cache(cls, query, fetch)
+        return await cls._fetch_query(query, credentials, **kwargs)
+
+    @classmethod
+    async def _fetch_query(
+        cls,
+        query: Q,
+        credentials: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ) -> Union[R, AnnotatedResult[R]]:
+        """Extract and transform the data of a transformed query."""
+        if iscoroutinefunction(cls.extract_data):
+            data = await cls.extract_data(
+                query=query, credentials=credentials, **kwargs
+            )
+        else:
+            # A blocking extraction runs out of the event loop, so it doesn't stall
+            # the other requests, with a share of the workers for its provider.
+            data = await run_blocking(
+                cls.__module__.split(".")[0],
+                cls.extract_data,
+                kind=cls.extract_executor,
+                query=query,
+                credentials=credentials,
+                **kwargs,
+            )
         return cls.transform_data(query=query, data=data, **kwargs)
 
     @classproperty
@@ -192,7 +249,7 @@ class Fetcher(Generic[Q, R]):
 
         assert transformed_data, "Transformed data must not be None."
 
-        if isinstance(transformed_data, list):
+        if isinstance(transformed_data, (list, ColumnarResult)):
             return_type_args = cls.return_type.__args__[0]
             return_type_is_dict = (
                 hasattr(return_type_args, "__origin__")
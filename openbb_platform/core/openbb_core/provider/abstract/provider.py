@@ -3,6 +3,7 @@
 from typing import Dict, List, Optional, Type
 
 from openbb_core.provider.abstract.fetcher import Fetcher
+from openbb_core.provider.utils.rate_limiter import RateLimit
 
 
 class Provider:
@@ -19,6 +20,8 @@ class Provider:
         repr_name: Optional[str] = None,
         v3_credentials: Optional[List[str]] = None,
         instructions: Optional[str] = None,
+        cache_ttl: Optional[int] = None,
+        rate_limit: Optional[RateLimit] = None,
     ) -> None:
         """Initialize the provider.
 
@@ -40,6 +43,10 @@ class Provider:
             List of corresponding v3 credentials, by default None.
         instructions: Optional[str]
             Instructions on how to setup the provider. For example, how to get an API key.
+        cache_ttl: Optional[int]
+            Seconds to cache the HTTP responses of the provider fetchers, by default None (no cache).
+        rate_limit: Optional[RateLimit]
+            Request quota honored by the request helpers, by default None (no limit).
         """
         self.name = name
         self.description = description
@@ -54,3 +61,5 @@ class Provider:
         self.repr_name = repr_name
         self.v3_credentials = v3_credentials
         self.instructions = instructions
+        self.cache_ttl = cache_ttl
+        self.rate_limit = rate_limit
@@ -0,0 +1,183 @@
+"""Provider manifest.
+
+The manifest records the metadata and fetcher import paths of the installed
+providers, so they can be registered without importing their packages. A
+provider package is imported when one of its fetchers is first used.
+"""
+
+import json
+import os
+import sys
+from importlib import import_module
+from importlib.util import find_spec
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Type
+
+from openbb_core.provider.abstract.fetcher import Fetcher
+from openbb_core.provider.abstract.provider import Provider
+from openbb_core.provider.utils.rate_limiter import RateLimit
+
+if TYPE_CHECKING:
+    from importlib_metadata import EntryPoints
+
+MANIFEST_VERSION = 1
+
+
+class LazyFetcherDict(Mapping[str, Type[Fetcher]]):
+    """Fetchers by model name, imported when they are first accessed."""
+
+    def __init__(self, paths: Dict[str, str]) -> None:
+        """Initialize the fetcher dict.
+
+        Parameters
+        ----------
+        paths : Dict[str, str]
+            Import path of the fetchers by model name, as 'module:qualname'.
+        """
+        self._paths = paths
+        self._fetchers: Dict[str, Type[Fetcher]] = {}
+
+    def __getitem__(self, model: str) -> Type[Fetcher]:
+        """Get the fetcher of a model, importing it if needed."""
+        if model not in self._fetchers:
+            module, _, qualname = self._paths[model].partition(":")
+            fetcher: Any = import_module(module)
+            for name in qualname.split("."):
+                fetcher = getattr(fetcher, name)
+            self._fetchers[model] = fetcher
+        return self._fetchers[model]
+
+    def __contains__(self, model: object) -> bool:
+        """Check if a model has a fetcher, without importing it."""
+        return model in self._paths
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the model names."""
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        """Get the number of fetchers."""
+        return len(self._paths)
+
+
+class ProviderManifest:
+    """Manifest of the providers installed as entry points.
+
+    The manifest is stored in the user cache directory. It is only used when it
+    was built from the same entry points, package versions and provider
+    modules, otherwise the providers are loaded and the manifest is rebuilt.
+    """
+
+    def __init__(self, entry_points: "EntryPoints", path: Optional[Path] = None):
+        """Initialize the manifest."""
+        self._entry_points = entry_points
+        self._path = path
+
+    @property
+    def path(self) -> Path:
+        """Path of the manifest file."""
+        if self._path is None:
+            # pylint: disable=import-outside-toplevel
+            from openbb_core.app.utils import get_user_cache_directory
+
+            self._path = Path(get_user_cache_directory(), "provider_manifest.json")
+        return self._path
+
+    def signature(self) -> List[str]:
+        """Identify the installed providers, to know when the manifest is stale."""
+        signature = []
+        for ep in self._entry_points:
+            spec = find_spec(ep.module.split(".")[0])
+            origin = spec.origin if spec and spec.origin else ""
+            mtime = os.stat(origin).st_mtime_ns if os.path.isfile(origin) else 0
+            version = getattr(ep.dist, "version", "")
+            signature.append(f"{ep.name}={ep.value}@{version}:{mtime}")
+        return signature
+
+    def load(self) -> Optional[Dict[str, Provider]]:
+        """Load the providers from the manifest, None if it is missing or stale."""
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                manifest = json.load(file)
+            if (
+                manifest.get("version") != MANIFEST_VERSION
+                or manifest.get("signature") != self.signature()
+            ):
+                return None
+            return {
+                name: self._from_entry(entry)
+                for name, entry in manifest["providers"].items()
+            }
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+    def save(self, providers: Dict[str, Provider]) -> None:
+        """Save the manifest of the loaded providers."""
+        try:
+            manifest = {
+                "version": MANIFEST_VERSION,
+                "signature": self.signature(),
+                "providers": {
+                    name: self._to_entry(provider)
+                    for name, provider in providers.items()
+                },
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp, "w", encoding="utf-8") as file:
+                json.dump(manifest, file)
+            os.replace(temp, self.path)
+        except Exception:  # pylint: disable=broad-except
+            # The manifest is only an optimization, the providers are loaded anyway.
+            return
+
+    @staticmethod
+    def _fetcher_path(fetcher: Type[Fetcher]) -> str:
+        """Get the import path of a fetcher, checking it can be imported back."""
+        resolved: Any = sys.modules[fetcher.__module__]
+        for name in fetcher.__qualname__.split("."):
+            resolved = getattr(resolved, name)
+        if resolved is not fetcher:
+            raise ValueError(f"Fetcher {fetcher} can't be imported by name.")
+        return f"{fetcher.__module__}:{fetcher.__qualname__}"
+
+    @classmethod
+    def _to_entry(cls, provider: Provider) -> Dict[str, Any]:
+        """Convert a provider to a manifest entry."""
+        return {
+            "name": provider.name,
+            "description": provider.description,
+            "website": provider.website,
+            "credentials": provider.credentials,
+            "fetchers": {
+                model: cls._fetcher_path(fetcher)
+                for model, fetcher in provider.fetcher_dict.items()
+            },
+            "repr_name": provider.repr_name,
+            "v3_credentials": provider.v3_credentials,
+            "instructions": provider.instructions,
+            "cache_ttl": provider.cache_ttl,
+            "rate_limit": (
+                provider.rate_limit._asdict() if provider.rate_limit else None
+            ),
+        }
+
+    @staticmethod
+    def _from_entry(entry: Dict[str, Any]) -> Provider:
+        """Convert a manifest entry to a provider with lazy fetchers."""
+        provider = Provider(
+            name=entry["name"],
+            description=entry["description"],
+            website=entry["website"],
+            fetcher_dict=LazyFetcherDict(entry["fetchers"]),  # type: ignore[arg-type]
+            repr_name=entry["repr_name"],
+            v3_credentials=entry["v3_credentials"],
+            instructions=entry["instructions"],
+            cache_ttl=entry["cache_ttl"],
+            rate_limit=(
+                RateLimit(**entry["rate_limit"]) if entry["rate_limit"] else None
+            ),
+        )
+        # The credentials are stored with the provider name prefix already.
+        provider.credentials = entry["credentials"]
+        return provider
@@ -1,5 +1,6 @@
 """Query executor module."""
 
+from functools import partial
 from typing import Any, Dict, Optional, Type
 
 from pydantic import SecretStr
@@ -7,7 +8,11 @@ from pydantic import SecretStr
 from openbb_core.app.model.abstract.error import OpenBBError
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.abstract.provider import Provider
+from openbb_core.provider.abstract.query_params import QueryParams
 from openbb_core.provider.registry import Registry, RegistryLoader
+from openbb_core.provider.utils.http_cache import HTTP_CACHE_TTL, resolve_cache_ttl
+from openbb_core.provider.utils.rate_limiter import RATE_LIMITER, get_rate_limiter
+from openbb_core.provider.utils.result_cache import ResultCache, get_result_cache
 
 
 class QueryExecutor:
@@ -96,4 +101,37 @@ class QueryExecutor:
         filtered_credentials = self.filter_credentials(
             credentials, provider, fetcher.require_credentials
         )
-        return await fetcher.fetch_data(params, filtered_credentials, **kwargs)
+        preferences = kwargs.get("preferences") or {}
+        cache_ttl = resolve_cache_ttl(
+            preferences, fetcher.cache_ttl, provider.cache_ttl
+        )
+
+        rate_limiter = get_rate_limiter(provider.name, provider.rate_limit)
+
+        async def fetch(query: Optional[QueryParams] = None) -> Any:
+            cache_token = HTTP_CACHE_TTL.set(cache_ttl)
+            limiter_token = RATE_LIMITER.set(rate_limiter)
+            try:
+                if query is None:
+                    return await fetcher.fetch_data(
+                        params, filtered_credentials, **kwargs
+                    )
+                return await fetcher.fetch_query(query, filtered_credentials, **kwargs)
+            finally:
+                RATE_LIMITER.reset(limiter_token)
+                HTTP_CACHE_TTL.reset(cache_token)
+
+        if not fetcher.result_ttl or not preferences.get("use_cache", True):
+            return await fetch()
+
+        # The query is transformed once, for both the key and the fetch.
+        query = fetcher.transform_query(params=params)
+        key = ResultCache.make_key(
+            provider.name,
+            model_name,
+            query.model_dump(),
+            filtered_credentials,
+        )
+        return await get_result_cache().get_or_fetch(
+            key, partial(fetch, query), fetcher.result_ttl, fetcher.result_stale_ttl
+        )
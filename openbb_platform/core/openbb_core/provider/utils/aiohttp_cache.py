@@ -0,0 +1,154 @@
+"""HTTP caches of `aiohttp_client_cache` in the shared cache databases."""
+
+import asyncio
+import sqlite3
+from functools import partial
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable, List, Sequence, Union
+
+from aiohttp_client_cache.backends import BaseCache, CacheBackend, ResponseOrKey
+
+from openbb_core.provider.utils.cache_db import CacheDatabase, get_cache_db
+
+
+class PooledSQLiteCache(BaseCache):
+    """Table of an HTTP cache in a shared cache database.
+
+    The table has the layout of `aiohttp_client_cache.SQLiteCache`, so existing
+    cache files are read as they are. The statements run in worker threads on
+    the pooled connections of the database, instead of an aiosqlite connection,
+    and its thread, per cache.
+
+    Parameters
+    ----------
+    db : CacheDatabase
+        The database.
+    table_name : str
+        Name of the table.
+    **kwargs : Any
+        Arguments of `BaseCache`, such as `secret_key`.
+    """
+
+    def __init__(self, db: CacheDatabase, table_name: str, **kwargs: Any) -> None:
+        """Initialize the cache."""
+        super().__init__(**kwargs)
+        self.db = db
+        self.table_name = table_name
+        self.filename = str(db.path)
+
+    def _create_table(self, conn: sqlite3.Connection) -> None:
+        """Create the table."""
+        sql = "CREATE TABLE IF NOT EXISTS `{table}` (key PRIMARY KEY, value)"
+        conn.execute(sql.format(table=self.table_name))
+
+    def _execute(self, sql: str, parameters: Sequence[Any] = ()) -> List[Any]:
+        """Run a statement on the table, named `{table}` in the statement."""
+        self.db.initialize(f"http:{self.table_name}", self._create_table)
+        return self.db.execute(sql.format(table=self.table_name), parameters)
+
+    def _executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Run a statement on the table for each row, in a single transaction."""
+        self.db.initialize(f"http:{self.table_name}", self._create_table)
+        self.db.executemany(sql.format(table=self.table_name), rows)
+
+    async def _aexecute(self, sql: str, parameters: Sequence[Any] = ()) -> List[Any]:
+        """Run a statement on the table in a worker thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self._execute, sql, parameters))
+
+    async def clear(self) -> None:
+        """Delete all the items."""
+        await self._aexecute("DELETE FROM `{table}`")
+
+    async def contains(self, key: str) -> bool:
+        """Check if a key is stored."""
+        rows = await self._aexecute(
+            "SELECT COUNT(*) FROM `{table}` WHERE key = ?", (key,)
+        )
+        return bool(rows[0][0])
+
+    async def bulk_delete(self, keys: set) -> None:
+        """Delete items, the missing ones are ignored."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None,
+            partial(
+                self._executemany,
+                "DELETE FROM `{table}` WHERE key = ?",
+                [(key,) for key in keys],
+            ),
+        )
+
+    async def delete(self, key: str) -> None:
+        """Delete an item, if it is stored."""
+        await self._aexecute("DELETE FROM `{table}` WHERE key = ?", (key,))
+
+    async def keys(self) -> AsyncIterator[str]:  # type: ignore[override]
+        """Get all the keys."""
+        for row in await self._aexecute("SELECT key FROM `{table}`"):
+            yield row[0]
+
+    async def read(self, key: str) -> ResponseOrKey:
+        """Read an item, None if it is missing."""
+        rows = await self._aexecute("SELECT value FROM `{table}` WHERE key = ?", (key,))
+        return rows[0][0] if rows else None
+
+    async def size(self) -> int:
+        """Get the number of items."""
+        rows = await self._aexecute("SELECT COUNT(key) FROM `{table}`")
+        return rows[0][0]
+
+    async def values(self) -> AsyncIterator[ResponseOrKey]:  # type: ignore[override]
+        """Get all the values."""
+        for row in await self._aexecute("SELECT value FROM `{table}`"):
+            yield row[0]
+
+    async def write(self, key: str, item: ResponseOrKey) -> None:
+        """Write an item."""
+        await self._aexecute(
+            "INSERT OR REPLACE INTO `{table}` (key, value) VALUES (?, ?)",
+            (key, item),
+        )
+
+
+class PooledSQLitePickleCache(PooledSQLiteCache):
+    """Table of an HTTP cache pickling its values, such as the responses."""
+
+    async def read(self, key: str) -> ResponseOrKey:
+        """Read an item, None if it is missing."""
+        return self.deserialize(await super().read(key))
+
+    async def values(self) -> AsyncIterator[ResponseOrKey]:  # type: ignore[override]
+        """Get all the values."""
+        async for value in super().values():
+            yield self.deserialize(value)
+
+    async def write(self, key: str, item: ResponseOrKey) -> None:
+        """Write an item."""
+        await super().write(key, sqlite3.Binary(self.serialize(item)))  # type: ignore[arg-type]
+
+
+class PooledSQLiteBackend(CacheBackend):
+    """HTTP cache backend storing the responses in a shared cache database.
+
+    The database is in WAL mode and its connections are shared with the other
+    caches of the process, see `CacheDatabase`. Closing a session leaves them
+    open for the next one.
+
+    Parameters
+    ----------
+    cache_name : Union[str, Path]
+        Path of the database, `.sqlite` is added without an extension.
+    **kwargs : Any
+        Arguments of `CacheBackend`, such as `expire_after`.
+    """
+
+    def __init__(self, cache_name: Union[str, Path], **kwargs: Any) -> None:
+        """Initialize the backend."""
+        path = Path(cache_name).expanduser()
+        if not path.suffix:
+            path = path.with_suffix(".sqlite")
+        super().__init__(cache_name=str(path), **kwargs)
+        db = get_cache_db(path.resolve())
+        self.responses = PooledSQLitePickleCache(db, "responses", **kwargs)
+        self.redirects = PooledSQLiteCache(db, "redirects", **kwargs)
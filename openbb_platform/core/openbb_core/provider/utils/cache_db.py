@@ -0,0 +1,215 @@
+"""Shared SQLite cache databases."""
+
+import asyncio
+import sqlite3
+import threading
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Set,
+    Union,
+)
+
+# Seconds a connection waits for the lock held by another writer before failing.
+CACHE_DB_TIMEOUT = 30.0
+# Maximum number of connections to a database used at the same time.
+CACHE_DB_POOL_SIZE = 8
+
+
+class CacheDatabase:
+    """SQLite database of a cache, shared by the threads of the process.
+
+    The database is in WAL mode, so readers don't wait for the writer and the
+    writer doesn't wait for readers, and other writers wait up to `timeout`
+    seconds instead of failing because the database is locked.
+
+    Connections are pooled: `connection` lends an idle one, or opens a new one
+    when all of them are in use, up to `pool_size` connections. A connection is
+    only used by one thread at a time.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        Path of the database file.
+    pool_size : int
+        Maximum number of connections used at the same time.
+    timeout : float
+        Seconds a write waits for the lock of another writer.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        pool_size: int = CACHE_DB_POOL_SIZE,
+        timeout: float = CACHE_DB_TIMEOUT,
+    ) -> None:
+        """Initialize the database."""
+        self.path = Path(path)
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._idle: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._initialized: Set[str] = set()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, in autocommit mode."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        # Durable across crashes of the process, only a power loss may drop the last writes.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection from the pool."""
+        self._slots.acquire()  # pylint: disable=consider-using-with
+        try:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                conn = self._connect()
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    conn.rollback()
+                with self._lock:
+                    self._idle.append(conn)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection and run the statements in a write transaction."""
+        with self.connection() as conn:
+            # Take the write lock now, so the transaction can't fail half way on it.
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def initialize(self, name: str, init: Callable[[sqlite3.Connection], None]) -> None:
+        """Create the tables and indexes of a cache, once per process.
+
+        Parameters
+        ----------
+        name : str
+            Name of the cache, `init` only runs the first time it is seen.
+        init : Callable[[sqlite3.Connection], None]
+            Function creating the tables and indexes, run in a transaction.
+        """
+        if name in self._initialized:
+            return
+        with self.transaction() as conn:
+            init(conn)
+        with self._lock:
+            self._initialized.add(name)
+
+    def execute(self, sql: str, parameters: Sequence[Any] = ()) -> List[Any]:
+        """Run a statement and return all its rows."""
+        with self.connection() as conn:
+            return conn.execute(sql, parameters).fetchall()
+
+    def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Run a statement for each row, in a single transaction."""
+        with self.transaction() as conn:
+            conn.executemany(sql, rows)
+
+    async def aexecute(self, sql: str, parameters: Sequence[Any] = ()) -> List[Any]:
+        """Run a statement in a worker thread and return all its rows."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.execute, sql, parameters))
+
+    async def aexecutemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Run a statement for each row in a worker thread, in a single transaction."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, partial(self.executemany, sql, rows))
+
+    def close(self) -> None:
+        """Close the idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._initialized.clear()
+        for conn in idle:
+            conn.close()
+
+
+_CACHE_DBS: Dict[Path, CacheDatabase] = {}
+_CACHE_DBS_LOCK = threading.Lock()
+
+
+def get_cache_db(path: Union[str, Path]) -> CacheDatabase:
+    """Get the database of a cache file, shared by all the caches using the same file.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        Path of the database, relative paths are in the user cache directory.
+    """
+    path = Path(path)
+    if not path.is_absolute():
+        # pylint: disable=import-outside-toplevel
+        from openbb_core.app.utils import get_user_cache_directory
+
+        path = Path(get_user_cache_directory(), path)
+    path = path.resolve()
+    with _CACHE_DBS_LOCK:
+        if path not in _CACHE_DBS:
+            _CACHE_DBS[path] = CacheDatabase(path)
+        return _CACHE_DBS[path]
+
+
+def close_cache_dbs() -> None:
+    """Close the idle connections of all the cache databases."""
+    with _CACHE_DBS_LOCK:
+        databases = list(_CACHE_DBS.values())
+    for database in databases:
+        database.close()
+
+
+def get_sqlite_backend(cache_name: Union[str, Path], **kwargs: Any) -> Any:
+    """Get an `aiohttp_client_cache` backend storing the responses in a cache database.
+
+    The HTTP caches of the providers share the pooled connections of the cache
+    databases, in WAL mode, instead of each opening its own connection.
+
+    Parameters
+    ----------
+    cache_name : Union[str, Path]
+        Path of the database, `.sqlite` is added without an extension.
+    **kwargs : Any
+        Arguments of the backend, such as `expire_after`.
+
+    Returns
+    -------
+    PooledSQLiteBackend
+        The backend.
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        from openbb_core.provider.utils.aiohttp_cache import PooledSQLiteBackend
+    except ImportError as e:
+        raise ImportError(
+            "aiohttp-client-cache is required for the provider HTTP caches, "
+            "install it with `pip install aiohttp-client-cache`."
+        ) from e
+
+    return PooledSQLiteBackend(cache_name, **kwargs)
@@ -2,6 +2,7 @@
 
 # pylint: disable=protected-access,invalid-overridden-method
 import asyncio
+import contextlib
 import random
 import re
 import warnings
@@ -81,7 +82,9 @@ class ClientSession(aiohttp.ClientSession):
     def __del__(self, _warnings: Any = warnings) -> None:
         """Close the session."""
         if not self.closed:
-            asyncio.create_task(self.close())
+            # Without a running event loop, there is nothing to close the session in.
+            with contextlib.suppress(RuntimeError):
+                asyncio.create_task(self.close())
 
     async def get(self, url: str, **kwargs) -> ClientResponse:  # type: ignore
         """Send GET request."""
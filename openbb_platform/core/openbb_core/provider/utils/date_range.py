@@ -0,0 +1,213 @@
+"""Chunked date range downloads."""
+
+import asyncio
+import json
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from openbb_core.app.model.abstract.error import OpenBBError
+
+FetchChunk = Callable[[date, date], Awaitable[List[Dict[str, Any]]]]
+
+
+def split_date_range(
+    start_date: Union[date, datetime],
+    end_date: Union[date, datetime],
+    window: timedelta,
+) -> List[Tuple[date, date]]:
+    """Split a date range into consecutive windows, both ends included.
+
+    Parameters
+    ----------
+    start_date : Union[date, datetime]
+        First date of the range.
+    end_date : Union[date, datetime]
+        Last date of the range.
+    window : timedelta
+        Length of each window, the last one may be shorter. At least one day.
+
+    Returns
+    -------
+    List[Tuple[date, date]]
+        The start and end dates of each window.
+    """
+    if window < timedelta(days=1):
+        raise OpenBBError("The window must be at least one day.")
+    start = start_date.date() if isinstance(start_date, datetime) else start_date
+    end = end_date.date() if isinstance(end_date, datetime) else end_date
+    chunks = []
+    while start <= end:
+        chunks.append((start, min(start + window - timedelta(days=1), end)))
+        start += window
+    return chunks
+
+
+class DateRangeDownloader:
+    """Download a date range in provider-sized windows.
+
+    The windows are fetched concurrently, up to `max_concurrent` at a time, and
+    a failed window is retried with exponential backoff. Requests made through
+    `amake_request` also wait on the provider rate limiter, so a backfill uses
+    the provider quota without exceeding it.
+
+    With a `checkpoint` file, each completed window is appended to it, and a
+    later download of the same range only fetches the windows missing from it.
+    The file is removed once the whole range is downloaded.
+
+    Parameters
+    ----------
+    fetch : Callable[[date, date], Awaitable[List[Dict[str, Any]]]]
+        Coroutine function fetching the records of one window, both ends included.
+        It should raise to have the window retried.
+    window : timedelta
+        Length of the windows accepted by the provider.
+    max_concurrent : int
+        Maximum number of windows fetched at the same time, by default 4.
+    retries : int
+        Retries of a failed window, by default 3.
+    backoff : float
+        Seconds to wait before the first retry, doubled on each retry, by default 1.
+    key : Optional[Callable[[Dict[str, Any]], Hashable]]
+        Identity of a record, such as its date, to drop the duplicates returned
+        by overlapping windows. The first record is kept. Records whose key is
+        None are all kept, since they can't be told apart.
+    checkpoint : Optional[Union[str, Path]]
+        JSON lines file persisting the completed windows, the records must be
+        JSON serializable.
+    """
+
+    def __init__(
+        self,
+        fetch: FetchChunk,
+        window: timedelta,
+        max_concurrent: int = 4,
+        retries: int = 3,
+        backoff: float = 1.0,
+        key: Optional[Callable[[Dict[str, Any]], Hashable]] = None,
+        checkpoint: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """Initialize the downloader."""
+        if max_concurrent < 1:
+            raise OpenBBError("max_concurrent must be at least 1.")
+        self.fetch = fetch
+        self.window = window
+        self.max_concurrent = max_concurrent
+        self.retries = retries
+        self.backoff = backoff
+        self.key = key
+        self.checkpoint = Path(checkpoint) if checkpoint else None
+
+    @staticmethod
+    def _chunk_id(chunk: Tuple[date, date]) -> str:
+        """Identify a window in the checkpoint file."""
+        return f"{chunk[0].isoformat()}/{chunk[1].isoformat()}"
+
+    def _load_checkpoint(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Load the completed windows from the checkpoint file."""
+        completed: Dict[str, List[Dict[str, Any]]] = {}
+        if self.checkpoint is None or not self.checkpoint.exists():
+            return completed
+        with open(self.checkpoint, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # The last line is cut short if the process was killed while writing it.
+                    continue
+                completed[entry["chunk"]] = entry["records"]
+        return completed
+
+    def _save_chunk(self, chunk_id: str, records: List[Dict[str, Any]]) -> None:
+        """Append a completed window to the checkpoint file."""
+        if self.checkpoint is None:
+            return
+        self.checkpoint.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps({"chunk": chunk_id, "records": records}, default=str)
+        with open(self.checkpoint, "a", encoding="utf-8") as file:
+            file.write(line + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    async def _fetch_chunk(
+        self, chunk: Tuple[date, date], semaphore: asyncio.Semaphore
+    ) -> List[Dict[str, Any]]:
+        """Fetch a window, retrying it when it fails."""
+        async with semaphore:
+            for attempt in range(self.retries + 1):
+                try:
+                    records = await self.fetch(*chunk)
+                    break
+                except Exception:  # pylint: disable=broad-except
+                    if attempt == self.retries:
+                        raise
+                    await asyncio.sleep(self.backoff * 2**attempt)
+        records = list(records or [])
+        self._save_chunk(self._chunk_id(chunk), records)
+        return records
+
+    async def download(
+        self,
+        start_date: Union[date, datetime],
+        end_date: Union[date, datetime],
+    ) -> List[Dict[str, Any]]:
+        """Download the records of a date range.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The records of all the windows, in window order, without duplicates.
+        """
+        chunks = split_date_range(start_date, end_date, self.window)
+        completed = self._load_checkpoint()
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        missing = [c for c in chunks if self._chunk_id(c) not in completed]
+        outcomes = await asyncio.gather(
+            *[self._fetch_chunk(c, semaphore) for c in missing],
+            return_exceptions=True,
+        )
+        for chunk, outcome in zip(missing, outcomes):
+            if isinstance(outcome, BaseException):
+                # The completed windows are kept in the checkpoint to resume from.
+                raise outcome
+            completed[self._chunk_id(chunk)] = outcome
+
+        results: List[Dict[str, Any]] = []
+        seen = set()
+        for chunk in chunks:
+            for record in completed[self._chunk_id(chunk)]:
+                if self.key is not None:
+                    record_key = self.key(record)
+                    if record_key is not None:
+                        if record_key in seen:
+                            continue
+                        seen.add(record_key)
+                results.append(record)
+
+        if self.checkpoint is not None:
+            self.checkpoint.unlink(missing_ok=True)
+        return results
+
+
+async def download_date_range(
+    fetch: FetchChunk,
+    start_date: Union[date, datetime],
+    end_date: Union[date, datetime],
+    window: timedelta,
+    **kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """Download a date range in windows, see `DateRangeDownloader` for the options."""
+    return await DateRangeDownloader(fetch, window, **kwargs).download(
+        start_date, end_date
+    )
@@ -0,0 +1,243 @@
+"""Executors of the blocking provider functions."""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from typing import Any, Callable, Dict, Literal, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+ExecutorKind = Literal["thread", "process", "inline"]
+
+
+class BlockingExecutor:
+    """Bounded pool running blocking functions out of the event loop.
+
+    Synchronous provider functions, such as an `extract_data` using requests,
+    block the event loop while they run, and with it every other request
+    served by the same process. They are run in a pool of `max_workers`
+    threads, or processes for CPU-bound functions, instead.
+
+    A single key, usually a provider, can only use `max_per_key` workers at a
+    time, so a slow provider can't take all the workers from the others.
+
+    Thread workers run in a copy of the caller context, so the context
+    variables, such as the rate limiter and cache settings of the running
+    fetcher, apply to them. Process workers don't share the context, and the
+    functions and their arguments must be picklable.
+
+    Parameters
+    ----------
+    kind : Literal["thread", "process"]
+        Type of the workers, by default "thread".
+    max_workers : Optional[int]
+        Number of workers, by default min(32, CPU count + 4) threads or one
+        process per CPU.
+    max_per_key : Optional[int]
+        Maximum number of workers used by the same key, by default half of
+        the workers.
+    """
+
+    def __init__(
+        self,
+        kind: Literal["thread", "process"] = "thread",
+        max_workers: Optional[int] = None,
+        max_per_key: Optional[int] = None,
+    ) -> None:
+        """Initialize the executor."""
+        cpus = os.cpu_count() or 1
+        if not max_workers:
+            max_workers = min(32, cpus + 4) if kind == "thread" else cpus
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_per_key = max_per_key or max(1, max_workers // 2)
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._semaphores: Dict[
+            Tuple[int, str], Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]
+        ] = {}
+        self._pending = 0
+        self._max_queued = 0
+        self._completed = 0
+        self._failed = 0
+        self._wait_seconds = 0.0
+        self._run_seconds = 0.0
+
+    @property
+    def executor(self) -> Executor:
+        """Get the pool, started on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = (
+                    ThreadPoolExecutor(self.max_workers, thread_name_prefix="openbb")
+                    if self.kind == "thread"
+                    else ProcessPoolExecutor(self.max_workers)
+                )
+            return self._executor
+
+    def _semaphore(self, key: str) -> asyncio.Semaphore:
+        """Get the semaphore of a key in the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for other_key, (other, _) in list(self._semaphores.items()):
+                if other.is_closed():
+                    del self._semaphores[other_key]
+            if (id(loop), key) not in self._semaphores:
+                self._semaphores[(id(loop), key)] = (
+                    loop,
+                    asyncio.Semaphore(self.max_per_key),
+                )
+            return self._semaphores[(id(loop), key)][1]
+
+    async def run(
+        self, key: str, func: Callable[..., T], /, *args: Any, **kwargs: Any
+    ) -> T:
+        """Run a blocking function in the pool and wait for its result.
+
+        Parameters
+        ----------
+        key : str
+            Key sharing the `max_per_key` workers, for example the provider name.
+        func : Callable[..., T]
+            The blocking function.
+        *args : Any
+            Positional arguments of the function.
+        **kwargs : Any
+            Keyword arguments of the function.
+        """
+        loop = asyncio.get_running_loop()
+        call = partial(func, *args, **kwargs)
+        if self.kind == "thread":
+            call = partial(copy_context().run, call)
+        async with self._semaphore(key):
+            with self._lock:
+                self._pending += 1
+                self._max_queued = max(
+                    self._max_queued, self._pending - self.max_workers
+                )
+            submitted = time.perf_counter()
+            try:
+                result = await loop.run_in_executor(
+                    self.executor, partial(_timed, call)
+                )
+            except BaseException:
+                with self._lock:
+                    self._pending -= 1
+                    self._failed += 1
+                raise
+            output, seconds = result
+            with self._lock:
+                self._pending -= 1
+                self._completed += 1
+                self._run_seconds += seconds
+                self._wait_seconds += time.perf_counter() - submitted - seconds
+            return output
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the metrics of the pool.
+
+        Returns
+        -------
+        Dict[str, Any]
+            - kind: type of the workers.
+            - max_workers: number of workers.
+            - running: functions running.
+            - queued: functions waiting for a worker, the queue depth.
+            - max_queued: highest queue depth seen.
+            - completed: functions that returned.
+            - failed: functions that raised.
+            - avg_wait_seconds: average time spent in the queue.
+            - avg_run_seconds: average time spent running.
+        """
+        with self._lock:
+            done = self._completed or 1
+            return {
+                "kind": self.kind,
+                "max_workers": self.max_workers,
+                "running": min(self._pending, self.max_workers),
+                "queued": max(self._pending - self.max_workers, 0),
+                "max_queued": self._max_queued,
+                "completed": self._completed,
+                "failed": self._failed,
+                "avg_wait_seconds": max(self._wait_seconds, 0.0) / done,
+                "avg_run_seconds": self._run_seconds / done,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers, a new pool is started on the next run."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+def _timed(call: Callable[[], T]) -> Tuple[T, float]:
+    """Run a function and measure the time it took, in the worker."""
+    start = time.perf_counter()
+    return call(), time.perf_counter() - start
+
+
+_EXECUTORS: Dict[str, BlockingExecutor] = {}
+_EXECUTORS_LOCK = threading.Lock()
+
+
+def get_blocking_executor(
+    kind: Literal["thread", "process"] = "thread",
+) -> BlockingExecutor:
+    """Get the process-wide executor of a kind of workers.
+
+    The number of workers is set by the OPENBB_EXECUTOR_MAX_WORKERS environment
+    variable, 0 for the default.
+    """
+    # pylint: disable=import-outside-toplevel
+    from openbb_core.env import Env
+
+    with _EXECUTORS_LOCK:
+        if kind not in _EXECUTORS:
+            _EXECUTORS[kind] = BlockingExecutor(
+                kind, max_workers=Env().EXECUTOR_MAX_WORKERS or None
+            )
+        return _EXECUTORS[kind]
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """Stop the workers of all the executors."""
+    with _EXECUTORS_LOCK:
+        executors = list(_EXECUTORS.values())
+    for executor in executors:
+        executor.shutdown(wait=wait)
+
+
+async def run_blocking(
+    key: str,
+    func: Callable[..., T],
+    /,
+    *args: Any,
+    kind: Optional[ExecutorKind] = None,
+    **kwargs: Any,
+) -> T:
+    """Run a blocking function out of the event loop.
+
+    Parameters
+    ----------
+    key : str
+        Key sharing the workers, for example the provider name.
+    func : Callable[..., T]
+        The blocking function.
+    kind : Optional[Literal["thread", "process", "inline"]]
+        Where to run the function, "inline" runs it in the event loop. By default
+        the OPENBB_EXECUTOR environment variable, "thread" unless it is set.
+    """
+    if kind is None:
+        # pylint: disable=import-outside-toplevel
+        from openbb_core.env import Env
+
+        kind = Env().EXECUTOR  # type: ignore[assignment]
+    if kind == "inline":
+        return func(*args, **kwargs)
+    return await get_blocking_executor(kind).run(  # type: ignore[arg-type]
+        key, func, *args, **kwargs
+    )
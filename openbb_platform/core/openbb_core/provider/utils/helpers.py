@@ -1,15 +1,21 @@
 """Provider helpers."""
 
 import asyncio
+import base64
+import hashlib
 import os
 import re
+import time
 from datetime import date, datetime, timedelta, timezone
 from difflib import SequenceMatcher
 from functools import partial
 from inspect import iscoroutinefunction
+from types import CodeType
 from typing import (
+    Any,
     Awaitable,
     Callable,
+    Dict,
     List,
     Literal,
     Optional,
@@ -20,14 +26,19 @@ from typing import (
 
 import requests
 from anyio.from_thread import start_blocking_portal
+from requests.structures import CaseInsensitiveDict
 from typing_extensions import ParamSpec
 
 from openbb_core.provider.abstract.data import Data
 from openbb_core.provider.utils.client import (
+    FILTER_QUERY_REGEX,
     ClientResponse,
     ClientSession,
     get_user_agent,
 )
+from openbb_core.provider.utils.http_cache import HTTP_CACHE_TTL, get_http_cache
+from openbb_core.provider.utils.rate_limiter import RATE_LIMITER
+from openbb_core.provider.utils.session_pool import get_session
 
 T = TypeVar("T")
 P = ParamSpec("P")
@@ -95,6 +106,36 @@ def get_querystring(items: dict, exclude: List[str]) -> str:
     return f"{querystring}" if querystring else ""
 
 
+async def _arequest(
+    session: ClientSession, method: str, url: str, **kwargs
+) -> ClientResponse:
+    """Send a request honoring the rate limit of the running provider.
+
+    Requests answered with HTTP 429 are retried after the Retry-After delay,
+    or with exponential backoff when the header is missing.
+    """
+    limiter = RATE_LIMITER.get()
+    if limiter is None:
+        return await session.request(method, url, **kwargs)
+
+    raise_for_status = kwargs.pop("raise_for_status", False)
+    max_retries = limiter.rate_limit.max_retries
+    for attempt in range(max_retries + 1):
+        # The slot is released before the body is read, because response
+        # callbacks can send follow-up requests through the same limiter.
+        async with limiter:
+            response = await session.request(method, url, **kwargs)
+        if response.status != 429 or attempt == max_retries:
+            break
+        delay = limiter.retry_delay(attempt, response.headers.get("Retry-After"))
+        response.release()
+        await asyncio.sleep(delay)
+
+    if raise_for_status:
+        response.raise_for_status()
+    return response
+
+
 async def amake_request(
     url: str,
     method: Literal["GET", "POST"] = "GET",
@@ -118,8 +159,12 @@ async def amake_request(
     response_callback : Callable[[ClientResponse, ClientSession], Awaitable[Union[dict, List[dict]]]], optional
         Async callback with response and session as arguments that returns the json, by default None
     session : ClientSession, optional
-        Custom session to use for requests, by default None
+        Custom session to use for requests, by default the shared session of the url host.
+    session_key : str, optional
+        Key of the shared session to use, for example the provider name, by default the url host.
 
+    Responses are cached when the running fetcher declares a cache ttl, no custom
+    session is passed and the callback is a function without captured state.
 
     Returns
     -------
@@ -135,15 +180,30 @@ async def amake_request(
         lambda r, _: asyncio.ensure_future(r.json())
     )
 
-    with_session = kwargs.pop("with_session", "session" in kwargs)
-    session: ClientSession = kwargs.pop("session", ClientSession())
+    session_key = kwargs.pop("session_key", None) or url
+    # Pooled sessions are shared, so they are only closed by the pool shutdown hooks.
+    kwargs.pop("with_session", None)
+    custom_session: Optional[ClientSession] = kwargs.pop("session", None)
+    session = custom_session or get_session(session_key)
+
+    cache_ttl = None if custom_session else HTTP_CACHE_TTL.get()
+    callback_key = _callback_key(response_callback) if cache_ttl else None
+    if cache_ttl and callback_key:
+        cache = get_http_cache()
+        cache_key = cache.make_key(
+            method, url, callback=callback_key, **_cache_key_parts(kwargs)
+        )
+        hit, cached = cache.get(cache_key)
+        if hit:
+            return cached
 
-    try:
-        response = await session.request(method, url, **kwargs)
-        return await response_callback(response, session)
-    finally:
-        if not with_session:
-            await session.close()
+    response = await _arequest(session, method, url, **kwargs)
+    result = await response_callback(response, session)
+
+    if cache_ttl and callback_key and getattr(response, "status", 500) < 400:
+        cache.set(cache_key, result, cache_ttl)
+
+    return result
 
 
 async def amake_requests(
@@ -166,23 +226,32 @@ async def amake_requests(
     response_callback : Callable[[ClientResponse, ClientSession], Awaitable[Union[dict, List[dict]]]], optional
         Async callback with response and session as arguments that returns the json, by default None
     session : ClientSession, optional
-        Custom session to use for requests, by default None
+        Custom session to use for requests, closed when done, by default the shared session.
+    session_key : str, optional
+        Key of the shared session to use, for example the provider name, by default the url host.
 
     Returns
     -------
     Union[dict, List[dict]]
         Response json
     """
-    session: ClientSession = kwargs.pop("session", ClientSession())
-    kwargs["response_callback"] = response_callback
-
     urls = urls if isinstance(urls, list) else [urls]
 
+    custom_session: Optional[ClientSession] = kwargs.pop("session", None)
+    session_key = kwargs.pop("session_key", None) or (urls[0] if urls else "")
+    kwargs["response_callback"] = response_callback
+    # A custom session is passed as it is, which disables the cache. Otherwise
+    # the requests use the shared session of the key, with the cache.
+    if custom_session is not None:
+        kwargs["session"] = custom_session
+    else:
+        kwargs["session_key"] = session_key
+
     try:
         results = []
 
         for result in await asyncio.gather(
-            *[amake_request(url, session=session, **kwargs) for url in urls],
+            *[amake_request(url, **kwargs) for url in urls],
             return_exceptions=True,
         ):
             is_exception = isinstance(result, Exception)
@@ -200,7 +269,73 @@ async def amake_requests(
         return results
 
     finally:
-        await session.close()
+        if custom_session is not None:
+            await custom_session.close()
+
+
+def _callback_key(callback: Callable) -> Optional[str]:
+    """Identify a response callback for the cache, None if its responses can't be cached.
+
+    A function is identified by its module, name and code, so two lambdas or an
+    edited function don't share responses. Closures, bound methods and other
+    callables carrying state may return different results for the same code,
+    so their responses are not cached.
+    """
+    code = getattr(callback, "__code__", None)
+    if (
+        not isinstance(code, CodeType)
+        or getattr(callback, "__closure__", None)
+        or hasattr(callback, "__self__")
+    ):
+        return None
+    # Nested code objects are left out, their repr has a memory address.
+    consts = [c for c in code.co_consts if not isinstance(c, CodeType)]
+    digest = hashlib.sha256(
+        code.co_code + repr((code.co_names, consts)).encode()
+    ).hexdigest()
+    return f"{callback.__module__}.{callback.__qualname__}:{digest}"
+
+
+def _cache_key_parts(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the request arguments that identify a response for the cache.
+
+    Only the credential headers are kept, other headers like the user agent
+    vary between identical requests.
+    """
+    headers = kwargs.get("headers") or {}
+    return {
+        "params": kwargs.get("params"),
+        "data": kwargs.get("data"),
+        "json": kwargs.get("json"),
+        "headers": {
+            k: v
+            for k, v in headers.items()
+            if re.match(FILTER_QUERY_REGEX, k, re.IGNORECASE)
+        },
+    }
+
+
+def _response_to_dict(response: requests.Response) -> Dict[str, Any]:
+    """Serialize a requests response for the cache."""
+    return {
+        "status_code": response.status_code,
+        "url": response.url,
+        "encoding": response.encoding,
+        "headers": dict(response.headers),
+        "content": base64.b64encode(response.content).decode(),
+    }
+
+
+def _response_from_dict(data: Dict[str, Any]) -> requests.Response:
+    """Rebuild a requests response from the cache."""
+    response = requests.Response()
+    response.status_code = data["status_code"]
+    response.url = data["url"]
+    response.encoding = data["encoding"]
+    response.headers = CaseInsensitiveDict(data["headers"])
+    # pylint: disable=protected-access
+    response._content = base64.b64decode(data["content"])
+    return response
 
 
 def make_request(
@@ -238,24 +373,45 @@ def make_request(
     if "User-Agent" not in headers:
         headers["User-Agent"] = get_user_agent()
 
-    # Allow a custom session for caching, if desired
-    _session = kwargs.pop("session", None) or requests
+    if method.upper() not in ["GET", "POST"]:
+        raise ValueError("Method must be GET or POST")
 
-    if method.upper() == "GET":
-        return _session.get(
-            url,
-            headers=headers,
-            timeout=timeout,
-            **kwargs,
+    # Allow a custom session for caching, if desired
+    custom_session = kwargs.pop("session", None)
+    _session = custom_session or requests
+
+    cache_ttl = None if custom_session else HTTP_CACHE_TTL.get()
+    if cache_ttl:
+        cache = get_http_cache()
+        cache_key = cache.make_key(
+            method, url, **_cache_key_parts({**kwargs, "headers": headers})
         )
-    if method.upper() == "POST":
-        return _session.post(
+        hit, cached = cache.get(cache_key)
+        if hit:
+            return _response_from_dict(cached)
+
+    send = _session.get if method.upper() == "GET" else _session.post
+    limiter = RATE_LIMITER.get()
+    max_retries = limiter.rate_limit.max_retries if limiter else 0
+    for attempt in range(max_retries + 1):
+        if limiter:
+            limiter.wait()
+        response = send(
             url,
             headers=headers,
             timeout=timeout,
             **kwargs,
         )
-    raise ValueError("Method must be GET or POST")
+        if getattr(response, "status_code", None) != 429 or attempt == max_retries:
+            break
+        time.sleep(
+            limiter.retry_delay(attempt, response.headers.get("Retry-After"))  # type: ignore
+        )
+
+    if cache_ttl and isinstance(response, requests.Response) and response.ok:
+        cache.set(cache_key, _response_to_dict(response), cache_ttl)
+
+    return response
 
 
 def to_snake_case(string: str) -> str:
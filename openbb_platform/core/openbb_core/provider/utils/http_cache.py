@@ -0,0 +1,327 @@
+"""HTTP response cache."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from openbb_core.provider.utils.cache_db import CacheDatabase, get_cache_db
+
+# Time-to-live, in seconds, of the responses cached while running the current fetcher.
+# It is set by the query executor and read by the request helpers.
+HTTP_CACHE_TTL: ContextVar[Optional[int]] = ContextVar("HTTP_CACHE_TTL", default=None)
+
+
+class CacheBackend:
+    """Abstract class for the cache backends.
+
+    Values are JSON strings, so every backend can store them as they are.
+    """
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a value, None if it is missing or expired."""
+        entry = self.get_entry(key)
+        return None if entry is None else entry[0]
+
+    def get_entry(self, key: str) -> Optional[Tuple[str, float]]:
+        """Get a value and its expiration timestamp, None if it is missing or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Set a value that expires in `ttl` seconds."""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Delete a value."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Delete all the values."""
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-memory LRU cache backend."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """Initialize the backend.
+
+        Parameters
+        ----------
+        max_entries : int
+            Maximum number of entries, the least recently used are evicted first.
+        """
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_entry(self, key: str) -> Optional[Tuple[str, float]]:
+        """Get a value and its expiration timestamp, None if it is missing or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value, expires
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Set a value that expires in `ttl` seconds."""
+        with self._lock:
+            self._data[key] = (time.time() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Delete a value."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Delete all the values."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._data)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """On-disk SQLite cache backend."""
+
+    def __init__(self, path: Union[str, Path], max_entries: int = 50000) -> None:
+        """Initialize the backend.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            Path of the database file, shared with the other caches using it.
+        max_entries : int
+            Maximum number of entries, the least recently used are evicted first.
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._db: Optional[CacheDatabase] = None
+
+    @property
+    def db(self) -> CacheDatabase:
+        """Get the database, creating the table on first use."""
+        if self._db is None:
+            self._db = get_cache_db(self.path)
+            self._db.initialize("responses", self._create_tables)
+        return self._db
+
+    @staticmethod
+    def _create_tables(conn: sqlite3.Connection) -> None:
+        """Create the responses table and its indexes."""
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, value TEXT, expires REAL, accessed REAL)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires)"
+        )
+
+    def get_entry(self, key: str) -> Optional[Tuple[str, float]]:
+        """Get a value and its expiration timestamp, None if it is missing or expired."""
+        now = time.time()
+        with self.db.connection() as conn:
+            row = conn.execute(
+                "SELECT value, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < now:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            return row[0], row[1]
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Set a value that expires in `ttl` seconds."""
+        now = time.time()
+        with self.db.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl, now),
+            )
+            count = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            if count > self.max_entries:
+                conn.execute("DELETE FROM responses WHERE expires < ?", (now,))
+                conn.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY accessed LIMIT "
+                    "MAX((SELECT COUNT(*) FROM responses) - ?, 0))",
+                    (self.max_entries,),
+                )
+
+    def delete(self, key: str) -> None:
+        """Delete a value."""
+        self.db.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Delete all the values."""
+        self.db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the idle connections to the database."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+class TieredCacheBackend(CacheBackend):
+    """Cache backend that chains other backends, from the fastest to the slowest.
+
+    Hits in a slower tier are copied to the faster ones, never beyond their expiration.
+    """
+
+    def __init__(self, *tiers: CacheBackend, promote_ttl: int = 300) -> None:
+        """Initialize the backend.
+
+        Parameters
+        ----------
+        *tiers : CacheBackend
+            Backends, from the fastest to the slowest.
+        promote_ttl : int
+            Maximum time-to-live, in seconds, of the values copied to the faster tiers.
+        """
+        self.tiers = tiers
+        self.promote_ttl = promote_ttl
+
+    def get_entry(self, key: str) -> Optional[Tuple[str, float]]:
+        """Get a value and its expiration timestamp, None if it is missing or expired."""
+        for i, tier in enumerate(self.tiers):
+            entry = tier.get_entry(key)
+            if entry is not None:
+                ttl = min(entry[1] - time.time(), self.promote_ttl)
+                if ttl > 0:
+                    for faster in self.tiers[:i]:
+                        faster.set(key, entry[0], ttl)
+                return entry
+        return None
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Set a value that expires in `ttl` seconds."""
+        for tier in self.tiers:
+            tier.set(key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        """Delete a value."""
+        for tier in self.tiers:
+            tier.delete(key)
+
+    def clear(self) -> None:
+        """Delete all the values."""
+        for tier in self.tiers:
+            tier.clear()
+
+
+class HttpCache:
+    """Cache of HTTP responses."""
+
+    def __init__(self, backend: CacheBackend) -> None:
+        """Initialize the cache."""
+        self.backend = backend
+
+    @staticmethod
+    def make_key(method: str, url: str, **parts: Any) -> str:
+        """Make the key of a request.
+
+        The key is a hash, so credentials in the url are never stored in clear.
+        """
+        payload = json.dumps(
+            {"method": method.upper(), "url": str(url), **parts},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Get a cached response as a (hit, value) tuple."""
+        value = self.backend.get(key)
+        if value is None:
+            return False, None
+        return True, json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: int) -> bool:
+        """Cache a JSON serializable response, return whether it was cached."""
+        try:
+            serialized = json.dumps(value)
+        except (TypeError, ValueError):
+            return False
+        self.backend.set(key, serialized, ttl)
+        return True
+
+    def clear(self) -> None:
+        """Delete all the cached responses."""
+        self.backend.clear()
+
+
+_HTTP_CACHE: Optional[HttpCache] = None
+_HTTP_CACHE_LOCK = threading.Lock()
+
+
+def get_http_cache() -> HttpCache:
+    """Get the process-wide HTTP cache.
+
+    By default it keeps recent responses in memory, backed by a SQLite database
+    in the user cache directory.
+    """
+    global _HTTP_CACHE  # pylint: disable=global-statement  # noqa: PLW0603
+    with _HTTP_CACHE_LOCK:
+        if _HTTP_CACHE is None:
+            # pylint: disable=import-outside-toplevel
+            from openbb_core.app.utils import get_user_cache_directory
+
+            path = Path(get_user_cache_directory(), "http", "openbb_http_cache.sqlite")
+            _HTTP_CACHE = HttpCache(
+                TieredCacheBackend(MemoryCacheBackend(), SQLiteCacheBackend(path))
+            )
+        return _HTTP_CACHE
+
+
+def set_http_cache(cache: Optional[HttpCache]) -> None:
+    """Replace the process-wide HTTP cache, None restores the default one."""
+    global _HTTP_CACHE  # pylint: disable=global-statement  # noqa: PLW0603
+    with _HTTP_CACHE_LOCK:
+        _HTTP_CACHE = cache
+
+
+def resolve_cache_ttl(
+    preferences: Optional[Dict[str, Any]] = None,
+    *ttls: Optional[int],
+) -> Optional[int]:
+    """Resolve the time-to-live of the cached responses.
+
+    Parameters
+    ----------
+    preferences : Optional[Dict[str, Any]]
+        User preferences. `use_cache` disables the cache and `cache_ttl` overrides the declared ttls.
+    *ttls : Optional[int]
+        Declared ttls, from the most to the least specific, for example the fetcher and the provider.
+
+    Returns
+    -------
+    Optional[int]
+        The ttl in seconds, None if the responses should not be cached.
+    """
+    preferences = preferences or {}
+    if not preferences.get("use_cache", True):
+        return None
+    if preferences.get("cache_ttl") is not None:
+        return preferences["cache_ttl"] or None
+    return next((ttl for ttl in ttls if ttl is not None), None) or None
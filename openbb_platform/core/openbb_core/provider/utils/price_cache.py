@@ -0,0 +1,377 @@
+"""Incremental historical price cache."""
+
+import hashlib
+import json
+import math
+import pickle
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from openbb_core.provider.abstract.columnar_result import ColumnarResult
+from openbb_core.provider.abstract.data import Data
+from openbb_core.provider.abstract.query_params import QueryParams
+from openbb_core.provider.utils.cache_db import CacheDatabase, get_cache_db
+from openbb_core.provider.utils.errors import EmptyDataError
+
+if TYPE_CHECKING:
+    from openbb_core.provider.abstract.fetcher import Fetcher
+
+# Dates, both ends included, for which the provider was already asked.
+Coverage = List[Tuple[date, date]]
+FetchRange = Callable[[date, date], Awaitable[Any]]
+
+
+def _row_date(row: Data) -> date:
+    """Get the date of a row, the day of an intraday timestamp."""
+    value = row.date  # type: ignore[attr-defined]
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _row_key(row: Data) -> Tuple[Optional[str], str]:
+    """Identify a row in a series, by symbol and date or timestamp."""
+    return (getattr(row, "symbol", None), str(row.date))  # type: ignore[attr-defined]
+
+
+def _merge(coverage: Coverage, start: date, end: date) -> Coverage:
+    """Add a date range to the coverage, merging the adjacent ranges."""
+    merged: Coverage = []
+    for s, e in sorted([*coverage, (start, end)]):
+        if merged and s <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], e))
+        else:
+            merged.append((s, e))
+    return merged
+
+
+def find_gaps(coverage: Coverage, start: date, end: date) -> Coverage:
+    """Find the date ranges between start and end that are not covered."""
+    gaps: Coverage = []
+    cursor = start
+    for s, e in sorted(coverage):
+        if e < cursor:
+            continue
+        if s > end:
+            break
+        if s > cursor:
+            gaps.append((cursor, s - timedelta(days=1)))
+        cursor = max(cursor, e + timedelta(days=1))
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class PriceCache:
+    """Local store of historical price series, filled incrementally.
+
+    A series is identified by the fetcher, which stands for the provider and the
+    model, and by the query without its dates, so the symbol, interval and
+    adjustment, among other parameters, have separate series. For each series,
+    the store keeps the rows and the date ranges already requested. A query is
+    answered from the rows, and only the gaps in its date range are fetched.
+
+    The coverage never includes today, so the latest bar is always refreshed.
+    The last stored bar before a gap is fetched again with it, and if the
+    provider reports a different close, the prices were adjusted since they were
+    stored and the series is downloaded again.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        Path of the SQLite database.
+    max_age : int
+        Seconds after which a series is downloaded again in full, by default
+        7 days, to pick up corrections the overlap check does not see.
+    """
+
+    def __init__(self, path: Union[str, Path], max_age: int = 3600 * 24 * 7) -> None:
+        """Initialize the cache."""
+        self.path = Path(path)
+        self.max_age = max_age
+        self._db: Optional[CacheDatabase] = None
+
+    @property
+    def db(self) -> CacheDatabase:
+        """Get the database, creating the table on first use."""
+        if self._db is None:
+            self._db = get_cache_db(self.path)
+            self._db.initialize("series", self._create_tables)
+        return self._db
+
+    @staticmethod
+    def _create_tables(conn: sqlite3.Connection) -> None:
+        """Create the series table."""
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS series "
+            "(key TEXT PRIMARY KEY, coverage TEXT, rows BLOB, created REAL)"
+        )
+
+    @staticmethod
+    def supports(query: QueryParams) -> bool:
+        """Check if a query is for a historical price series with a known date range."""
+        # pylint: disable=import-outside-toplevel
+        from openbb_core.provider.standard_models.crypto_historical import (
+            CryptoHistoricalQueryParams,
+        )
+        from openbb_core.provider.standard_models.currency_historical import (
+            CurrencyHistoricalQueryParams,
+        )
+        from openbb_core.provider.standard_models.equity_historical import (
+            EquityHistoricalQueryParams,
+        )
+        from openbb_core.provider.standard_models.index_historical import (
+            IndexHistoricalQueryParams,
+        )
+
+        return (
+            isinstance(
+                query,
+                (
+                    EquityHistoricalQueryParams,
+                    IndexHistoricalQueryParams,
+                    CryptoHistoricalQueryParams,
+                    CurrencyHistoricalQueryParams,
+                ),
+            )
+            and isinstance(getattr(query, "start_date", None), date)
+            and isinstance(getattr(query, "end_date", None), date)
+        )
+
+    @staticmethod
+    def make_key(fetcher: type, query: QueryParams) -> str:
+        """Make the key of a series, from the fetcher and the query without its dates."""
+        params = query.model_dump(exclude={"start_date", "end_date"})
+        payload = json.dumps(
+            {
+                "fetcher": f"{fetcher.__module__}.{fetcher.__qualname__}",
+                "params": params,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def load(self, key: str) -> Tuple[Coverage, Dict[Hashable, Data]]:
+        """Load the coverage and the rows of a series."""
+        rows = self.db.execute(
+            "SELECT coverage, rows, created FROM series WHERE key = ?", (key,)
+        )
+        row = rows[0] if rows else None
+        if row is None:
+            return [], {}
+        if time.time() - row[2] > self.max_age:
+            # Delete the series, so the next save starts a new one.
+            self.db.execute("DELETE FROM series WHERE key = ?", (key,))
+            return [], {}
+        try:
+            coverage = [
+                (date.fromisoformat(s), date.fromisoformat(e))
+                for s, e in json.loads(row[0])
+            ]
+            rows = {_row_key(r): r for r in pickle.loads(row[1])}  # noqa: S301
+        except Exception:  # pylint: disable=broad-except
+            # A series stored by another version of a data model is downloaded again.
+            return [], {}
+        return coverage, rows
+
+    def save(
+        self,
+        key: str,
+        coverage: Coverage,
+        rows: Dict[Hashable, Data],
+        created: Optional[float] = None,
+    ) -> None:
+        """Save the coverage and the rows of a series."""
+        value = json.dumps([(s.isoformat(), e.isoformat()) for s, e in coverage])
+        blob = pickle.dumps(list(rows.values()), protocol=pickle.HIGHEST_PROTOCOL)
+        with self.db.transaction() as conn:
+            if created is None:
+                existing = conn.execute(
+                    "SELECT created FROM series WHERE key = ?", (key,)
+                ).fetchone()
+                created = existing[0] if existing else time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO series VALUES (?, ?, ?, ?)",
+                (key, value, blob, created),
+            )
+
+    def clear(self) -> None:
+        """Delete all the series."""
+        self.db.execute("DELETE FROM series")
+
+    def close(self) -> None:
+        """Close the idle connections to the database."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    async def get_or_fetch(
+        self, key: str, start: date, end: date, fetch: FetchRange
+    ) -> Optional[List[Data]]:
+        """Get the rows of a date range, fetching only what is not stored.
+
+        Parameters
+        ----------
+        key : str
+            Key of the series.
+        start : date
+            First date of the range.
+        end : date
+            Last date of the range.
+        fetch : Callable[[date, date], Awaitable[Any]]
+            Coroutine function fetching the rows of a date range from the provider.
+
+        Returns
+        -------
+        Optional[List[Data]]
+            The rows sorted by date, None if the provider results are not a list
+            of rows with a date, in which case they can't be stored.
+        """
+        coverage, rows = self.load(key)
+        created: Optional[float] = None
+        gaps = find_gaps(coverage, start, end)
+        yesterday = date.today() - timedelta(days=1)
+
+        for gap_start, gap_end in gaps:
+            # Fetch the last stored bar again, to check the prices were not adjusted.
+            previous = [r for r in rows.values() if _row_date(r) < gap_start]
+            last = max(previous, key=_row_date) if previous else None
+            fetched = await self._fetch_rows(
+                fetch, _row_date(last) if last else gap_start, gap_end
+            )
+            if fetched is None:
+                return None
+            new_rows = {_row_key(r): r for r in fetched}
+            if last is not None and not self._same_close(
+                last, new_rows.get(_row_key(last))
+            ):
+                # The series was adjusted, it is downloaded again from scratch.
+                fetched = await self._fetch_rows(fetch, start, end)
+                if fetched is None:
+                    return None
+                coverage, rows, created = [], {}, time.time()
+                new_rows = {_row_key(r): r for r in fetched}
+                gap_start, gap_end = start, end  # noqa: PLW2901
+            rows.update(new_rows)
+            covered_end = min(gap_end, yesterday)
+            if gap_end >= max((e for _, e in coverage), default=gap_end):
+                # The provider may not have published the end of the range yet.
+                last_fetched = max(map(_row_date, fetched), default=None)
+                covered_end = min(
+                    covered_end, last_fetched or gap_start - timedelta(days=1)
+                )
+            if covered_end >= gap_start:
+                coverage = _merge(coverage, gap_start, covered_end)
+            if (gap_start, gap_end) == (start, end):
+                break
+
+        if gaps:
+            self.save(key, coverage, rows, created)
+
+        return sorted(
+            (r for r in rows.values() if start <= _row_date(r) <= end),
+            key=lambda r: (str(r.date), getattr(r, "symbol", None) or ""),  # type: ignore[attr-defined]
+        )
+
+    @staticmethod
+    async def _fetch_rows(
+        fetch: FetchRange, start: date, end: date
+    ) -> Optional[List[Data]]:
+        """Fetch the rows of a date range, None if they can't be stored."""
+        try:
+            results = await fetch(start, end)
+        except EmptyDataError:
+            return []
+        if isinstance(results, ColumnarResult):
+            results = list(results)
+        if not isinstance(results, list) or not all(
+            isinstance(r, Data) and isinstance(getattr(r, "date", None), date)
+            for r in results
+        ):
+            return None
+        return results
+
+    @staticmethod
+    def _same_close(stored: Data, fetched: Optional[Data]) -> bool:
+        """Check a stored bar matches the same bar fetched again."""
+        if fetched is None:
+            return True
+        old = getattr(stored, "close", None)
+        new = getattr(fetched, "close", None)
+        if old is None or new is None:
+            return old == new
+        return math.isclose(old, new, rel_tol=1e-6)
+
+
+_PRICE_CACHE: Optional[PriceCache] = None
+_PRICE_CACHE_LOCK = threading.Lock()
+
+
+def get_price_cache() -> PriceCache:
+    """Get the process-wide price cache, in the user cache directory."""
+    global _PRICE_CACHE  # pylint: disable=global-statement  # noqa: PLW0603
+
+    with _PRICE_CACHE_LOCK:
+        if _PRICE_CACHE is None:
+            # pylint: disable=import-outside-toplevel
+            from openbb_core.app.utils import get_user_cache_directory
+
+            _PRICE_CACHE = PriceCache(Path(get_user_cache_directory(), "prices.sqlite"))
+        return _PRICE_CACHE
+
+
+def set_price_cache(cache: Optional[PriceCache]) -> None:
+    """Set the process-wide price cache, None to create the default one on next use."""
+    global _PRICE_CACHE  # pylint: disable=global-statement  # noqa: PLW0603
+
+    with _PRICE_CACHE_LOCK:
+        _PRICE_CACHE = cache
+
+
+async def fetch_with_price_cache(
+    fetcher: "type[Fetcher]",
+    query: QueryParams,
+    fetch: Callable[[QueryParams], Awaitable[Any]],
+) -> Any:
+    """Answer a historical price query from the price cache, fetching only the gaps.
+
+    Parameters
+    ----------
+    fetcher : type[Fetcher]
+        The fetcher of the query.
+    query : QueryParams
+        The transformed query, with its start and end dates.
+    fetch : Callable[[QueryParams], Awaitable[Any]]
+        Coroutine function extracting and transforming the data of a query.
+
+    Returns
+    -------
+    Any
+        The rows of the query, or the provider results when they can't be stored.
+    """
+    start: date = query.start_date  # type: ignore[attr-defined]
+    end: date = query.end_date  # type: ignore[attr-defined]
+
+    async def fetch_range(range_start: date, range_end: date) -> Any:
+        return await fetch(
+            query.model_copy(update={"start_date": range_start, "end_date": range_end})
+        )
+
+    rows = await get_price_cache().get_or_fetch(
+        PriceCache.make_key(fetcher, query), start, end, fetch_range
+    )
+    return await fetch(query) if rows is None else rows
@@ -0,0 +1,200 @@
+"""Provider rate limiter."""
+
+import asyncio
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+class RateLimit(NamedTuple):
+    """Request quota of a provider.
+
+    Parameters
+    ----------
+    requests_per_second : Optional[float]
+        Sustained request rate, None means unlimited. Use fractions for
+        per-minute quotas, for example 5 / 60 for 5 requests per minute.
+    burst : int
+        Requests that can be sent at once before the rate applies, by default 1.
+    max_concurrent : Optional[int]
+        Maximum number of requests in flight, None means unlimited.
+    max_retries : int
+        Retries of a request answered with HTTP 429, by default 3.
+    backoff : float
+        Seconds to wait before the first retry when the response has no
+        Retry-After header, doubled on each retry, by default 1.
+    """
+
+    requests_per_second: Optional[float] = None
+    burst: int = 1
+    max_concurrent: Optional[int] = None
+    max_retries: int = 3
+    backoff: float = 1.0
+
+
+class RateLimiter:
+    """Token bucket rate limiter with a concurrency governor.
+
+    The token bucket is shared by every thread and event loop of the process.
+    Concurrency is limited per event loop, since asyncio primitives can't be
+    shared between loops.
+    """
+
+    def __init__(self, rate_limit: RateLimit) -> None:
+        """Initialize the rate limiter."""
+        self.rate_limit = rate_limit
+        self._tokens = float(max(rate_limit.burst, 1))
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._semaphores: Dict[
+            int, Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]
+        ] = {}
+
+    def _reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it."""
+        rate = self.rate_limit.requests_per_second
+        if not rate:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            capacity = float(max(self.rate_limit.burst, 1))
+            self._tokens = min(capacity, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            # Tokens can go negative, which queues the callers in arrival order.
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / rate
+
+    def _semaphore(self) -> Optional[asyncio.Semaphore]:
+        """Get the concurrency semaphore of the running event loop."""
+        if not self.rate_limit.max_concurrent:
+            return None
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for loop_id, (other, _) in list(self._semaphores.items()):
+                if other.is_closed():
+                    del self._semaphores[loop_id]
+            if id(loop) not in self._semaphores:
+                self._semaphores[id(loop)] = (
+                    loop,
+                    asyncio.Semaphore(self.rate_limit.max_concurrent),
+                )
+            return self._semaphores[id(loop)][1]
+
+    async def __aenter__(self) -> "RateLimiter":
+        """Wait for a concurrency slot and a token."""
+        semaphore = self._semaphore()
+        if semaphore is not None:
+            await semaphore.acquire()
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Release the concurrency slot."""
+        semaphore = self._semaphore()
+        if semaphore is not None:
+            semaphore.release()
+
+    def wait(self) -> None:
+        """Block until a token is available, for synchronous requests."""
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+
+    def retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Get the seconds to wait before retrying a rate limited request.
+
+        Parameters
+        ----------
+        attempt : int
+            Number of the retry, starting at 0.
+        retry_after : Optional[str]
+            Value of the Retry-After header, either seconds or an HTTP date.
+        """
+        if retry_after:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
+            except (TypeError, ValueError):
+                pass
+        return self.rate_limit.backoff * 2**attempt
+
+
+# Rate limiter of the provider running the current fetcher.
+# It is set by the query executor and honored by the request helpers.
+RATE_LIMITER: ContextVar[Optional[RateLimiter]] = ContextVar(
+    "RATE_LIMITER", default=None
+)
+
+_LIMITERS: Dict[str, RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(
+    provider: str, rate_limit: Optional[RateLimit] = None
+) -> Optional[RateLimiter]:
+    """Get the process-wide rate limiter of a provider.
+
+    Parameters
+    ----------
+    provider : str
+        Name of the provider.
+    rate_limit : Optional[RateLimit]
+        Rate limit declared by the provider, used when the limiter is created.
+        The fields set for the provider in OPENBB_RATE_LIMITS replace its values.
+
+    Returns
+    -------
+    Optional[RateLimiter]
+        The limiter, None if the provider has no rate limit.
+    """
+    with _LIMITERS_LOCK:
+        if provider not in _LIMITERS:
+            rate_limit = _configured_rate_limit(provider, rate_limit)
+            if rate_limit is None:
+                return None
+            _LIMITERS[provider] = RateLimiter(rate_limit)
+        return _LIMITERS[provider]
+
+
+def _configured_rate_limit(
+    provider: str, rate_limit: Optional[RateLimit]
+) -> Optional[RateLimit]:
+    """Apply the quota set in OPENBB_RATE_LIMITS for a provider to its declared one."""
+    # pylint: disable=import-outside-toplevel
+    from openbb_core.env import Env
+
+    overrides = Env().RATE_LIMITS.get(provider)
+    if not overrides:
+        return rate_limit
+    unknown = set(overrides) - set(RateLimit._fields)
+    if unknown:
+        raise ValueError(
+            f"Unknown rate limit fields for '{provider}' in OPENBB_RATE_LIMITS:"
+            f" {', '.join(sorted(unknown))}."
+        )
+    return (rate_limit or RateLimit())._replace(**overrides)
+
+
+def set_rate_limit(provider: str, rate_limit: Optional[RateLimit]) -> None:
+    """Override the rate limit of a provider, for example to match a subscription.
+
+    Parameters
+    ----------
+    provider : str
+        Name of the provider.
+    rate_limit : Optional[RateLimit]
+        The new rate limit, None restores the one declared by the provider.
+    """
+    with _LIMITERS_LOCK:
+        _LIMITERS.pop(provider, None)
+        if rate_limit is not None:
+            _LIMITERS[provider] = RateLimiter(rate_limit)
@@ -0,0 +1,208 @@
+"""Fetcher result cache."""
+
+import asyncio
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from openbb_core.provider.abstract.annotated_result import AnnotatedResult
+from openbb_core.provider.abstract.columnar_result import ColumnarResult
+
+Fetch = Callable[[], Awaitable[Any]]
+
+
+class ResultCache:
+    """In-memory cache of transformed fetcher results.
+
+    Entries are fresh for `ttl` seconds. If a `stale_ttl` is given, expired entries
+    are still returned for that many extra seconds while they are refreshed in the
+    background (stale-while-revalidate). Concurrent misses on the same key share a
+    single fetch.
+    """
+
+    def __init__(self, max_entries: int = 512) -> None:
+        """Initialize the cache.
+
+        Parameters
+        ----------
+        max_entries : int
+            Maximum number of results, the least recently used are evicted first.
+        """
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, Tuple[float, float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[int, str], asyncio.Future[Any]] = {}
+        self._refreshes: Set[asyncio.Task[Any]] = set()
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        query: Dict[str, Any],
+        credentials: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Make the key of a query.
+
+        Parameters
+        ----------
+        provider : str
+            Name of the provider.
+        model : str
+            Name of the model.
+        query : Dict[str, Any]
+            Validated query parameters.
+        credentials : Optional[Dict[str, str]]
+            Credentials used for the query, only a fingerprint is kept in the key.
+        """
+        payload = json.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "query": query,
+                "credentials": credentials or {},
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        """Deep copy a result, so callers can't alter the cached one.
+
+        Columnar results are read-only, so they are shared.
+        """
+        if isinstance(value, ColumnarResult):
+            return value
+        if isinstance(value, AnnotatedResult):
+            return value.model_copy(
+                update={
+                    "result": ResultCache._copy(value.result),
+                    "metadata": copy.deepcopy(value.metadata),
+                }
+            )
+        return copy.deepcopy(value)
+
+    def _get(self, key: str) -> Tuple[Optional[str], Any]:
+        """Get an entry and its state: 'fresh', 'stale' or None if missing."""
+        now = time.time()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None, None
+            expires, stale_until, value = item
+            if now < expires:
+                self._data.move_to_end(key)
+                return "fresh", value
+            if now < stale_until:
+                return "stale", value
+            del self._data[key]
+            return None, None
+
+    def _set(self, key: str, value: Any, ttl: int, stale_ttl: int) -> None:
+        """Set an entry."""
+        expires = time.time() + ttl
+        with self._lock:
+            self._data[key] = (expires, expires + stale_ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    async def _fetch(self, key: str, fetch: Fetch, ttl: int, stale_ttl: int) -> Any:
+        """Fetch a result, sharing the fetch with concurrent callers."""
+        pending_key = (id(asyncio.get_running_loop()), key)
+        if pending_key in self._pending:
+            return await asyncio.shield(self._pending[pending_key])
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._pending[pending_key] = future
+        try:
+            value = await fetch()
+            self._set(key, value, ttl, stale_ttl)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved, waiters get it anyway.
+            future.exception()
+            raise
+        finally:
+            self._pending.pop(pending_key, None)
+
+    async def get_or_fetch(
+        self, key: str, fetch: Fetch, ttl: int, stale_ttl: int = 0
+    ) -> Any:
+        """Get a cached result or fetch it.
+
+        Parameters
+        ----------
+        key : str
+            Key of the result, see `make_key`.
+        fetch : Callable[[], Awaitable[Any]]
+            Coroutine function that fetches the result.
+        ttl : int
+            Seconds the result is fresh.
+        stale_ttl : int
+            Extra seconds an expired result is served while it is refreshed, by default 0.
+
+        Returns
+        -------
+        Any
+            A copy of the result container.
+        """
+        state, value = self._get(key)
+        if state == "stale":
+            pending_key = (id(asyncio.get_running_loop()), key)
+            if pending_key not in self._pending:
+                task = asyncio.create_task(self._fetch(key, fetch, ttl, stale_ttl))
+                self._refreshes.add(task)
+                task.add_done_callback(self._refresh_done)
+        elif state is None:
+            value = await self._fetch(key, fetch, ttl, stale_ttl)
+        return self._copy(value)
+
+    def _refresh_done(self, task: "asyncio.Task[Any]") -> None:
+        """Forget a finished background refresh, a failed one keeps the stale entry."""
+        self._refreshes.discard(task)
+        if not task.cancelled():
+            task.exception()
+
+    async def cancel_refreshes(self) -> None:
+        """Cancel the background refreshes of the running event loop.
+
+        Used before closing short-lived event loops, where the refreshes can't complete.
+        """
+        loop = asyncio.get_running_loop()
+        tasks = [t for t in self._refreshes if t.get_loop() is loop]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def clear(self) -> None:
+        """Delete all the results."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """Return the number of results."""
+        return len(self._data)
+
+
+_RESULT_CACHE: Optional[ResultCache] = None
+_RESULT_CACHE_LOCK = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """Get the process-wide result cache."""
+    global _RESULT_CACHE  # pylint: disable=global-statement  # noqa: PLW0603
+    with _RESULT_CACHE_LOCK:
+        if _RESULT_CACHE is None:
+            _RESULT_CACHE = ResultCache()
+        return _RESULT_CACHE
@@ -0,0 +1,183 @@
+"""Shared aiohttp session pool."""
+
+import asyncio
+import socket
+import threading
+from contextlib import suppress
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+from yarl import URL
+
+from openbb_core.env import Env
+from openbb_core.provider.utils.client import ClientSession
+
+
+class PoolConnector(aiohttp.TCPConnector):
+    """Keep-alive connector that can drop its connections without its event loop."""
+
+    def release(self) -> None:
+        """Drop the connections of a connector whose event loop is closed.
+
+        The transports can't be closed without their loop, so their sockets are
+        shut down, which ends the connections, and the connector is closed to
+        release the transports.
+        """
+        protocols = [proto for conns in self._conns.values() for proto, _ in conns]
+        for proto in [*protocols, *self._acquired]:
+            transport = proto.transport
+            sock = transport.get_extra_info("socket") if transport else None
+            if sock is not None:
+                with suppress(OSError):
+                    sock.shutdown(socket.SHUT_RDWR)
+        self.close()
+
+
+class SessionPool:
+    """Process-wide pool of shared ClientSessions.
+
+    Sessions are bound to the event loop that created them, so the pool is keyed
+    by (event loop, key), where the key is usually a provider name or a host.
+    Reusing a session keeps the connections alive between requests and avoids
+    paying the TCP/TLS handshakes and DNS lookups on every call.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        limit_per_host: Optional[int] = None,
+        keepalive_timeout: Optional[float] = None,
+        ttl_dns_cache: int = 300,
+    ) -> None:
+        """Initialize the session pool.
+
+        Parameters
+        ----------
+        limit : Optional[int]
+            Total number of simultaneous connections per session.
+            Defaults to the OPENBB_HTTP_POOL_LIMIT environment variable.
+        limit_per_host : Optional[int]
+            Number of simultaneous connections to the same endpoint, 0 means unlimited.
+            Defaults to the OPENBB_HTTP_POOL_LIMIT_PER_HOST environment variable.
+        keepalive_timeout : Optional[float]
+            Seconds an idle connection is kept open.
+            Defaults to the OPENBB_HTTP_KEEPALIVE_TIMEOUT environment variable.
+        ttl_dns_cache : int
+            Seconds a resolved DNS entry is cached, by default 300.
+        """
+        env = Env()
+        self.limit = env.HTTP_POOL_LIMIT if limit is None else limit
+        self.limit_per_host = (
+            env.HTTP_POOL_LIMIT_PER_HOST if limit_per_host is None else limit_per_host
+        )
+        self.keepalive_timeout = (
+            env.HTTP_KEEPALIVE_TIMEOUT
+            if keepalive_timeout is None
+            else keepalive_timeout
+        )
+        self.ttl_dns_cache = ttl_dns_cache
+        self._sessions: Dict[Tuple[int, str], ClientSession] = {}
+        self._loops: Dict[int, asyncio.AbstractEventLoop] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_from_url(url: str) -> str:
+        """Get the pool key, the host, of a url."""
+        return URL(url).host or ""
+
+    def _make_session(self, **kwargs: Any) -> ClientSession:
+        """Create a new session with a keep-alive connector."""
+        connector = PoolConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+        return ClientSession(connector=connector, **kwargs)
+
+    def _prune(self) -> None:
+        """Forget the sessions bound to closed event loops."""
+        for loop_id, loop in list(self._loops.items()):
+            if not loop.is_closed():
+                continue
+            self._loops.pop(loop_id, None)
+            for k in [k for k in self._sessions if k[0] == loop_id]:
+                connector = self._sessions.pop(k).connector
+                if isinstance(connector, PoolConnector):
+                    connector.release()
+
+    def get_session(self, key: str = "", **kwargs: Any) -> ClientSession:
+        """Get the shared session for a key in the running event loop.
+
+        Parameters
+        ----------
+        key : str
+            Pool key, for example a provider name or a host.
+        **kwargs
+            Extra arguments used only when the session is created.
+
+        Returns
+        -------
+        ClientSession
+            The shared session.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._prune()
+            session = self._sessions.get((id(loop), key))
+            if session is None or session.closed:
+                session = self._make_session(**kwargs)
+                self._sessions[(id(loop), key)] = session
+                self._loops[id(loop)] = loop
+            return session
+
+    async def close(self, key: Optional[str] = None) -> None:
+        """Close the sessions of the running event loop.
+
+        Parameters
+        ----------
+        key : Optional[str]
+            Close only the session of this key, by default all of them.
+        """
+        loop_id = id(asyncio.get_running_loop())
+        with self._lock:
+            sessions = [
+                self._sessions.pop(k)
+                for k in list(self._sessions)
+                if k[0] == loop_id and (key is None or k[1] == key)
+            ]
+            if not any(k[0] == loop_id for k in self._sessions):
+                self._loops.pop(loop_id, None)
+        await asyncio.gather(
+            *[s.close() for s in sessions if not s.closed], return_exceptions=True
+        )
+
+    def __len__(self) -> int:
+        """Return the number of pooled sessions."""
+        return len(self._sessions)
+
+
+_POOL: Optional[SessionPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_session_pool() -> SessionPool:
+    """Get the process-wide session pool."""
+    global _POOL  # pylint: disable=global-statement  # noqa: PLW0603
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = SessionPool()
+        return _POOL
+
+
+def get_session(url_or_key: str, **kwargs: Any) -> ClientSession:
+    """Get the shared session for a url or a key in the running event loop."""
+    pool = get_session_pool()
+    key = pool.key_from_url(url_or_key) if "://" in url_or_key else url_or_key
+    return pool.get_session(key, **kwargs)
+
+
+async def close_sessions() -> None:
+    """Close all the shared sessions of the running event loop."""
+    if _POOL is not None:
+        await _POOL.close()
@@ -0,0 +1,97 @@
+"""Test the response format helpers."""
+
+# pylint: disable=W0621
+
+import json
+from io import BytesIO
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from openbb_core.api.router.helpers.response_helpers import (
+    build_response,
+    get_response_format,
+)
+from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_core.app.model.abstract.warning import Warning_
+from openbb_core.app.model.obbject import OBBject
+from openbb_core.provider.abstract.data import Data
+
+
+@pytest.fixture
+def client():
+    """Return a client of an app responding in the requested format."""
+    app = FastAPI()
+
+    @app.get("/command")
+    async def command(request: Request):
+        obbject = OBBject(
+            results=[Data(date="2024-01-0" + str(i), close=float(i)) for i in (1, 2)],  # type: ignore[call-arg]
+            provider="test",
+            warnings=[Warning_(category="UserWarning", message="Test warning")],
+        )
+        return build_response(obbject, get_response_format(request) or "ndjson")
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "query, accept, expected",
+    [
+        ("", "application/json", None),
+        ("format=json", "application/x-ndjson", None),
+        ("format=NDJSON", "", "ndjson"),
+        ("", "application/vnd.apache.arrow.stream", "arrow"),
+        ("", "application/vnd.apache.parquet, */*", "parquet"),
+    ],
+)
+def test_get_response_format(query, accept, expected):
+    """Test the format is taken from the query, then the Accept header."""
+    request = Request(
+        {
+            "type": "http",
+            "query_string": query.encode(),
+            "headers": [(b"accept", accept.encode())],
+        }
+    )
+    assert get_response_format(request) == expected
+
+
+def test_get_response_format_unsupported():
+    """Test unsupported formats are rejected."""
+    request = Request({"type": "http", "query_string": b"format=xml", "headers": []})
+    with pytest.raises(OpenBBError, match="Unsupported response format"):
+        get_response_format(request)
+
+
+def test_ndjson_response(client):
+    """Test the NDJSON response has a record per line."""
+    response = client.get("/command?format=ndjson")
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["x-openbb-provider"] == "test"
+    assert json.loads(response.headers["x-openbb-warnings"])[0]["message"] == (
+        "Test warning"
+    )
+    lines = response.text.splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"date": "2024-01-01", "close": 1.0},
+        {"date": "2024-01-02", "close": 2.0},
+    ]
+
+
+@pytest.mark.parametrize("response_format", ["arrow", "parquet"])
+def test_arrow_responses(client, response_format):
+    """Test the Arrow IPC stream and Parquet responses."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    response = client.get(f"/command?format={response_format}")
+
+    source = BytesIO(response.content)
+    table = (
+        pa.ipc.open_stream(source).read_all()
+        if response_format == "arrow"
+        else pq.read_table(source)
+    )
+    assert table.column("close").to_pylist() == [1.0, 2.0]
@@ -7,7 +7,7 @@ from unittest.mock import patch
 def test_credentials():
     """Test the Credentials model."""
     with patch(
-        target="openbb_core.app.model.credentials.ProviderInterface"
+        target="openbb_core.app.model.credentials.RegistryLoader"
     ) as mock_provider_interface:
         mock_provider_interface.credentials = {
             "benzinga_api_key": (typing.Optional[str], None),
@@ -1,6 +1,6 @@
 """Tests for the OBBject class."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
@@ -355,6 +355,27 @@ def test_to_dict(results, expected_dict):
         assert str(exc_info.value) == str(expected_dict)
 
 
+def test_to_dataframe_cached():
+    """Test the DataFrame is built once until the results are reassigned."""
+    co: OBBject = OBBject(results=[MockData(x=1, y=2), MockData(x=3, y=4)])
+
+    with patch(
+        "openbb_core.app.model.obbject.basemodel_to_df", wraps=basemodel_to_df
+    ) as mock_basemodel_to_df:
+        first = co.to_dataframe(index=None)
+        first["x"] = 0
+        second = co.to_dataframe(index=None)
+        assert mock_basemodel_to_df.call_count == 1
+        assert second["x"].tolist() == [1, 3]
+
+        co.to_dataframe(index="x")
+        assert mock_basemodel_to_df.call_count == 2
+
+        co.results = [MockData(x=5, y=6)]
+        assert co.to_dataframe(index=None)["x"].tolist() == [5]
+        assert mock_basemodel_to_df.call_count == 3
+
+
 def test_show_chart_exists():
     """Test helper."""
     mock_instance: OBBject = OBBject()
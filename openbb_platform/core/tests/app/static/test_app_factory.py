@@ -1,12 +1,19 @@
 """Test static app factory."""
 
-# pylint: disable=redefined-outer-name
+# pylint: disable=redefined-outer-name,protected-access
+
+from functools import partial
+from unittest.mock import patch
 
 import pytest
+from openbb_core.app.command_runner import CommandRunner
+from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_core.app.model.obbject import OBBject
 from openbb_core.app.model.system_settings import SystemSettings
 from openbb_core.app.model.user_settings import UserSettings
 from openbb_core.app.static.account import Account
 from openbb_core.app.static.app_factory import create_app
+from openbb_core.app.static.container import Container
 from openbb_core.app.static.coverage import Coverage
 
 
@@ -54,3 +61,43 @@ def test_app_reference(app_factory):
     reference = app_factory.reference
     assert reference
     assert isinstance(reference, dict)
+
+
+def test_app_batch(app_factory):
+    """Test app batch keeps the order and returns the errors."""
+
+    class MockRouter(Container):
+        """Mock router."""
+
+        def command(self, symbol: str):
+            """Mock command."""
+            if symbol == "BAD":
+                raise ValueError("Invalid symbol")
+            return self._run("/mock/command", standard_params={"symbol": symbol})
+
+    router = MockRouter(app_factory._command_runner)
+    outputs = [OBBject(results=[{"symbol": s}]) for s in ("AAPL", "MSFT")]
+    calls = [
+        partial(router.command, "AAPL"),
+        partial(router.command, "BAD"),
+        partial(router.command, "MSFT"),
+        lambda: "not a command",
+    ]
+
+    with patch.object(
+        CommandRunner, "sync_run_many", return_value=outputs
+    ) as mock_run_many:
+        results = app_factory.batch(calls, max_concurrency=2)
+
+    mock_run_many.assert_called_once_with(
+        [
+            ("/mock/command", {"standard_params": {"symbol": "AAPL"}}),
+            ("/mock/command", {"standard_params": {"symbol": "MSFT"}}),
+        ],
+        max_concurrency=2,
+        provider_limits=None,
+    )
+    assert results[0] is outputs[0]
+    assert isinstance(results[1], ValueError)
+    assert results[2] is outputs[1]
+    assert isinstance(results[3], OpenBBError)
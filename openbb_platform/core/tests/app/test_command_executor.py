@@ -0,0 +1,96 @@
+"""Test the execution of CPU-bound commands."""
+
+import asyncio
+import os
+import time
+import warnings
+from typing import List
+
+import pytest
+from openbb_core.app.command_executor import (
+    from_arrow_buffer,
+    is_cpu_bound,
+    run_cpu_bound,
+    to_arrow_buffer,
+)
+from openbb_core.app.model.abstract.warning import record_warnings
+from openbb_core.app.model.obbject import OBBject
+from openbb_core.app.router import Router
+from openbb_core.provider.abstract.columnar_result import ColumnarResult
+from openbb_core.provider.abstract.data import Data
+
+router = Router(prefix="")
+
+
+@router.command(methods=["POST"], cpu_bound=True)
+def double(data: List[Data], target: str) -> OBBject[List[Data]]:
+    """Double the target column, warning with the process id."""
+    warnings.warn(str(os.getpid()))
+    return OBBject(
+        results=[Data(date=d.date, value=getattr(d, target) * 2) for d in data]
+    )
+
+
+@router.command(methods=["POST"], cpu_bound=True)
+def name_warnings(name: str) -> OBBject[List[str]]:
+    """Warn three times with the name."""
+    for i in range(3):
+        warnings.warn(f"{name} {i}")
+        time.sleep(0.01)
+    return OBBject(results=[name])
+
+
+DATA = [Data(date=f"2024-01-0{i}", close=float(i)) for i in range(1, 6)]
+
+
+def test_is_cpu_bound():
+    """Test the commands are tagged by the router."""
+    assert is_cpu_bound(double)
+    assert not is_cpu_bound(lambda: None)
+
+
+def test_arrow_buffer():
+    """Test a list of Data is sent as an Arrow IPC stream."""
+    pytest.importorskip("pyarrow")
+    buffer = to_arrow_buffer(DATA)
+    assert buffer is not None
+    result = from_arrow_buffer(buffer)
+    assert isinstance(result, ColumnarResult)
+    assert [d.model_dump() for d in result] == [d.model_dump() for d in DATA]
+
+
+def test_arrow_buffer_mixed_types():
+    """Test columns with mixed types are not sent as an Arrow IPC stream."""
+    pytest.importorskip("pyarrow")
+    assert to_arrow_buffer([Data(value=1.0), Data(value="a")]) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", ["inline", "thread", "process"])
+async def test_run_cpu_bound(kind):
+    """Test the command output is the same wherever it runs."""
+    pytest.importorskip("pyarrow")
+    with warnings.catch_warnings(record=True) as warning_list:
+        warnings.simplefilter("always")
+        obbject = await run_cpu_bound(
+            double, {"data": DATA, "target": "close"}, kind=kind
+        )
+
+    assert [d.value for d in obbject.results] == [2.0, 4.0, 6.0, 8.0, 10.0]
+    assert isinstance(obbject.results, ColumnarResult) == (kind == "process")
+    assert len(warning_list) == 1
+    assert (str(warning_list[0].message) == str(os.getpid())) == (kind != "process")
+
+
+@pytest.mark.asyncio
+async def test_run_cpu_bound_concurrent_warnings():
+    """Test concurrent commands in threads each raise their own warnings."""
+
+    async def run(name):
+        with record_warnings() as warning_list:
+            await run_cpu_bound(name_warnings, {"name": name}, kind="thread")
+        return [str(w.message) for w in warning_list]
+
+    results = await asyncio.gather(run("a"), run("b"))
+
+    assert results == [[f"{name} {i}" for i in range(3)] for name in ["a", "b"]]
@@ -1,9 +1,11 @@
 """Test command runner."""
 
+import asyncio
 from dataclasses import dataclass
 from inspect import Parameter
 from typing import Dict, List
 from unittest.mock import Mock, patch
+from warnings import warn
 
 import pytest
 from fastapi import Query
@@ -16,6 +18,7 @@ from openbb_core.app.command_runner import (
 )
 from openbb_core.app.model.abstract.warning import OpenBBWarning
 from openbb_core.app.model.command_context import CommandContext
+from openbb_core.app.model.obbject import OBBject
 from openbb_core.app.model.system_settings import SystemSettings
 from openbb_core.app.model.user_settings import UserSettings
 from openbb_core.app.provider_interface import ExtraParams
@@ -402,3 +405,69 @@ async def test_static_command_runner_command():
 
     assert result.results == [1, 2, 3, 4]
     assert result.provider == "mock_provider"
+
+
+@pytest.mark.asyncio
+@patch("openbb_core.app.command_runner.LoggingService")
+async def test_command_runner_run_many(_):
+    """Test run_many keeps the order, limits concurrency and returns the errors."""
+    runner = CommandRunner()
+    running = {"all": 0, "fmp": 0}
+    peak = {"all": 0, "fmp": 0}
+
+    async def mock_run(route, user_settings=None, /, **kwargs):
+        provider = kwargs["provider_choices"]["provider"]
+        keys = ["all", "fmp"] if provider == "fmp" else ["all"]
+        for k in keys:
+            running[k] += 1
+            peak[k] = max(peak[k], running[k])
+        await asyncio.sleep(0.01)
+        for k in keys:
+            running[k] -= 1
+        if route == "fail":
+            raise ValueError(route)
+        return route
+
+    commands = [
+        (f"route_{i}", {"provider_choices": {"provider": p}})
+        for i, p in enumerate(["fmp"] * 4 + ["polygon"] * 4)
+    ]
+    commands.insert(3, ("fail", {"provider_choices": {"provider": "fmp"}}))
+
+    with patch.object(runner, "run", mock_run):
+        results = await runner.run_many(
+            commands, max_concurrency=3, provider_limits={"fmp": 1}
+        )
+
+    assert results[:3] == ["route_0", "route_1", "route_2"]
+    assert isinstance(results[3], ValueError)
+    assert results[4:] == [f"route_{i}" for i in range(3, 8)]
+    assert peak == {"all": 3, "fmp": 1}
+
+
+@pytest.mark.asyncio
+@patch("openbb_core.app.command_runner.LoggingService")
+@patch("openbb_core.app.command_runner.ParametersBuilder.build")
+async def test_execute_func_concurrent_warnings(mock_build, _, execution_context):
+    """Test concurrent commands each record their own warnings."""
+    mock_build.side_effect = lambda **kwargs: kwargs["kwargs"]
+    execution_context.user_settings.preferences.show_warnings = False
+
+    async def mock_command(func, kwargs):
+        for i in range(3):
+            warn(f"{kwargs['name']} {i}", OpenBBWarning)
+            await asyncio.sleep(0.01)
+        return OBBject(results=[kwargs["name"]])
+
+    with patch.object(StaticCommandRunner, "_command", side_effect=mock_command):
+        outputs = await asyncio.gather(
+            *[
+                StaticCommandRunner._execute_func(
+                    "mock/route", (), execution_context, lambda: None, {"name": name}
+                )
+                for name in ["a", "b"]
+            ]
+        )
+
+    for name, output in zip(["a", "b"], outputs):
+        assert [w.message for w in output.warnings] == [f"{name} {i}" for i in range(3)]
@@ -1,5 +1,11 @@
 """OpenBB Platform Core app utils tests."""
 
+import gc
+import json
+import os
+import time
+from datetime import date
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -158,3 +164,108 @@ def test_check_single_item(item, expected):
             check_single_item(item)
     else:
         assert check_single_item(item) == expected
+
+
+def test_df_to_basemodel_values():
+    """Test the df_to_basemodel helper converts dates and missing values."""
+    df_dates = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=3, freq="D"),
+            "close": [1.0, np.nan, np.inf],
+            "volume": np.array([1, 2, 3], dtype=np.int64),
+        }
+    )
+    base_model = df_to_basemodel(df_dates)
+    assert base_model[0].model_dump() == {
+        "date": "2024-01-01",
+        "close": 1.0,
+        "volume": 1,
+    }
+    assert base_model[1].close is None  # type: ignore[attr-defined]
+    assert base_model[2].close is None  # type: ignore[attr-defined]
+    assert type(base_model[2].volume) is int  # type: ignore[attr-defined]
+
+
+def test_basemodel_to_df_round_trip():
+    """Test the date column survives a round trip through the helpers."""
+    dates = pd.date_range("2024-01-01 09:30", periods=3, freq="h")
+    df_intraday = pd.DataFrame({"date": dates, "close": [1.0, 2.0, 3.0]})
+
+    result = basemodel_to_df(df_to_basemodel(df_intraday), index="date")
+    assert (result.index == dates).all()
+
+    result = basemodel_to_df(df_to_basemodel(df_intraday.iloc[:1]), index="date")
+    assert str(result.index[0]) == "2024-01-01 09:30:00"
+
+    daily = [Data(date="2024-01-02", close=1.0), Data(date="2024-01-01", close=2.0)]  # type: ignore[call-arg]
+    result = basemodel_to_df(daily, index="date")
+    assert result.index.tolist() == [date(2024, 1, 1), date(2024, 1, 2)]
+
+
+def test_df_to_basemodel_construct():
+    """Test the records built without validation are the validated ones."""
+    df_ohlc = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=3, freq="D"),
+            "close": [1.0, np.nan, 3.0],
+            "symbol": ["A", "B", "A"],
+        }
+    )
+
+    validated = df_to_basemodel(df_ohlc)
+    constructed = df_to_basemodel(df_ohlc, validate=False)
+
+    assert constructed == validated
+    assert [type(d) for d in constructed] == [Data] * 3
+    assert [d.model_dump_json() for d in constructed] == [
+        d.model_dump_json() for d in validated
+    ]
+    assert constructed[0].model_fields_set == {"date", "close", "symbol"}
+    constructed[0].volume = 10  # type: ignore[attr-defined]
+    assert constructed[0].model_dump()["volume"] == 10
+    assert validated[0].model_dump() == {
+        "date": "2024-01-01",
+        "close": 1.0,
+        "symbol": "A",
+    }
+    assert df_to_basemodel(df_multiindex, validate=False) == df_to_basemodel(
+        df_multiindex
+    )
+    assert gc.isenabled()
+
+
+def test_df_to_basemodel_benchmark():
+    """Benchmark the conversion of an OHLCV frame against the JSON round trip it replaced.
+
+    Set OPENBB_BENCHMARK_ROWS, e.g. to 1000000, to run it on more rows.
+    """
+    rows = int(os.environ.get("OPENBB_BENCHMARK_ROWS", "50000"))
+    rng = np.random.default_rng(0)
+    df_ohlcv = pd.DataFrame(
+        {
+            "date": pd.date_range("2000-01-01", periods=rows, freq="min"),
+            **{c: rng.random(rows) for c in ["open", "high", "low", "close"]},
+            "volume": rng.integers(0, 1000, rows),
+        }
+    )
+
+    def timed(func):
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+
+    json_round_trip = timed(
+        lambda: [
+            Data(**d)
+            for d in json.loads(df_ohlcv.to_json(orient="records", date_format="iso"))
+        ]
+    )
+    validated = timed(lambda: df_to_basemodel(df_ohlcv))
+    constructed = timed(lambda: df_to_basemodel(df_ohlcv, validate=False))
+    print(  # noqa: T201
+        f"{rows} rows: JSON round trip {json_round_trip:.2f}s,"
+        f" validated {validated:.2f}s, constructed {constructed:.2f}s"
+    )
+
+    assert constructed < json_round_trip
+    assert validated < json_round_trip
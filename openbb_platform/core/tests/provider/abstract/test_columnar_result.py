@@ -0,0 +1,70 @@
+"""Test the ColumnarResult class."""
+
+# pylint: disable=W0621
+
+from datetime import date
+
+import pytest
+from openbb_core.app.model.obbject import OBBject
+from openbb_core.provider.abstract.columnar_result import ColumnarResult
+from openbb_core.provider.abstract.data import Data
+
+pa = pytest.importorskip("pyarrow")
+
+
+class MockData(Data):
+    """Mock data model."""
+
+    date: date
+    close: float
+
+
+@pytest.fixture
+def columnar_result():
+    """Return a columnar result."""
+    return ColumnarResult.from_pydict(
+        {
+            "date": [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)],
+            "close": [1.0, 2.0, 3.0],
+        },
+        MockData,
+    )
+
+
+def test_columnar_result_rows(columnar_result):
+    """Test the rows are built as Data when accessed."""
+    assert len(columnar_result) == 3
+    assert columnar_result[0] == MockData(date=date(2024, 1, 1), close=1.0)
+    assert columnar_result[-1].close == 3.0
+    assert [d.close for d in columnar_result] == [1.0, 2.0, 3.0]
+    with pytest.raises(IndexError):
+        columnar_result[3]  # pylint: disable=pointless-statement
+
+
+def test_columnar_result_slice(columnar_result):
+    """Test slices are columnar results."""
+    sliced = columnar_result[1:]
+    assert isinstance(sliced, ColumnarResult)
+    assert sliced.data_type is MockData
+    assert [d.close for d in sliced] == [2.0, 3.0]
+    assert [d.close for d in columnar_result[::2]] == [1.0, 3.0]
+
+
+def test_columnar_result_exports(columnar_result):
+    """Test the exports read the columns."""
+    assert columnar_result.to_arrow() is columnar_result.table
+    assert columnar_result.to_pandas()["close"].tolist() == [1.0, 2.0, 3.0]
+    assert columnar_result.to_numpy().shape == (3, 2)
+    assert columnar_result.to_records()[0] == {"date": date(2024, 1, 1), "close": 1.0}
+
+
+def test_obbject_columnar_results(columnar_result):
+    """Test the OBBject conversions of columnar results."""
+    obbject = OBBject(results=columnar_result)
+
+    assert obbject.to_arrow() is columnar_result.table
+    df = obbject.to_dataframe()
+    assert df.index.name == "date"
+    assert df["close"].tolist() == [1.0, 2.0, 3.0]
+    assert obbject.model_dump()["results"] == columnar_result.to_records()
+    assert '"results":[{"date":"2024-01-01","close":1.0}' in obbject.model_dump_json()
@@ -0,0 +1,82 @@
+"""Test the provider manifest."""
+
+# pylint: disable=W0621
+
+from unittest.mock import MagicMock
+
+import pytest
+from openbb_core.provider.abstract.fetcher import Fetcher
+from openbb_core.provider.abstract.provider import Provider
+from openbb_core.provider.manifest import LazyFetcherDict, ProviderManifest
+from openbb_core.provider.utils.rate_limiter import RateLimit
+
+
+class MockFetcher(Fetcher):
+    """Mock fetcher."""
+
+    @staticmethod
+    def extract_data(query, credentials, **kwargs):
+        """Extract the data."""
+        return []
+
+
+@pytest.fixture
+def entry_points():
+    """Return mock entry points."""
+    ep = MagicMock()
+    ep.name = "mock"
+    ep.value = "openbb_core.provider:mock_provider"
+    ep.module = "openbb_core.provider"
+    ep.dist.version = "1.0.0"
+    return [ep]
+
+
+@pytest.fixture
+def provider():
+    """Return a provider."""
+    return Provider(
+        name="mock",
+        description="Mock provider.",
+        credentials=["api_key"],
+        fetcher_dict={"MockModel": MockFetcher},
+        rate_limit=RateLimit(requests_per_second=5, max_concurrent=2),
+    )
+
+
+def test_lazy_fetcher_dict():
+    """Test the fetchers are imported when accessed."""
+    fetchers = LazyFetcherDict(
+        {"Model": "openbb_core.provider.abstract.fetcher:Fetcher"}
+    )
+    assert "Model" in fetchers
+    assert "Other" not in fetchers
+    assert list(fetchers) == ["Model"]
+    assert not fetchers._fetchers  # pylint: disable=protected-access
+    assert fetchers["Model"] is Fetcher
+    with pytest.raises(KeyError):
+        fetchers["Other"]  # pylint: disable=pointless-statement
+
+
+def test_manifest_round_trip(tmp_path, entry_points, provider):
+    """Test the providers are loaded back from a saved manifest."""
+    manifest = ProviderManifest(entry_points, tmp_path / "manifest.json")
+    assert manifest.load() is None
+
+    manifest.save({"mock": provider})
+    loaded = manifest.load()
+
+    assert loaded is not None
+    mock = loaded["mock"]
+    assert isinstance(mock.fetcher_dict, LazyFetcherDict)
+    assert mock.credentials == ["mock_api_key"]
+    assert mock.rate_limit == provider.rate_limit
+    assert mock.fetcher_dict["MockModel"] is MockFetcher
+
+
+def test_manifest_stale(tmp_path, entry_points, provider):
+    """Test a manifest built from other entry points is not used."""
+    path = tmp_path / "manifest.json"
+    ProviderManifest(entry_points, path).save({"mock": provider})
+
+    entry_points[0].dist.version = "2.0.0"
+    assert ProviderManifest(entry_points, path).load() is None
@@ -120,3 +120,50 @@ async def test_execute_success(mock_query_executor: QueryExecutor):
 
         assert result == mock_result
         mock_fetch.assert_called_once_with(params, {}, **{})
+
+
+@pytest.mark.asyncio
+async def test_execute_memoizes_results(mock_query_executor: QueryExecutor):
+    """Test results are memoized when the fetcher declares a result ttl."""
+    transformed = []
+
+    class MemoizedFetcher(Fetcher):
+        """Memoized fetcher."""
+
+        result_ttl = 60
+
+        @staticmethod
+        def transform_query(params):
+            query = MagicMock(model_dump=lambda: params)
+            transformed.append(query)
+            return query
+
+        @staticmethod
+        def extract_data(query, credentials):
+            return None
+
+    provider = mock_query_executor.get_provider("test_provider")
+    provider.fetcher_dict["memoized"] = MemoizedFetcher
+
+    with patch.object(
+        MemoizedFetcher, "fetch_query", return_value=["result"]
+    ) as mock_fetch:
+        for _ in range(2):
+            result = await mock_query_executor.execute(
+                "test_provider", "memoized", {"symbol": "AAPL"}
+            )
+            assert result == ["result"]
+        # The query made for the key is fetched, it is not transformed again.
+        mock_fetch.assert_called_once_with(transformed[0], {})
+        assert len(transformed) == 2
+
+    with patch.object(
+        MemoizedFetcher, "fetch_data", return_value=["result"]
+    ) as mock_fetch:
+        await mock_query_executor.execute(
+            "test_provider",
+            "memoized",
+            {"symbol": "AAPL"},
+            preferences={"use_cache": False},
+        )
+        mock_fetch.assert_called_once()
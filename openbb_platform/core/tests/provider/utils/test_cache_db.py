@@ -0,0 +1,102 @@
+"""Test the cache databases."""
+
+# pylint: disable=W0621
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from openbb_core.provider.utils.cache_db import (
+    CacheDatabase,
+    get_cache_db,
+    get_sqlite_backend,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Return a cache database with a table."""
+    db = CacheDatabase(tmp_path / "cache.sqlite", pool_size=4)
+    db.initialize(
+        "items",
+        lambda conn: conn.execute(
+            "CREATE TABLE IF NOT EXISTS items (key INTEGER PRIMARY KEY, value TEXT)"
+        ),
+    )
+    yield db
+    db.close()
+
+
+def test_wal_mode(db):
+    """Test the database is in WAL mode."""
+    assert db.execute("PRAGMA journal_mode") == [("wal",)]
+
+
+def test_get_cache_db_shared(tmp_path):
+    """Test the same file gets the same database."""
+    path = tmp_path / "shared.sqlite"
+    assert get_cache_db(path) is get_cache_db(str(path))
+    assert get_cache_db(path) is not get_cache_db(tmp_path / "other.sqlite")
+
+
+def test_transaction_rollback(db):
+    """Test a failed transaction writes nothing and releases the connection."""
+    with pytest.raises(ValueError), db.transaction() as conn:
+        conn.execute("INSERT INTO items VALUES (1, 'a')")
+        raise ValueError
+    assert db.execute("SELECT COUNT(*) FROM items") == [(0,)]
+
+
+def test_concurrent_writes(db):
+    """Test threads write concurrently through the pool without lock errors."""
+
+    def write(start):
+        db.executemany(
+            "INSERT INTO items VALUES (?, ?)",
+            [(i, str(i)) for i in range(start, start + 100)],
+        )
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(write, range(0, 1600, 100)))
+
+    assert db.execute("SELECT COUNT(*) FROM items") == [(1600,)]
+    assert len(db._idle) <= db.pool_size  # pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+async def test_aexecute(db):
+    """Test the statements run from a coroutine."""
+    await db.aexecutemany("INSERT INTO items VALUES (?, ?)", [(1, "a"), (2, "b")])
+    assert await db.aexecute("SELECT value FROM items ORDER BY key") == [
+        ("a",),
+        ("b",),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_sqlite_backend(tmp_path):
+    """Test the provider HTTP caches use the pooled database, in WAL mode."""
+    pytest.importorskip("aiohttp_client_cache")
+    backend = get_sqlite_backend(tmp_path / "http_cache", expire_after=60)
+    db = get_cache_db(tmp_path / "http_cache.sqlite")
+    assert backend.responses.db is db
+    assert backend.redirects.db is db
+
+    await backend.responses.write("a", {"value": 1})
+    await backend.responses.write("b", {"value": 2})
+    await backend.redirects.write("alias", "a")
+    assert await backend.responses.read("a") == {"value": 1}
+    assert await backend.responses.read("missing") is None
+    assert await backend.redirects.read("alias") == "a"
+    assert await backend.responses.contains("b")
+    assert [k async for k in backend.responses.keys()]  # noqa: SIM118 == ["a", "b"]
+    assert [v async for v in backend.responses.values()] == [
+        {"value": 1},
+        {"value": 2},
+    ]
+
+    await backend.responses.bulk_delete({"a"})
+    assert await backend.responses.size() == 1
+    await backend.clear()
+    assert await backend.responses.size() == 0
+    assert await backend.redirects.size() == 0
+    assert db.execute("PRAGMA journal_mode") == [("wal",)]
@@ -0,0 +1,136 @@
+"""Test the chunked date range downloads."""
+
+import asyncio
+from datetime import date, datetime, timedelta
+
+import pytest
+from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_core.provider.utils.date_range import (
+    DateRangeDownloader,
+    download_date_range,
+    split_date_range,
+)
+
+
+def daily_records(start: date, end: date):
+    """Return one record per day, from start to end."""
+    return [
+        {"date": (start + timedelta(days=i)).isoformat()}
+        for i in range((end - start).days + 1)
+    ]
+
+
+def test_split_date_range():
+    """Test the windows cover the range without overlapping."""
+    chunks = split_date_range(
+        datetime(2024, 1, 1, 12), date(2024, 1, 10), timedelta(days=4)
+    )
+    assert chunks == [
+        (date(2024, 1, 1), date(2024, 1, 4)),
+        (date(2024, 1, 5), date(2024, 1, 8)),
+        (date(2024, 1, 9), date(2024, 1, 10)),
+    ]
+    assert split_date_range(date(2024, 1, 2), date(2024, 1, 1), timedelta(days=1)) == []
+    with pytest.raises(OpenBBError):
+        split_date_range(date(2024, 1, 1), date(2024, 1, 2), timedelta(hours=1))
+
+
+@pytest.mark.asyncio
+async def test_download_date_range_concurrency_and_dedup():
+    """Test the windows are fetched concurrently, within the limit, and deduplicated."""
+    running = 0
+    max_running = 0
+
+    async def fetch(start, end):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        # Overlap the next window by one day.
+        return daily_records(start, end + timedelta(days=1))
+
+    results = await download_date_range(
+        fetch,
+        date(2024, 1, 1),
+        date(2024, 1, 31),
+        timedelta(days=3),
+        max_concurrent=2,
+        key=lambda d: d["date"],
+    )
+
+    assert max_running == 2
+    assert [d["date"] for d in results] == [
+        r["date"] for r in daily_records(date(2024, 1, 1), date(2024, 2, 1))
+    ]
+
+
+@pytest.mark.asyncio
+async def test_download_date_range_dedup_without_key():
+    """Test the records without a key are all kept."""
+
+    async def fetch(start, end):
+        return [{"date": start.isoformat()}, {"date": start.isoformat()}, {"value": 1}]
+
+    results = await download_date_range(
+        fetch,
+        date(2024, 1, 1),
+        date(2024, 1, 2),
+        timedelta(days=1),
+        key=lambda d: d.get("date"),
+    )
+
+    assert results == [
+        {"date": "2024-01-01"},
+        {"value": 1},
+        {"date": "2024-01-02"},
+        {"value": 1},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_download_date_range_retries():
+    """Test a failed window is retried with backoff."""
+    attempts = []
+
+    async def fetch(start, end):
+        attempts.append(start)
+        if len(attempts) < 3:
+            raise ConnectionError("Temporary failure.")
+        return daily_records(start, end)
+
+    results = await download_date_range(
+        fetch, date(2024, 1, 1), date(2024, 1, 2), timedelta(days=7), backoff=0.001
+    )
+
+    assert len(attempts) == 3
+    assert len(results) == 2
+
+
+@pytest.mark.asyncio
+async def test_download_date_range_resume(tmp_path):
+    """Test a failed download resumes from the completed windows."""
+    checkpoint = tmp_path / "checkpoint.jsonl"
+    fetched = []
+    fail = True
+
+    async def fetch(start, end):
+        fetched.append(start)
+        if fail and start == date(2024, 1, 8):
+            raise ConnectionError("Permanent failure.")
+        return daily_records(start, end)
+
+    downloader = DateRangeDownloader(
+        fetch, timedelta(days=7), retries=0, checkpoint=checkpoint
+    )
+    with pytest.raises(ConnectionError):
+        await downloader.download(date(2024, 1, 1), date(2024, 1, 21))
+    assert checkpoint.exists()
+
+    fail = False
+    fetched.clear()
+    results = await downloader.download(date(2024, 1, 1), date(2024, 1, 21))
+
+    assert fetched == [date(2024, 1, 8)]
+    assert len(results) == 21
+    assert not checkpoint.exists()
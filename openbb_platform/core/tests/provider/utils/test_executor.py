@@ -0,0 +1,113 @@
+"""Test the blocking executors."""
+
+# pylint: disable=W0621
+
+import asyncio
+import threading
+import time
+from contextvars import ContextVar
+
+import pytest
+from openbb_core.provider.abstract.fetcher import Fetcher
+from openbb_core.provider.utils.executor import BlockingExecutor, run_blocking
+
+VALUE: ContextVar[str] = ContextVar("VALUE", default="unset")
+
+
+@pytest.fixture
+def executor():
+    """Return a thread executor."""
+    executor = BlockingExecutor("thread", max_workers=2, max_per_key=1)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_in_thread_with_context(executor):
+    """Test the function runs in a worker thread, in the caller context."""
+    VALUE.set("set")
+    thread, value = await executor.run(
+        "key", lambda: (threading.get_ident(), VALUE.get())
+    )
+    assert thread != threading.get_ident()
+    assert value == "set"
+
+
+@pytest.mark.asyncio
+async def test_max_per_key(executor):
+    """Test a key can't take all the workers."""
+
+    def work():
+        time.sleep(0.1)
+
+    start = time.perf_counter()
+    await asyncio.gather(executor.run("a", work), executor.run("b", work))
+    assert time.perf_counter() - start < 0.18
+
+    start = time.perf_counter()
+    await asyncio.gather(executor.run("a", work), executor.run("a", work))
+    assert time.perf_counter() - start >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_stats(executor):
+    """Test the metrics of the pool."""
+
+    def fail():
+        raise ValueError
+
+    await executor.run("key", time.sleep, 0.01)
+    with pytest.raises(ValueError):
+        await executor.run("key", fail)
+
+    stats = executor.stats()
+    assert stats["completed"] == 1
+    assert stats["failed"] == 1
+    assert stats["queued"] == 0
+    assert stats["running"] == 0
+    assert stats["avg_run_seconds"] >= 0.01
+
+
+@pytest.mark.asyncio
+async def test_run_in_process():
+    """Test picklable functions run in a process pool."""
+    executor = BlockingExecutor("process", max_workers=1)
+    try:
+        assert await executor.run("key", pow, 2, 10) == 1024
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_blocking_inline():
+    """Test inline functions run in the event loop thread."""
+    assert await run_blocking("key", threading.get_ident, kind="inline") == (
+        threading.get_ident()
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetcher_sync_extract_off_loop():
+    """Test a synchronous extract_data doesn't run in the event loop thread."""
+
+    class MockFetcher(Fetcher):
+        """Mock fetcher."""
+
+        @staticmethod
+        def transform_query(params):
+            """Transform the query."""
+            return params
+
+        @staticmethod
+        def extract_data(query, credentials, **kwargs):
+            """Extract the data."""
+            return threading.get_ident()
+
+        @staticmethod
+        def transform_data(query, data, **kwargs):
+            """Transform the data."""
+            return data
+
+    assert await MockFetcher.fetch_data({}) != threading.get_ident()
+    MockFetcher.extract_executor = "inline"
+    assert await MockFetcher.fetch_data({}) == threading.get_ident()
@@ -0,0 +1,256 @@
+"""Test the HTTP response cache."""
+
+import time
+
+import pytest
+from openbb_core.provider.utils.client import ClientSession
+from openbb_core.provider.utils.helpers import amake_request, amake_requests
+from openbb_core.provider.utils.http_cache import (
+    HTTP_CACHE_TTL,
+    HttpCache,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    TieredCacheBackend,
+    resolve_cache_ttl,
+    set_http_cache,
+)
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture
+def memory_cache():
+    """Use an in-memory cache as the process-wide cache."""
+    cache = HttpCache(MemoryCacheBackend())
+    set_http_cache(cache)
+    yield cache
+    set_http_cache(None)
+
+
+def test_memory_backend_lru_eviction():
+    """Test the least recently used entries are evicted first."""
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set("a", "1", 60)
+    backend.set("b", "2", 60)
+    assert backend.get("a") == "1"
+    backend.set("c", "3", 60)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == "1"
+    assert backend.get("c") == "3"
+
+
+def test_memory_backend_expiration():
+    """Test expired entries are not returned."""
+    backend = MemoryCacheBackend()
+    backend.set("a", "1", -1)
+    assert backend.get("a") is None
+    assert len(backend) == 0
+
+
+def test_sqlite_backend(tmp_path):
+    """Test the SQLite backend stores, expires and evicts entries."""
+    backend = SQLiteCacheBackend(tmp_path / "cache.sqlite", max_entries=2)
+    backend.set("a", "1", 60)
+    backend.set("expired", "2", -1)
+    assert backend.get("a") == "1"
+    assert backend.get("expired") is None
+
+    backend.set("b", "2", 60)
+    time.sleep(0.01)
+    assert backend.get("a") == "1"
+    backend.set("c", "3", 60)
+    assert backend.get("b") is None
+    assert backend.get("a") == "1"
+
+    backend.clear()
+    assert backend.get("a") is None
+    backend.close()
+
+
+def test_tiered_backend_promotes_hits():
+    """Test hits in the slower tier are copied to the faster one."""
+    fast, slow = MemoryCacheBackend(), MemoryCacheBackend()
+    backend = TieredCacheBackend(fast, slow)
+    slow.set("a", "1", 60)
+
+    assert backend.get("a") == "1"
+    assert fast.get("a") == "1"
+
+
+def test_tiered_backend_promotes_with_remaining_ttl():
+    """Test a promoted value expires with the value of the slower tier."""
+    fast, slow = MemoryCacheBackend(), MemoryCacheBackend()
+    backend = TieredCacheBackend(fast, slow, promote_ttl=300)
+    slow.set("a", "1", 0.05)
+
+    _, expires = backend.get_entry("a")  # type: ignore[misc]
+    assert fast.get_entry("a")[1] == pytest.approx(expires)  # type: ignore[index]
+    time.sleep(0.06)
+    assert backend.get("a") is None
+    assert fast.get("a") is None
+
+
+def test_make_key_ignores_order_and_hashes():
+    """Test the key is stable and does not contain the url."""
+    key = HttpCache.make_key("get", "https://x.com?apikey=123", params={"a": 1, "b": 2})
+    assert key == HttpCache.make_key(
+        "GET", "https://x.com?apikey=123", params={"b": 2, "a": 1}
+    )
+    assert "apikey" not in key
+
+
+def test_set_skips_non_serializable():
+    """Test values that are not JSON serializable are not cached."""
+    cache = HttpCache(MemoryCacheBackend())
+    assert cache.set("a", {"a": 1}, 60)
+    assert not cache.set("b", object(), 60)
+    assert cache.get("a") == (True, {"a": 1})
+    assert cache.get("b") == (False, None)
+
+
+@pytest.mark.parametrize(
+    "preferences, ttls, expected",
+    [
+        (None, (None, None), None),
+        (None, (None, 60), 60),
+        (None, (10, 60), 10),
+        ({"use_cache": False}, (10, 60), None),
+        ({"cache_ttl": 5}, (10, 60), 5),
+        ({"cache_ttl": 0}, (10, 60), None),
+    ],
+)
+def test_resolve_cache_ttl(preferences, ttls, expected):
+    """Test the ttl resolution."""
+    assert resolve_cache_ttl(preferences, *ttls) == expected
+
+
+@pytest.mark.asyncio
+async def test_amake_request_uses_cache(monkeypatch, memory_cache):
+    """Test identical requests hit the network once when a ttl is active."""
+    calls = []
+
+    class MockResponse:
+        """Mock the response."""
+
+        status = 200
+
+        async def json(self):
+            """Return the json response."""
+            return {"n": len(calls)}
+
+    async def mock_request(*args, **kwargs):
+        """Mock the ClientSession.request method."""
+        calls.append(args)
+        return MockResponse()
+
+    monkeypatch.setattr(ClientSession, "request", mock_request)
+
+    token = HTTP_CACHE_TTL.set(60)
+    try:
+        first = await amake_request("http://mock.url", params={"a": 1})
+        second = await amake_request("http://mock.url", params={"a": 1})
+        other = await amake_request("http://mock.url", params={"a": 2})
+    finally:
+        HTTP_CACHE_TTL.reset(token)
+    uncached = await amake_request("http://mock.url", params={"a": 1})
+
+    assert first == second == {"n": 1}
+    assert other == {"n": 2}
+    assert uncached == {"n": 3}
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_amake_requests_uses_cache(monkeypatch, memory_cache):
+    """Test the requests of amake_requests are cached when a ttl is active."""
+    calls = []
+
+    class MockResponse:
+        """Mock the response."""
+
+        status = 200
+
+        async def json(self):
+            """Return the json response."""
+            return {"n": len(calls)}
+
+    async def mock_request(*args, **kwargs):
+        """Mock the ClientSession.request method."""
+        calls.append(args)
+        return MockResponse()
+
+    monkeypatch.setattr(ClientSession, "request", mock_request)
+    urls = ["http://mock.url/a", "http://mock.url/b"]
+
+    token = HTTP_CACHE_TTL.set(60)
+    try:
+        first = await amake_requests(urls)
+        second = await amake_requests(urls)
+        custom = await amake_requests(urls, session=ClientSession())
+    finally:
+        HTTP_CACHE_TTL.reset(token)
+
+    assert first == second
+    assert len(custom) == 2
+    assert len(calls) == 4
+
+
+async def json_callback(response, _):
+    """Return the json response."""
+    return await response.json()
+
+
+async def other_callback(response, _):
+    """Return another value."""
+    return "other"
+
+
+# Same module and name as json_callback, with different code.
+other_callback.__qualname__ = json_callback.__qualname__
+
+
+def make_callback(field):
+    """Return a callback reading a field of the response, as a closure."""
+
+    async def callback(response, _):
+        """Return a field of the response."""
+        return (await response.json())[field]
+
+    return callback
+
+
+@pytest.mark.asyncio
+async def test_amake_request_cache_callbacks(monkeypatch, memory_cache):
+    """Test callbacks of the same name don't share responses and closures aren't cached."""
+    calls = []
+
+    class MockResponse:
+        """Mock the response."""
+
+        status = 200
+
+        async def json(self):
+            """Return the json response."""
+            return {"a": "a", "b": "b", "n": len(calls)}
+
+    async def mock_request(*args, **kwargs):
+        """Mock the ClientSession.request method."""
+        calls.append(args)
+        return MockResponse()
+
+    monkeypatch.setattr(ClientSession, "request", mock_request)
+    token = HTTP_CACHE_TTL.set(60)
+    try:
+        first = await amake_request("http://mock.url", response_callback=json_callback)
+        other = await amake_request("http://mock.url", response_callback=other_callback)
+        cached = await amake_request("http://mock.url", response_callback=json_callback)
+        a = await amake_request("http://mock.url", response_callback=make_callback("a"))
+        b = await amake_request("http://mock.url", response_callback=make_callback("b"))
+    finally:
+        HTTP_CACHE_TTL.reset(token)
+
+    assert first == cached == {"a": "a", "b": "b", "n": 1}
+    assert other == "other"
+    assert (a, b) == ("a", "b")
+    assert len(calls) == 4
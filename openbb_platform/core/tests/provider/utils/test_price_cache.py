@@ -0,0 +1,176 @@
+"""Test the price cache."""
+
+# pylint: disable=W0212,W0621
+
+import time
+from datetime import date, timedelta
+from typing import List
+
+import pytest
+from openbb_core.env import Env
+from openbb_core.provider.abstract.data import Data
+from openbb_core.provider.abstract.fetcher import Fetcher
+from openbb_core.provider.standard_models.equity_historical import (
+    EquityHistoricalQueryParams,
+)
+from openbb_core.provider.utils.errors import EmptyDataError
+from openbb_core.provider.utils.price_cache import (
+    PriceCache,
+    find_gaps,
+    set_price_cache,
+)
+
+
+class Bar(Data):
+    """Daily bar."""
+
+    date: date
+    close: float
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Return a price cache."""
+    cache = PriceCache(tmp_path / "prices.sqlite")
+    yield cache
+    cache.close()
+
+
+def make_fetch(calls: List, adjustment: float = 0.0):
+    """Return a fetch function recording the requested ranges."""
+
+    async def fetch(start: date, end: date):
+        calls.append((start, end))
+        if start > end:
+            raise EmptyDataError()
+        return [
+            Bar(date=day, close=100 + day.day + adjustment)
+            for day in (
+                start + timedelta(days=i) for i in range((end - start).days + 1)
+            )
+        ]
+
+    return fetch
+
+
+def test_find_gaps():
+    """Test the gaps between covered ranges."""
+    d = date(2024, 1, 1)
+    coverage = [(d + timedelta(days=2), d + timedelta(days=4))]
+    assert find_gaps([], d, d) == [(d, d)]
+    assert find_gaps(coverage, d, d + timedelta(days=6)) == [
+        (d, d + timedelta(days=1)),
+        (d + timedelta(days=5), d + timedelta(days=6)),
+    ]
+    assert not find_gaps(coverage, d + timedelta(days=3), d + timedelta(days=4))
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_incremental(cache):
+    """Test only the missing dates are fetched, with the last stored bar."""
+    calls: List = []
+    fetch = make_fetch(calls)
+    start, end = date(2024, 1, 1), date(2024, 1, 31)
+
+    rows = await cache.get_or_fetch("key", start, end, fetch)
+    assert calls == [(start, end)]
+    assert len(rows) == 31
+
+    calls.clear()
+    rows = await cache.get_or_fetch("key", start, end, fetch)
+    assert not calls
+    assert len(rows) == 31
+
+    calls.clear()
+    rows = await cache.get_or_fetch("key", start, date(2024, 2, 2), fetch)
+    assert calls == [(end, date(2024, 2, 2))]
+    assert [r.date for r in rows] == [start + timedelta(days=i) for i in range(33)]
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_adjusted(cache):
+    """Test the series is downloaded again when the stored prices were adjusted."""
+    calls: List = []
+    start, end = date(2024, 1, 1), date(2024, 1, 31)
+    await cache.get_or_fetch("key", start, end, make_fetch(calls))
+
+    calls.clear()
+    new_end = date(2024, 2, 10)
+    rows = await cache.get_or_fetch(
+        "key", start, new_end, make_fetch(calls, adjustment=0.5)
+    )
+    assert calls == [(end, new_end), (start, new_end)]
+    assert all(r.close == 100 + r.date.day + 0.5 for r in rows)
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_expired(cache, monkeypatch):
+    """Test an expired series is downloaded again in full, then stored anew."""
+    calls: List = []
+    fetch = make_fetch(calls)
+    start, end = date(2024, 1, 1), date(2024, 1, 31)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    await cache.get_or_fetch("key", start, end, fetch)
+
+    now += cache.max_age + 1
+    calls.clear()
+    await cache.get_or_fetch("key", start, end, fetch)
+    assert calls == [(start, end)]
+
+    calls.clear()
+    await cache.get_or_fetch("key", start, end, fetch)
+    assert not calls
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_not_stored(cache):
+    """Test results without dates are not stored."""
+
+    async def fetch(start, end):
+        return {"start": start, "end": end}
+
+    assert (
+        await cache.get_or_fetch("key", date(2024, 1, 1), date(2024, 1, 2), fetch)
+        is None
+    )
+    assert cache.load("key") == ([], {})
+
+
+@pytest.mark.asyncio
+async def test_fetcher_price_cache(cache, monkeypatch):
+    """Test historical price fetchers go through the price cache when enabled."""
+    calls: List = []
+    fetch = make_fetch(calls)
+
+    class MockFetcher(Fetcher[EquityHistoricalQueryParams, List[Bar]]):
+        """Mock fetcher."""
+
+        @staticmethod
+        def transform_query(params):
+            """Transform the query."""
+            return EquityHistoricalQueryParams(**params)
+
+        @staticmethod
+        async def aextract_data(query, credentials, **kwargs):
+            """Extract the data."""
+            return await fetch(query.start_date, query.end_date)
+
+        @staticmethod
+        def transform_data(query, data, **kwargs):
+            """Transform the data."""
+            return data
+
+    params = {"symbol": "AAPL", "start_date": "2024-01-01", "end_date": "2024-01-10"}
+    monkeypatch.setitem(Env()._environ, "OPENBB_PRICE_CACHE", "true")
+    set_price_cache(cache)
+    try:
+        for _ in range(2):
+            rows = await MockFetcher.fetch_data(params, {})
+            assert len(rows) == 10
+        assert len(calls) == 1
+
+        await MockFetcher.fetch_data(params, {}, preferences={"use_cache": False})
+        assert len(calls) == 2
+    finally:
+        set_price_cache(None)
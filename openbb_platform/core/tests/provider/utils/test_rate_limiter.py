@@ -0,0 +1,141 @@
+"""Test the provider rate limiter."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from openbb_core.env import Env
+from openbb_core.provider.utils.client import ClientSession
+from openbb_core.provider.utils.helpers import amake_request
+from openbb_core.provider.utils.rate_limiter import (
+    RATE_LIMITER,
+    RateLimit,
+    RateLimiter,
+    get_rate_limiter,
+    set_rate_limit,
+)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_token_bucket():
+    """Test requests beyond the burst wait for the rate."""
+    limiter = RateLimiter(RateLimit(requests_per_second=50, burst=2))
+
+    start = time.monotonic()
+    for _ in range(4):
+        async with limiter:
+            pass
+    elapsed = time.monotonic() - start
+
+    # The burst is free, the 2 other requests wait 1/50 s each.
+    assert 0.035 <= elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_max_concurrent():
+    """Test the number of requests in flight is limited."""
+    limiter = RateLimiter(RateLimit(max_concurrent=2))
+    running = peak = 0
+
+    async def request():
+        nonlocal running, peak
+        async with limiter:
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*[request() for _ in range(6)])
+    assert peak == 2
+
+
+def test_retry_delay():
+    """Test the retry delay follows Retry-After or backs off exponentially."""
+    limiter = RateLimiter(RateLimit(backoff=0.5))
+
+    assert limiter.retry_delay(0) == 0.5
+    assert limiter.retry_delay(2) == 2.0
+    assert limiter.retry_delay(0, "7") == 7.0
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < limiter.retry_delay(0, format_datetime(retry_at, usegmt=True)) <= 30
+    assert limiter.retry_delay(1, "not a date") == 1.0
+
+
+def test_get_and_set_rate_limit():
+    """Test limiters are shared per provider and can be overridden."""
+    assert get_rate_limiter("test_no_limit") is None
+
+    limiter = get_rate_limiter("test_provider", RateLimit(requests_per_second=1))
+    assert (
+        get_rate_limiter("test_provider", RateLimit(requests_per_second=9)) is limiter
+    )
+
+    set_rate_limit("test_provider", RateLimit(requests_per_second=2))
+    assert get_rate_limiter("test_provider").rate_limit.requests_per_second == 2  # type: ignore
+
+    set_rate_limit("test_provider", None)
+    assert get_rate_limiter("test_provider") is None
+
+
+def test_rate_limit_from_env(monkeypatch):
+    """Test the quotas set in OPENBB_RATE_LIMITS replace the declared ones."""
+    monkeypatch.setitem(
+        Env()._environ,  # pylint: disable=protected-access
+        "OPENBB_RATE_LIMITS",
+        '{"test_env": {"requests_per_second": 12.5, "burst": 25},'
+        ' "test_env_undeclared": {"max_concurrent": 2},'
+        ' "test_env_invalid": {"per_minute": 1}}',
+    )
+    declared = RateLimit(requests_per_second=5, burst=10, max_concurrent=10)
+
+    try:
+        limiter = get_rate_limiter("test_env", declared)
+        undeclared = get_rate_limiter("test_env_undeclared")
+        with pytest.raises(ValueError, match="per_minute"):
+            get_rate_limiter("test_env_invalid", declared)
+    finally:
+        set_rate_limit("test_env", None)
+        set_rate_limit("test_env_undeclared", None)
+
+    assert limiter.rate_limit == RateLimit(  # type: ignore[union-attr]
+        requests_per_second=12.5, burst=25, max_concurrent=10
+    )
+    assert undeclared.rate_limit == RateLimit(max_concurrent=2)  # type: ignore[union-attr]
+    assert get_rate_limiter("test_env_default", declared).rate_limit == declared  # type: ignore[union-attr]
+    set_rate_limit("test_env_default", None)
+
+
+@pytest.mark.asyncio
+async def test_amake_request_retries_429(monkeypatch):
+    """Test rate limited responses are retried after Retry-After."""
+    statuses = [429, 429, 200]
+
+    class MockResponse:
+        """Mock the response."""
+
+        def __init__(self, status):
+            self.status = status
+            self.headers = {"Retry-After": "0"}
+
+        def release(self):
+            """Release the connection."""
+
+        async def json(self):
+            """Return the json response."""
+            return {"status": self.status}
+
+    async def mock_request(*args, **kwargs):
+        return MockResponse(statuses.pop(0))
+
+    monkeypatch.setattr(ClientSession, "request", mock_request)
+
+    token = RATE_LIMITER.set(RateLimiter(RateLimit(max_retries=3)))
+    try:
+        response = await amake_request("http://mock.url")
+    finally:
+        RATE_LIMITER.reset(token)
+
+    assert response == {"status": 200}
+    assert not statuses
@@ -0,0 +1,122 @@
+"""Test the fetcher result cache."""
+
+import asyncio
+
+import pytest
+from openbb_core.provider.abstract.annotated_result import AnnotatedResult
+from openbb_core.provider.abstract.data import Data
+from openbb_core.provider.utils.result_cache import ResultCache
+
+
+class Counter:
+    """Count the fetches."""
+
+    def __init__(self, delay: float = 0):
+        """Initialize the counter."""
+        self.calls = 0
+        self.delay = delay
+
+    async def fetch(self):
+        """Return a new result on each call."""
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return [self.calls]
+
+
+def test_make_key():
+    """Test the key changes with the provider, model, query and credentials."""
+    key = ResultCache.make_key("fmp", "EquityQuote", {"symbol": "AAPL", "a": 1})
+    assert key == ResultCache.make_key("fmp", "EquityQuote", {"a": 1, "symbol": "AAPL"})
+    assert key != ResultCache.make_key("fmp", "EquityQuote", {"symbol": "MSFT"})
+    assert key != ResultCache.make_key("fmp", "EquityInfo", {"symbol": "AAPL"})
+    assert key != ResultCache.make_key(
+        "fmp", "EquityQuote", {"symbol": "AAPL", "a": 1}, {"fmp_api_key": "1"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_fresh():
+    """Test fresh results are served without fetching."""
+    cache = ResultCache()
+    counter = Counter()
+
+    first = await cache.get_or_fetch("k", counter.fetch, ttl=60)
+    first.append("mutated")
+    second = await cache.get_or_fetch("k", counter.fetch, ttl=60)
+
+    assert second == [1]
+    assert counter.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_copies_data():
+    """Test mutating the returned data doesn't alter the cached result."""
+    cache = ResultCache()
+
+    async def fetch():
+        return AnnotatedResult(result=[Data(close=1.0)], metadata={"a": [1]})
+
+    first = await cache.get_or_fetch("k", fetch, ttl=60)
+    first.result[0].close = 2.0
+    first.metadata["a"].append(2)
+    second = await cache.get_or_fetch("k", fetch, ttl=60)
+
+    assert second.result[0].close == 1.0
+    assert second.metadata == {"a": [1]}
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_expired():
+    """Test expired results are fetched again."""
+    cache = ResultCache()
+    counter = Counter()
+
+    await cache.get_or_fetch("k", counter.fetch, ttl=0)
+    result = await cache.get_or_fetch("k", counter.fetch, ttl=0)
+
+    assert result == [2]
+    assert counter.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_stale_while_revalidate():
+    """Test stale results are served while they are refreshed in the background."""
+    cache = ResultCache()
+    counter = Counter()
+
+    await cache.get_or_fetch("k", counter.fetch, ttl=0, stale_ttl=60)
+    stale = await cache.get_or_fetch("k", counter.fetch, ttl=0, stale_ttl=60)
+    assert stale == [1]
+
+    await asyncio.sleep(0.01)
+    assert counter.calls == 2
+    refreshed = await cache.get_or_fetch("k", counter.fetch, ttl=0, stale_ttl=60)
+    assert refreshed == [2]
+    await cache.cancel_refreshes()
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_shares_concurrent_misses():
+    """Test concurrent misses on the same key fetch once."""
+    cache = ResultCache()
+    counter = Counter(delay=0.01)
+
+    results = await asyncio.gather(
+        *[cache.get_or_fetch("k", counter.fetch, ttl=60) for _ in range(5)]
+    )
+
+    assert results == [[1]] * 5
+    assert counter.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_does_not_cache_errors():
+    """Test failed fetches are not cached."""
+    cache = ResultCache()
+
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await cache.get_or_fetch("k", fail, ttl=60)
+    assert len(cache) == 0
@@ -0,0 +1,85 @@
+"""Test the shared session pool."""
+
+import asyncio
+import socket
+import threading
+
+import pytest
+from openbb_core.provider.utils.client import ClientSession
+from openbb_core.provider.utils.session_pool import SessionPool
+
+
+def test_key_from_url():
+    """Test the pool key is the url host."""
+    assert SessionPool.key_from_url("https://api.test.com/v1?a=1") == "api.test.com"
+
+
+@pytest.mark.asyncio
+async def test_get_session_reuses_session():
+    """Test the same session is returned for the same key."""
+    pool = SessionPool(limit=10, limit_per_host=2, keepalive_timeout=5)
+
+    session = pool.get_session("fmp")
+    assert isinstance(session, ClientSession)
+    assert pool.get_session("fmp") is session
+    assert pool.get_session("polygon") is not session
+    assert session.connector.limit == 10  # type: ignore[union-attr]
+    assert session.connector.limit_per_host == 2  # type: ignore[union-attr]
+    assert len(pool) == 2
+
+    await pool.close("fmp")
+    assert session.closed
+    assert len(pool) == 1
+
+    await pool.close()
+    assert len(pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_session_replaces_closed_session():
+    """Test a closed session is replaced by a new one."""
+    pool = SessionPool()
+
+    session = pool.get_session("sec")
+    await session.close()
+    new_session = pool.get_session("sec")
+
+    assert new_session is not session
+    assert not new_session.closed
+    await pool.close()
+
+
+def test_closed_loop_connections_are_dropped():
+    """Test the connections of a session whose event loop is closed are ended."""
+    server = socket.create_server(("127.0.0.1", 0))
+    received = []
+
+    def serve():
+        connection, _ = server.accept()
+        connection.recv(4096)
+        connection.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+        connection.settimeout(5)
+        received.append(connection.recv(1))
+        connection.close()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    pool = SessionPool()
+
+    async def request():
+        session = pool.get_session("local")
+        response = await session.get(f"http://127.0.0.1:{server.getsockname()[1]}")
+        await response.read()
+        return session
+
+    async def get_session():
+        return pool.get_session("local")
+
+    session = asyncio.run(request())
+    new_session = asyncio.run(get_session())
+    thread.join(5)
+    server.close()
+
+    assert received == [b""]
+    assert session.closed
+    assert new_session is not session
@@ -2,7 +2,7 @@
 
 import re
 from itertools import combinations
-from typing import Dict, List, Literal
+from typing import Dict, List, Literal, Optional
 
 import numpy as np
 import pandas as pd
@@ -19,13 +19,14 @@ from openbb_core.app.model.example import APIEx, PythonEx
 from openbb_core.app.model.obbject import OBBject
 from openbb_core.app.router import Router
 from openbb_core.app.utils import basemodel_to_df, get_target_column, get_target_columns
+from openbb_core.provider.abstract.columnar_result import ColumnarResult
 from openbb_core.provider.abstract.data import Data
 from pydantic import PositiveInt
 from statsmodels.stats.diagnostic import acorr_breusch_godfrey  # type: ignore
 from statsmodels.stats.stattools import durbin_watson  # type: ignore
 from statsmodels.tsa.stattools import adfuller, grangercausalitytests  # type: ignore
 
-from openbb_econometrics.utils import get_engle_granger_two_step_cointegration_test
+from openbb_econometrics.utils import get_engle_granger_two_step_cointegration_tests
 
 router = Router(prefix="", description="Econometrics analysis tools.")
 
@@ -65,16 +66,26 @@ def correlation_matrix(data: List[Data]) -> OBBject[List[Data]]:
     # remove non float columns from the dataframe to perform the correlation
     df = df.select_dtypes(include=["float64"])
 
-    corr = df.corr()
+    values = df.to_numpy()
+    if np.isnan(values).any():
+        # Pairwise complete observations, like pandas.
+        corr = df.corr()
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = pd.DataFrame(
+                np.corrcoef(values, rowvar=False), index=df.columns, columns=df.columns
+            )
+    # The matrix is symmetric, the row of a column is its correlation to the others.
+    corr["comp_to"] = corr.columns
 
-    # replace nan values with None to allow for json serialization
-    corr = corr.replace(np.NaN, None)
-
-    ret = []
-    for k, v in corr.items():
-        v["comp_to"] = k
-        ret.append(Data(**v))
-    return OBBject(results=ret)
+    try:
+        # Wide universes are kept as columns instead of a Data per column,
+        # missing values are null in the columnar results.
+        return OBBject(results=ColumnarResult.from_pandas(corr))
+    except ImportError:
+        # replace nan values with None to allow for json serialization
+        corr = corr.replace(np.NaN, None)
+        return OBBject(results=[Data(**v) for v in corr.to_dict("records")])
 
 
 @router.command(
@@ -351,6 +362,8 @@ def residual_autocorrelation(
 def cointegration(
     data: List[Data],
     columns: List[str],
+    pvalue_threshold: Optional[float] = None,
+    top_k: Optional[PositiveInt] = None,
 ) -> OBBject[Data]:
     """Show co-integration between two timeseries using the two step Engle-Granger test.
 
@@ -369,8 +382,10 @@ def cointegration(
         Input dataset.
     columns: List[str]
         Data columns to check cointegration
-    maxlag: PositiveInt
-        Number of lags to use in the test.
+    pvalue_threshold: Optional[float]
+        Only return the pairs with a p-value below or equal to this threshold.
+    top_k: Optional[PositiveInt]
+        Only return the k pairs with the lowest p-values, sorted by p-value.
 
     Returns
     -------
@@ -379,23 +394,13 @@ def cointegration(
     """
     pairs = list(combinations(columns, 2))
     dataset = get_target_columns(basemodel_to_df(data), columns)
-    result = {}
-    for x, y in pairs:
-        (
-            c,
-            gamma,
-            alpha,
-            _,  # z
-            adfstat,
-            pvalue,
-        ) = get_engle_granger_two_step_cointegration_test(dataset[x], dataset[y])
-        result[f"{x}/{y}"] = {
-            "c": c,
-            "gamma": gamma,
-            "alpha": alpha,
-            "adfstat": adfstat,
-            "pvalue": pvalue,
-        }
+    # All the pairs are tested at once, a universe of hundreds of columns takes seconds.
+    tests = get_engle_granger_two_step_cointegration_tests(dataset, pairs)
+    if pvalue_threshold is not None:
+        tests = tests[tests["pvalue"] <= pvalue_threshold]
+    if top_k is not None:
+        tests = tests.sort_values("pvalue", kind="stable").head(top_k)
+    result = tests.to_dict(orient="index")
 
     return OBBject(results=result)
 
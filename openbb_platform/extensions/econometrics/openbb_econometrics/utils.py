@@ -1,11 +1,19 @@
 """Utility functions for the econometrics extension of the OpenBB platform."""
 
 import warnings
-from typing import Tuple
+from typing import List, Tuple
 
 import numpy as np
 import pandas as pd
 import statsmodels.api as sm
+from scipy.stats import norm
+from statsmodels.tsa.adfvalues import (  # type: ignore
+    _tau_largeps,
+    _tau_maxs,
+    _tau_mins,
+    _tau_smallps,
+    _tau_stars,
+)
 from statsmodels.tsa.stattools import adfuller
 
 
@@ -89,6 +97,130 @@ def get_engle_granger_two_step_cointegration_test(
     return c, gamma, alpha, z, adfstat, pvalue
 
 
+def _mackinnon_pvalues(adfstat: np.ndarray) -> np.ndarray:
+    """Get the p-values of ADF statistics with a constant, like `mackinnonp(stat, "c", 1)` on each one."""
+    pvalues = norm.cdf(
+        np.where(
+            adfstat <= _tau_stars["c"][0],
+            np.polyval(_tau_smallps["c"][0][::-1], adfstat),
+            np.polyval(_tau_largeps["c"][0][::-1], adfstat),
+        )
+    )
+    pvalues[adfstat > _tau_maxs["c"][0]] = 1.0
+    pvalues[adfstat < _tau_mins["c"][0]] = 0.0
+    return pvalues
+
+
+def get_engle_granger_two_step_cointegration_tests(
+    dataset: pd.DataFrame, pairs: List[Tuple[str, str]]
+) -> pd.DataFrame:
+    """Run the two-step Engle-Granger test on many pairs of columns at once.
+
+    Gives the same results as `get_engle_granger_two_step_cointegration_test` on
+    each pair, without the residuals. The regressions have one or two regressors,
+    so their closed form solutions only need sums of products of the residuals
+    and their differences. The residuals of a pair are a linear combination of
+    its two columns, so these sums are read from the Gram matrices of the
+    columns, their lags and their differences, computed once for all the pairs
+    with matrix products. Pairs with missing values are tested one at a time.
+
+    Parameters
+    ----------
+    dataset : pd.DataFrame
+        The time series, one per column.
+    pairs : List[Tuple[str, str]]
+        The pairs of columns to test, the dependent series first.
+
+    Returns
+    -------
+    pd.DataFrame
+        The c, gamma, alpha, adfstat and pvalue of each pair, indexed by "x/y".
+    """
+    columns = ["c", "gamma", "alpha", "adfstat", "pvalue"]
+    df = pd.DataFrame(
+        np.nan, index=[f"{x}/{y}" for x, y in pairs], columns=columns, dtype=float
+    )
+    names = list(dict.fromkeys(name for pair in pairs for name in pair))
+    complete = [name for name in names if dataset[name].notna().all()]
+    complete_set = set(complete)
+    batched = [
+        k for k, (x, y) in enumerate(pairs) if x in complete_set and y in complete_set
+    ]
+
+    if batched:
+        values = dataset[complete].to_numpy(dtype=float)
+        position = {name: i for i, name in enumerate(complete)}
+        i = np.array([position[pairs[k][0]] for k in batched])
+        j = np.array([position[pairs[k][1]] for k in batched])
+
+        means = values.mean(axis=0)
+        centered = values - means
+        diffs = np.diff(centered, axis=0)
+
+        def pair_sum(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+            """Sum of the products of the residual series, from the columns."""
+            gram = first.T @ second
+            return (
+                gram[i, i]
+                - gamma * gram[i, j]
+                - gamma * gram[j, i]
+                + gamma**2 * gram[j, j]
+            )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Long-run relationship y_t = c + gamma * x_t + z_t.
+            gram = centered.T @ centered
+            gamma = gram[i, j] / gram[j, j]
+            c = means[i] - gamma * means[j]
+
+            # Short-run relationship y_t - y_(t-1) = alpha * z_(t-1) + epsilon_t,
+            # the differences of y are the differences of the residuals plus gamma times those of x.
+            previous = centered[:-1]
+            cross = diffs.T @ previous
+            alpha = (cross[i, i] - gamma * cross[i, j]) / pair_sum(previous, previous)
+
+            # ADF regression with a constant and one lag, like adfuller(z, maxlag=1, autolag=None),
+            # dz_t = const + phi * z_(t-1) + beta * dz_(t-1), with the constant partialled out.
+            level, lagged, target = centered[1:-1], diffs[:-1], diffs[1:]
+            nobs = len(level)
+
+            def centered_sum(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+                """Sum of the products of the demeaned residual series."""
+                first_sum = first.sum(axis=0)
+                second_sum = second.sum(axis=0)
+                return (
+                    pair_sum(first, second)
+                    - (first_sum[i] - gamma * first_sum[j])
+                    * (second_sum[i] - gamma * second_sum[j])
+                    / nobs
+                )
+
+            s_ll = centered_sum(level, level)
+            s_la = centered_sum(level, lagged)
+            s_aa = centered_sum(lagged, lagged)
+            s_lt = centered_sum(level, target)
+            s_at = centered_sum(lagged, target)
+            s_tt = centered_sum(target, target)
+
+            det = s_ll * s_aa - s_la**2
+            phi = (s_aa * s_lt - s_la * s_at) / det
+            beta = (s_ll * s_at - s_la * s_lt) / det
+            sigma2 = (s_tt - phi * s_lt - beta * s_at) / (nobs - 3)
+            adfstat = phi / np.sqrt(sigma2 * s_aa / det)
+
+        pvalue = _mackinnon_pvalues(adfstat)
+        df.iloc[batched] = np.column_stack([c, gamma, alpha, adfstat, pvalue])
+
+    for k, (x, y) in enumerate(pairs):
+        if x not in complete_set or y not in complete_set:
+            c, gamma, alpha, _, adfstat, pvalue = (
+                get_engle_granger_two_step_cointegration_test(dataset[x], dataset[y])
+            )
+            df.iloc[k] = [c, gamma, alpha, adfstat, pvalue]
+
+    return df
+
+
 def mock_multi_index_data():
     """Create a mock multi-index dataframe for testing purposes."""
     arrays = [
@@ -1,11 +1,16 @@
 """Test the econometrics utils module."""
 
+from itertools import permutations
+
 import numpy as np
 import pandas as pd
+import pytest
 from extensions.econometrics.openbb_econometrics.utils import (
     get_engle_granger_two_step_cointegration_test,
+    get_engle_granger_two_step_cointegration_tests,
     mock_multi_index_data,
 )
+from statsmodels.tools.sm_exceptions import MissingDataError
 
 
 def test_get_engle_granger_two_step_cointegration_test():
@@ -18,6 +23,42 @@ def test_get_engle_granger_two_step_cointegration_test():
     assert result
 
 
+def test_get_engle_granger_two_step_cointegration_tests():
+    """Test the batched tests match the test of each pair."""
+    rng = np.random.default_rng(0)
+    trend = np.cumsum(rng.normal(size=200))
+    dataset = pd.DataFrame(
+        {
+            "a": 10 + trend + rng.normal(size=200),
+            "b": 5 + 2 * trend + rng.normal(size=200) * 0.01,
+            "c": np.cumsum(rng.normal(size=200)),
+            "d": np.cumsum(rng.normal(size=200)),
+        }
+    )
+    dataset.loc[10, "d"] = np.nan
+    pairs = list(permutations(["a", "b", "c"], 2))
+
+    result = get_engle_granger_two_step_cointegration_tests(dataset, pairs)
+
+    assert list(result.index) == [f"{x}/{y}" for x, y in pairs]
+    for x, y in pairs:
+        c, gamma, alpha, _, adfstat, pvalue = (
+            get_engle_granger_two_step_cointegration_test(dataset[x], dataset[y])
+        )
+        assert result.loc[f"{x}/{y}"].tolist() == pytest.approx(
+            [c, gamma, alpha, adfstat, pvalue], rel=1e-8, abs=1e-12
+        )
+    assert result.loc["b/a", "pvalue"] < 0.01
+
+
+def test_get_engle_granger_two_step_cointegration_tests_missing_values():
+    """Test pairs with missing values are tested one at a time, like a single pair."""
+    dataset = pd.DataFrame({"a": [1.0, 2.0, np.nan, 4.0], "b": [1.0, 3.0, 2.0, 4.0]})
+
+    with pytest.raises(MissingDataError):
+        get_engle_granger_two_step_cointegration_tests(dataset, [("a", "b")])
+
+
 def test_mock_multi_index_data():
     """Test the mock_multi_index_data function."""
     mi_data = mock_multi_index_data()
@@ -159,7 +159,7 @@ def sharpe_ratio(
     std = series_target.rolling(window).std() / np.sqrt(window)
     results = ((returns - rfr) / std).dropna().reset_index(drop=False)
 
-    results = df_to_basemodel(results)
+    results = df_to_basemodel(results, validate=False)
 
     return OBBject(results=results)
 
@@ -246,6 +246,6 @@ def sortino_ratio(
         results = results.applymap(
             lambda x: x / np.sqrt(2) if isinstance(x, float) else x
         )
-    results_ = df_to_basemodel(results)
+    results_ = df_to_basemodel(results, validate=False)
 
     return OBBject(results=results_)
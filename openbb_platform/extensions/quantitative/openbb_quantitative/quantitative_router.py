@@ -38,6 +38,7 @@ router.include_router(performance_router)
 
 @router.command(
     methods=["POST"],
+    cpu_bound=True,
     examples=[
         PythonEx(
             description="Get Normality Statistics.",
@@ -159,6 +160,7 @@ def capm(data: List[Data], target: str) -> OBBject[CAPMModel]:
 
 @router.command(
     methods=["POST"],
+    cpu_bound=True,
     examples=[
         PythonEx(
             description="Get Unit Root Test.",
@@ -13,13 +13,7 @@ from openbb_core.app.utils import (
 )
 from openbb_core.provider.abstract.data import Data
 from openbb_quantitative.helpers import validate_window
-from openbb_quantitative.statistics import (
-    kurtosis_,
-    mean_,
-    skew_,
-    std_dev_,
-    var_,
-)
+from openbb_quantitative.statistics import rolling_moments
 from pydantic import NonNegativeFloat, PositiveInt
 
 router = Router(prefix="/rolling")
@@ -27,6 +21,7 @@ router = Router(prefix="/rolling")
 
 @router.command(
     methods=["POST"],
+    cpu_bound=True,
     examples=[
         PythonEx(
             description="Get Rolling Mean.",
@@ -81,15 +76,18 @@ def skew(
     series_target.name = f"rolling_skew_{window}"
     validate_window(series_target, window)
     results = (
-        series_target.rolling(window).apply(skew_).dropna().reset_index(drop=False)
+        rolling_moments(series_target, window, ["skew"])["skew"]
+        .dropna()
+        .reset_index(drop=False)
     )
-    results = df_to_basemodel(results)
+    results = df_to_basemodel(results, validate=False)
 
     return OBBject(results=results)
 
 
 @router.command(
     methods=["POST"],
+    cpu_bound=True,
     examples=[
         PythonEx(
             description="Get Rolling Variance.",
@@ -140,14 +138,19 @@ def variance(
     series_target = get_target_column(df, target)
     series_target.name = f"rolling_var_{window}"
     validate_window(series_target, window)
-    results = series_target.rolling(window).apply(var_).dropna().reset_index(drop=False)
-    results = df_to_basemodel(results)
+    results = (
+        rolling_moments(series_target, window, ["variance"])["variance"]
+        .dropna()
+        .reset_index(drop=False)
+    )
+    results = df_to_basemodel(results, validate=False)
 
     return OBBject(results=results)
 
 
 @router.command(
     methods=["POST"],
+    cpu_bound=True,
     examples=[
         PythonEx(
             description="Get Rolling Standard Deviation.",
@@ -200,15 +203,18 @@ def stdev(
     series_target.name = f"rolling_stdev_{window}"
     validate_window(series_target, window)
     results = (
-        series_target.rolling(window).apply(std_dev_).dropna().reset_index(drop=False)
+        rolling_moments(series_target, window, ["stdev"])["stdev"]
+        .dropna()
+        .reset_index(drop=False)
     )
-    results = df_to_basemodel(results)
+    results = df_to_basemodel(results, validate=False)
 
     return OBBject(results=results)
 
 
 @router.command(
     methods=["POST"],
+    cpu_bound=True,
     examples=[
         PythonEx(
             description="Get Rolling Kurtosis.",
@@ -263,15 +269,18 @@ def kurtosis(
     series_target.name = f"rolling_kurtosis_{window}"
     validate_window(series_target, window)
     results = (
-        series_target.rolling(window).apply(kurtosis_).dropna().reset_index(drop=False)
+        rolling_moments(series_target, window, ["kurtosis"])["kurtosis"]
+        .dropna()
+        .reset_index(drop=False)
     )
-    results = df_to_basemodel(results)
+    results = df_to_basemodel(results, validate=False)
 
     return OBBject(results=results)
 
 
 @router.command(
     methods=["POST"],
+    cpu_bound=True,
     examples=[
         PythonEx(
             description="Get Rolling Quantile.",
@@ -345,13 +354,14 @@ def quantile(
         .reset_index(drop=False)
     )
 
-    results = df_to_basemodel(results)
+    results = df_to_basemodel(results, validate=False)
 
     return OBBject(results=results)
 
 
 @router.command(
     methods=["POST"],
+    cpu_bound=True,
     examples=[
         PythonEx(
             description="Get Rolling Mean.",
@@ -403,8 +413,10 @@ def mean(
     series_target.name = f"rolling_mean_{window}"
     validate_window(series_target, window)
     results = (
-        series_target.rolling(window).apply(mean_).dropna().reset_index(drop=False)
+        rolling_moments(series_target, window, ["mean"])["mean"]
+        .dropna()
+        .reset_index(drop=False)
     )
-    results = df_to_basemodel(results)
+    results = df_to_basemodel(results, validate=False)
 
     return OBBject(results=results)
@@ -1,7 +1,9 @@
 """Statistics Functions."""
 
-from typing import Union
+import warnings
+from typing import Dict, List, Sequence, Union
 
+import numpy as np
 from numpy import (
     mean as mean_np,
     ndarray,
@@ -45,3 +47,155 @@ def std_dev_(data: Union[DataFrame, Series, ndarray]) -> float:
 def var_(data: Union[DataFrame, Series, ndarray]) -> float:
     """Get Variance that is a measure of the amount of variation or dispersion of a set of values."""
     return var_np(data)
+
+
+ROLLING_MOMENTS = ("mean", "variance", "stdev", "skew", "kurtosis")
+
+
+def _chunk_power_sums(values: ndarray, window: int, powers: int) -> List[ndarray]:
+    """Get the sums of the powers of the deviations in each rolling window.
+
+    The rows are split in chunks of `window` rows, so a window ending in chunk j
+    spans the tail of chunk j - 1 and the head of chunk j. Its deviations are
+    taken from the mean of chunk j - 1, which is close to the window mean, and
+    the sums restart at every chunk, so the rounding errors of the running sums
+    stay of the size of a single window, however long the series is.
+
+    Returns the anchors, the mean of the previous chunk of each row, followed by
+    the sums of the deviations to the powers 1 to `powers`, with NaN values
+    counted as no deviation.
+    """
+    rows, columns = values.shape
+    chunks = -(-rows // window)
+    padded = np.full((chunks * window, columns), np.nan)
+    padded[:rows] = values
+    blocks = padded.reshape(chunks, window, columns)
+
+    with np.errstate(invalid="ignore"), warnings.catch_warnings():
+        # Chunks with NaN values only have a NaN mean.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        chunk_means = np.nanmean(blocks, axis=1)
+    chunk_means = np.nan_to_num(chunk_means)
+    anchors = np.concatenate([chunk_means[:1], chunk_means[:-1]])[:, None, :]
+
+    head = np.nan_to_num(blocks - anchors)
+    tail = np.zeros_like(head)
+    tail[1:] = np.nan_to_num(blocks[:-1] - anchors[1:])
+
+    sums = [np.broadcast_to(anchors, blocks.shape).reshape(-1, columns)[:rows]]
+    head_power = np.ones_like(head)
+    tail_power = np.ones_like(tail)
+    for _ in range(powers):
+        head_power = head_power * head
+        tail_power = tail_power * tail
+        tail_prefix = np.cumsum(tail_power, axis=1)
+        window_sums = (
+            np.cumsum(head_power, axis=1) + tail_prefix[:, -1:, :] - tail_prefix
+        )
+        sums.append(window_sums.reshape(-1, columns)[:rows])
+    return sums
+
+
+def rolling_moments(
+    data: Union[DataFrame, Series, ndarray],
+    window: int,
+    moments: Sequence[str] = ROLLING_MOMENTS,
+) -> Dict[str, Union[DataFrame, Series, ndarray]]:
+    """Get rolling moments of one or many columns, in a single pass over the data.
+
+    The moments match `mean_`, `var_`, `std_dev_`, `skew_` and `kurtosis_`
+    applied to every window: population variance and standard deviation, biased
+    skewness and excess kurtosis. Windows with NaN values, and the skewness and
+    kurtosis of windows with constant values, are NaN.
+
+    The sums of the powers of the deviations are updated with cumulative sums
+    instead of recomputed for every window, in O(n) for any window size.
+
+    Parameters
+    ----------
+    data : Union[DataFrame, Series, ndarray]
+        The values, one column per series.
+    window : int
+        Number of observations in each window.
+    moments : Sequence[str]
+        Moments to compute, any of "mean", "variance", "stdev", "skew" and "kurtosis".
+
+    Returns
+    -------
+    Dict[str, Union[DataFrame, Series, ndarray]]
+        The rolling values of each moment, of the same type and shape as the data.
+        The first `window - 1` rows are NaN.
+    """
+    unknown = set(moments) - set(ROLLING_MOMENTS)
+    if unknown:
+        raise ValueError(
+            f"Unknown moments: {', '.join(sorted(unknown))}."
+            f" Choose from: {', '.join(ROLLING_MOMENTS)}."
+        )
+    if window < 1:
+        raise ValueError("Window must be a positive integer.")
+    values = np.asarray(data, dtype=float)
+    is_1d = values.ndim == 1
+    values = values.reshape(len(values), -1)
+    rows = len(values)
+
+    powers = max(
+        {"mean": 1, "variance": 2, "stdev": 2, "skew": 3, "kurtosis": 4}[moment]
+        for moment in moments
+    )
+    anchors, *sums = _chunk_power_sums(values, window, powers)
+
+    # A window is valid when it has `window` rows and no NaN value.
+    nans = np.concatenate(
+        [np.zeros((1, values.shape[1])), np.cumsum(np.isnan(values), axis=0)]
+    )
+    valid = np.zeros(values.shape, dtype=bool)
+    valid[window - 1 :] = (nans[window:] - nans[: rows - window + 1]) == 0
+
+    # Raw moments of the deviations from the anchors, the first one is the shift
+    # from the anchors to the window means.
+    shift, *raw = (total / window for total in sums)
+    results: Dict[str, ndarray] = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if "mean" in moments:
+            results["mean"] = anchors + shift
+        if powers > 1:
+            m2 = np.maximum(raw[0] - shift * shift, 0)
+            # Constant windows only have the rounding errors of the sums left.
+            eps = np.finfo(float).eps
+            flat = m2 <= 4 * window * eps * raw[0]
+            m2[flat] = 0
+            invalid = flat | ~valid
+        if "variance" in moments:
+            results["variance"] = m2
+        if "stdev" in moments:
+            results["stdev"] = np.sqrt(m2)
+        if "skew" in moments:
+            m3 = raw[1] - shift * (3 * raw[0] - 2 * shift * shift)
+            skew = m3 / (m2 * np.sqrt(m2))
+            skew[invalid] = np.nan
+            results["skew"] = skew
+        if "kurtosis" in moments:
+            m4 = raw[2] - shift * (
+                4 * raw[1] - shift * (6 * raw[0] - 3 * shift * shift)
+            )
+            kurtosis = m4 / (m2 * m2) - 3
+            kurtosis[invalid] = np.nan
+            results["kurtosis"] = kurtosis
+    for result in results.values():
+        result[~valid] = np.nan
+    results = {moment: results[moment] for moment in moments}
+
+    if isinstance(data, Series):
+        return {
+            moment: Series(result[:, 0], index=data.index, name=data.name)
+            for moment, result in results.items()
+        }
+    if isinstance(data, DataFrame):
+        return {
+            moment: DataFrame(result, index=data.index, columns=data.columns)
+            for moment, result in results.items()
+        }
+    return {
+        moment: result[:, 0] if is_1d else result for moment, result in results.items()
+    }
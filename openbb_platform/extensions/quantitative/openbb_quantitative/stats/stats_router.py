@@ -73,7 +73,7 @@ def skew(
     df = basemodel_to_df(data)
     series_target = get_target_column(df, target)
     results = pd.DataFrame([skew_(series_target)], columns=["skew"])
-    results = df_to_basemodel(results)
+    results = df_to_basemodel(results, validate=False)
 
     return OBBject(results=results)
 
@@ -121,7 +121,7 @@ def variance(data: List[Data], target: str) -> OBBject[List[Data]]:
     df = basemodel_to_df(data)
     series_target = get_target_column(df, target)
     results = pd.DataFrame([var_(series_target)], columns=["variance"])
-    results = df_to_basemodel(results)
+    results = df_to_basemodel(results, validate=False)
 
     return OBBject(results=results)
 
@@ -170,7 +170,7 @@ def stdev(data: List[Data], target: str) -> OBBject[List[Data]]:
     df = basemodel_to_df(data)
     series_target = get_target_column(df, target)
     results = pd.DataFrame([std_dev_(series_target)], columns=["stdev"])
-    results = df_to_basemodel(results)
+    results = df_to_basemodel(results, validate=False)
 
     return OBBject(results=results)
 
@@ -220,7 +220,7 @@ def kurtosis(data: List[Data], target: str) -> OBBject[List[Data]]:
     df = basemodel_to_df(data)
     series_target = get_target_column(df, target)
     results = pd.DataFrame([kurtosis_(series_target)], columns=["kurtosis"])
-    results = df_to_basemodel(results)
+    results = df_to_basemodel(results, validate=False)
 
     return OBBject(results=results)
 
@@ -278,7 +278,7 @@ def quantile(
     results = pd.DataFrame(
         [series_target.quantile(quantile_pct)], columns=[f"{quantile_pct}_quantile"]
     )
-    results = df_to_basemodel(results)
+    results = df_to_basemodel(results, validate=False)
     return OBBject(results=results)
 
 
@@ -329,6 +329,6 @@ def mean(
     df = basemodel_to_df(data)
     series_target = get_target_column(df, target)
     results = pd.DataFrame([mean_(series_target)], columns=["mean"])
-    results = df_to_basemodel(results)
+    results = df_to_basemodel(results, validate=False)
 
     return OBBject(results=results)
@@ -1,8 +1,18 @@
 """Tests for the statistics module."""
 
+import warnings
+
+import numpy as np
 import pandas as pd
 import pytest
-from openbb_quantitative.statistics import kurtosis_, mean_, skew_, std_dev_, var_
+from openbb_quantitative.statistics import (
+    kurtosis_,
+    mean_,
+    rolling_moments,
+    skew_,
+    std_dev_,
+    var_,
+)
 
 test_data = pd.Series([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
 
@@ -30,3 +40,51 @@ def test_mean():
 def test_var():
     """Test the variance function."""
     assert var_(test_data) == pytest.approx(8.25, abs=1e-3)
+
+
+@pytest.mark.parametrize(
+    "moment, func",
+    [
+        ("mean", mean_),
+        ("variance", var_),
+        ("stdev", std_dev_),
+        ("skew", skew_),
+        ("kurtosis", kurtosis_),
+    ],
+)
+@pytest.mark.parametrize("window", [3, 7, 20])
+def test_rolling_moments(moment, func, window):
+    """Test the rolling moments match the statistics of each window."""
+    rng = np.random.default_rng(0)
+    # A trending series far from zero, with a gap and a flat stretch.
+    values = 1000 + np.cumsum(rng.normal(0.5, 1, 100))
+    values[40] = np.nan
+    values[60:75] = values[60]
+    series = pd.Series(values)
+
+    result = rolling_moments(series, window, [moment])[moment]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        expected = series.rolling(window).apply(func)
+
+    pd.testing.assert_series_equal(result, expected, rtol=1e-7, atol=1e-9)
+
+
+def test_rolling_moments_columns():
+    """Test the moments of many columns are computed in one call."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(50, 3)), columns=["a", "b", "c"])
+
+    result = rolling_moments(df, 10)
+
+    assert list(result) == ["mean", "variance", "stdev", "skew", "kurtosis"]
+    for column in df.columns:
+        expected = rolling_moments(df[column], 10)
+        for moment, values in result.items():
+            pd.testing.assert_series_equal(values[column], expected[moment])
+
+
+def test_rolling_moments_unknown():
+    """Test an unknown moment raises an error."""
+    with pytest.raises(ValueError):
+        rolling_moments(test_data, 3, ["median"])
@@ -998,3 +998,43 @@ def test_technical_relative_rotation(params):
     result = requests.post(url, headers=get_headers(), timeout=10, data=body)
     assert isinstance(result, requests.Response)
     assert result.status_code == 200
+
+
+@parametrize(
+    "params, data_type",
+    [
+        (
+            {
+                "data": "",
+                "indicators": [
+                    {"name": "sma", "length": 50},
+                    {"name": "rsi", "target": "high"},
+                    {"name": "atr"},
+                ],
+                "index": "",
+            },
+            "equity",
+        ),
+        (
+            {
+                "data": "",
+                "indicators": [{"name": "macd"}, {"name": "bbands", "length": 20}],
+                "index": "date",
+            },
+            "crypto",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_technical_pipeline(params, data_type):
+    """Test ta pipeline."""
+    params = {p: v for p, v in params.items() if v}
+    body = json.dumps(
+        {"data": get_data(data_type), "indicators": params.pop("indicators")}
+    )
+
+    query_str = get_querystring(params, ["data"])
+    url = f"http://0.0.0.0:8000/api/v1/technical/pipeline?{query_str}"
+    result = requests.post(url, headers=get_headers(), timeout=10, data=body)
+    assert isinstance(result, requests.Response)
+    assert result.status_code == 200
@@ -968,3 +968,40 @@ def test_technical_relative_rotation(params, obb):
     assert len(result.results.rs_ratios) > 0  # type: ignore
     assert hasattr(result.results, "rs_momentum")
     assert len(result.results.rs_momentum) > 0  # type: ignore
+
+
+@parametrize(
+    "params, data_type",
+    [
+        (
+            {
+                "data": "",
+                "indicators": [
+                    {"name": "sma", "length": 50},
+                    {"name": "rsi", "target": "high"},
+                    {"name": "atr"},
+                ],
+                "index": "",
+            },
+            "stocks",
+        ),
+        (
+            {
+                "data": "",
+                "indicators": [{"name": "macd"}, {"name": "bbands", "length": 20}],
+                "index": "date",
+            },
+            "crypto",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_technical_pipeline(params, data_type, obb):
+    """Test pipeline."""
+    params = {p: v for p, v in params.items() if v}
+    params["data"] = get_data(data_type)
+
+    result = obb.technical.pipeline(**params)
+    assert result
+    assert isinstance(result, OBBject)
+    assert len(result.results) > 0
@@ -1,23 +1,142 @@
 """Technical Analysis Helpers."""
 
-from typing import Any, List, Literal, Optional, Tuple, Union
+import warnings
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 from warnings import warn
 
 import numpy as np
 import pandas as pd
 
-
-def validate_data(data: list, length: Union[int, List[int]]) -> None:
-    """Validate data."""
+# The indicators of the pipeline, with the columns they are computed from.
+# None is the target column of the spec, "close" by default.
+PIPELINE_INDICATORS: Dict[str, Optional[List[str]]] = {
+    "ad": ["high", "low", "close", "volume"],
+    "adosc": ["open", "high", "low", "close", "volume"],
+    "adx": ["close", "high", "low"],
+    "aroon": ["high", "low", "close"],
+    "atr": ["high", "low", "close"],
+    "bbands": None,
+    "cci": ["close", "high", "low"],
+    "cg": ["high", "low", "close"],
+    "donchian": ["high", "low"],
+    "ema": None,
+    "fisher": ["high", "low"],
+    "hma": None,
+    "kc": ["high", "low", "close"],
+    "macd": None,
+    "obv": ["close", "volume"],
+    "rsi": None,
+    "sma": None,
+    "stoch": ["close", "high", "low"],
+    "wma": None,
+    "zlma": None,
+}
+# The indicators whose commands drop the rows with a missing value in any of
+# their columns, the values of the other columns on these rows are left out.
+PIPELINE_DROPNA = {
+    "ad",
+    "adx",
+    "aroon",
+    "cci",
+    "cg",
+    "donchian",
+    "ema",
+    "hma",
+    "kc",
+    "macd",
+    "rsi",
+    "sma",
+    "stoch",
+    "wma",
+    "zlma",
+}
+# The parameters of the indicators that are a number of periods.
+PIPELINE_LENGTHS = {
+    "length",
+    "fast",
+    "slow",
+    "signal",
+    "lower_length",
+    "upper_length",
+    "fast_k_period",
+    "slow_d_period",
+    "slow_k_period",
+}
+
+
+def validate_data(
+    data: Union[list, pd.DataFrame], length: Union[int, List[int]]
+) -> None:
+    """Validate data.
+
+    The rows of a DataFrame with a "symbol" column are counted for each symbol.
+    """
     if isinstance(length, int):
         length = [length]
+    rows = len(data)
+    if isinstance(data, pd.DataFrame) and "symbol" in data.columns and rows:
+        rows = data.groupby("symbol", sort=False, dropna=False).size().min()
     for item in length:
-        if item > len(data):
+        if item > rows:
             raise ValueError(
                 f"Data length is less than required by parameters: {max(length)}"
             )
 
 
+def apply_by_symbol(
+    data: pd.DataFrame,
+    func: Callable[[pd.DataFrame], Union[pd.DataFrame, pd.Series, None]],
+    join: bool = True,
+) -> pd.DataFrame:
+    """Apply an indicator to the rows of each symbol.
+
+    When the data has a "symbol" column with more than one symbol, the indicator
+    is applied to the rows of each symbol and the outputs are concatenated in long
+    format, grouped by symbol in the order of their first row.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Data of one or more symbols, indexed and sorted by date.
+    func : Callable[[pd.DataFrame], Union[pd.DataFrame, pd.Series, None]]
+        The indicator, applied to the rows of one symbol.
+    join : bool
+        Concatenate the columns of the indicator to the rows, by default True.
+        Otherwise, the indicator returns the output rows itself.
+
+    Returns
+    -------
+    pd.DataFrame
+        The output of the indicator for all the symbols.
+    """
+
+    def apply(rows: pd.DataFrame) -> pd.DataFrame:
+        if not join:
+            return func(rows)  # type: ignore[return-value]
+        return pd.concat([rows, pd.DataFrame(func(rows))], axis=1)
+
+    if "symbol" not in data.columns or data["symbol"].nunique(dropna=False) < 2:
+        return apply(data)
+    return pd.concat(
+        [apply(rows) for _, rows in data.groupby("symbol", sort=False, dropna=False)]
+    )
+
+
+def validate_pipeline(indicators: List[Dict[str, Any]]) -> None:
+    """Validate the specs of the indicators of a pipeline."""
+    if not indicators:
+        raise ValueError("The pipeline requires at least one indicator.")
+    for spec in indicators:
+        name = spec.get("name")
+        if name not in PIPELINE_INDICATORS:
+            raise ValueError(
+                f"Indicator '{name}' is not available in a pipeline."
+                f" Choose from {', '.join(PIPELINE_INDICATORS)}"
+            )
+        if "target" in spec and PIPELINE_INDICATORS[name] is not None:
+            raise ValueError(f"Indicator '{name}' doesn't take a target column.")
+
+
 def parkinson(
     data: pd.DataFrame,
     window: int = 30,
@@ -375,6 +494,117 @@ def yang_zhang(
     return result
 
 
+CONE_WINDOWS = [3, 10, 30, 60, 90, 120, 150, 180, 210, 240, 300, 360]
+
+
+def _align_symbols(
+    data: pd.DataFrame, columns: List[str]
+) -> Tuple[List[Any], Dict[str, np.ndarray]]:
+    """Get the prices of each symbol as columns of arrays, aligned on their last row.
+
+    The estimators only depend on the order of the rows of each symbol, so the
+    rows are aligned by position, with NaN before the first row of the symbols
+    with a shorter history.
+    """
+    data = data.sort_index(ascending=True)
+    if "symbol" not in data.columns or data["symbol"].nunique() < 2:
+        return [None], {
+            column: data[[column]].to_numpy(dtype=float) for column in columns
+        }
+
+    codes, symbols = pd.factorize(data["symbol"])
+    sizes = np.bincount(codes)
+    rows = sizes.max()
+    position = rows - sizes[codes] + data.groupby(codes).cumcount().to_numpy()
+    prices = {}
+    for column in columns:
+        prices[column] = np.full((rows, len(symbols)), np.nan)
+        prices[column][position, codes] = data[column].to_numpy(dtype=float)
+    return list(symbols), prices
+
+
+def _column_quantiles(values: np.ndarray, quantiles: List[float]) -> np.ndarray:
+    """Get quantiles of each column without the NaN values, interpolated like pandas.
+
+    The columns are sorted once, np.nanquantile handles the columns with NaN
+    values one at a time.
+    """
+    ordered = np.sort(values, axis=0)
+    last = np.sum(~np.isnan(values), axis=0) - 1
+    positions = np.multiply.outer(quantiles, np.maximum(last, 0))
+    lower = np.floor(positions).astype(int)
+    upper = np.minimum(lower + 1, np.maximum(last, 0))
+    columns = np.arange(values.shape[1])
+    result = ordered[lower, columns] + (
+        ordered[upper, columns] - ordered[lower, columns]
+    ) * (positions - lower)
+    result[:, last < 0] = np.nan
+    return result
+
+
+def _cone_terms(
+    prices: Dict[str, np.ndarray], model: str
+) -> Tuple[List[np.ndarray], Callable[[List[np.ndarray], int], np.ndarray]]:
+    """Get the terms summed over each window by a volatility model, and the volatility of their sums.
+
+    The log ratios of the prices are computed once for all the windows.
+
+    Returns
+    -------
+    Tuple[List[np.ndarray], Callable[[List[np.ndarray], int], np.ndarray]]
+        The terms of each row, and the function of the window sums of the terms
+        and the window size giving the volatility, not yet annualized.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if model in ("std", "hodges_tompkins", "yang_zhang"):
+            log_cc = np.full_like(prices["close"], np.nan)
+            log_cc[1:] = np.log(prices["close"][1:] / prices["close"][:-1])
+        if model in ("garman_klass", "rogers_satchell", "yang_zhang"):
+            log_co = np.log(prices["close"] / prices["open"])
+        if model in ("rogers_satchell", "yang_zhang"):
+            log_ho = np.log(prices["high"] / prices["open"])
+            log_lo = np.log(prices["low"] / prices["open"])
+            rs = log_ho * (log_ho - log_co) + log_lo * (log_lo - log_co)
+        if model in ("parkinson", "garman_klass"):
+            log_hl = np.log(prices["high"] / prices["low"])
+
+    if model in ("std", "hodges_tompkins"):
+        # The sample standard deviation doesn't depend on the mean, removing it
+        # keeps the sums of the squares small.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            centered = log_cc - np.nanmean(log_cc, axis=0)
+
+        def std(sums: List[np.ndarray], window: int) -> np.ndarray:
+            variance = (sums[1] - sums[0] ** 2 / window) / (window - 1)
+            return np.sqrt(np.maximum(variance, 0))
+
+        return [centered, centered**2], std
+
+    if model == "yang_zhang":
+        log_oc = np.full_like(prices["open"], np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_oc[1:] = np.log(prices["open"][1:] / prices["close"][:-1])
+
+        def yang_zhang_(sums: List[np.ndarray], window: int) -> np.ndarray:
+            k = 0.34 / (1.34 + (window + 1) / (window - 1))
+            return np.sqrt((sums[0] + k * sums[1] + (1 - k) * sums[2]) / (window - 1))
+
+        return [log_oc**2, log_cc**2, rs], yang_zhang_
+
+    if model == "parkinson":
+        terms = (1.0 / (4.0 * np.log(2.0))) * log_hl**2
+    elif model == "garman_klass":
+        terms = 0.5 * log_hl**2 - (2 * np.log(2) - 1) * log_co**2
+    else:
+        terms = rs
+
+    def mean(sums: List[np.ndarray], window: int) -> np.ndarray:
+        return np.sqrt(sums[0] / window)
+
+    return [terms], mean
+
+
 def calculate_cones(
     data: pd.DataFrame,
     lower_q: float,
@@ -390,72 +620,109 @@ def calculate_cones(
     ],
     trading_periods: Optional[int] = None,
 ) -> pd.DataFrame:
-    """Calculate Cones."""
-    estimator = pd.DataFrame()
+    """Calculate Cones.
 
+    The volatility of every window is computed from cumulative sums of the terms
+    of the model, which are computed once, instead of applying the estimator to
+    every window. With a `symbol` column holding several symbols, the cones of
+    all the symbols are computed at once and returned with a `symbol` column.
+    """
     if lower_q > upper_q:
         lower_q, upper_q = upper_q, lower_q
 
     if (lower_q >= 1) or (upper_q >= 1):
         raise ValueError("Error: lower_q and upper_q must be between 0 and 1")
 
-    lower_q_label = str(int(lower_q * 100))
-    upper_q_label = str(int(upper_q * 100))
-    quantiles = [lower_q, upper_q]
-    windows = [3, 10, 30, 60, 90, 120, 150, 180, 210, 240, 300, 360]
-    min_ = []
-    max_ = []
-    median = []
-    top_q = []
-    bottom_q = []
-    realized = []
-    allowed_windows = []
-    data = data.sort_index(ascending=True)
+    if model not in (
+        "std",
+        "parkinson",
+        "garman_klass",
+        "hodges_tompkins",
+        "rogers_satchell",
+        "yang_zhang",
+    ):
+        raise ValueError(f"Error: unknown volatility model '{model}'")
+
+    if trading_periods and is_crypto:
+        warn("is_crypto is overridden by trading_periods.")
+
+    if not trading_periods:
+        trading_periods = 365 if is_crypto else 252
+
+    lower_q_label = f"lower_{int(lower_q * 100)}%"
+    upper_q_label = f"upper_{int(upper_q * 100)}%"
 
-    model_functions = {
-        "std": standard_deviation,
-        "parkinson": parkinson,
-        "garman_klass": garman_klass,
-        "hodges_tompkins": hodges_tompkins,
-        "rogers_satchell": rogers_satchell,
-        "yang_zhang": yang_zhang,
-    }
-
-    for window in windows:
-        estimator = model_functions[model](  # type: ignore
-            window=window,
-            data=data,
-            is_crypto=is_crypto,
-            trading_periods=trading_periods,
+    symbols, prices = _align_symbols(
+        data, [c for c in ["open", "high", "low", "close"] if c in data.columns]
+    )
+    terms, volatility = _cone_terms(prices, model)
+
+    # Cumulative sums of the terms, and of their missing values, shared by all the windows.
+    # Infinite terms, from prices of zero, are missing values too.
+    missing = np.cumsum(~np.all([np.isfinite(term) for term in terms], axis=0), axis=0)
+    missing = np.vstack([np.zeros((1, missing.shape[1])), missing])
+    cumsums = [
+        np.vstack(
+            [
+                np.zeros((1, term.shape[1])),
+                np.cumsum(np.where(np.isfinite(term), term, 0), axis=0),
+            ]
+        )
+        for term in terms
+    ]
+    if model == "hodges_tompkins":
+        count = np.sum(~np.isnan(terms[0]), axis=0)
+
+    records: List[Dict[str, Any]] = []
+    stats: Dict[int, Dict[str, np.ndarray]] = {}
+    for window in CONE_WINDOWS:
+        if window >= len(missing):
+            break
+        sums = [cumsum[window:] - cumsum[:-window] for cumsum in cumsums]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            estimator = volatility(sums, window) * np.sqrt(trading_periods)
+            if model == "hodges_tompkins":
+                n = count - window + 1
+                estimator = estimator / (
+                    1.0 - (window / n) + ((window**2 - 1) / (3 * n**2))
+                )
+        # Windows over missing values have no volatility.
+        estimator[(missing[window:] - missing[:-window]) > 0] = np.nan
+
+        stats[window] = dict(
+            zip(
+                ["min", lower_q_label, "median", upper_q_label, "max"],
+                _column_quantiles(estimator, [0, lower_q, 0.5, upper_q, 1]),
+            )
+        )
+        valid = ~np.isnan(estimator)
+        last = len(estimator) - 1 - np.argmax(valid[::-1], axis=0)
+        stats[window]["realized"] = np.where(
+            valid.any(axis=0), estimator[last, np.arange(estimator.shape[1])], np.nan
         )
 
-        if estimator.empty:
-            continue
-
-        min_.append(estimator.min())  # type: ignore
-        max_.append(estimator.max())  # type: ignore
-        median.append(estimator.median())  # type: ignore
-        top_q.append(estimator.quantile(quantiles[1]))  # type: ignore
-        bottom_q.append(estimator.quantile(quantiles[0]))  # type: ignore
-        realized.append(estimator[-1])  # type: ignore
-
-        allowed_windows.append(window)
-
-    df_ = [realized, min_, bottom_q, median, top_q, max_]
-    df_windows = allowed_windows
-    df = pd.DataFrame(df_, columns=df_windows)
-    df = df.rename(
-        index={
-            0: "realized",
-            1: "min",
-            2: f"lower_{lower_q_label}%",
-            3: "median",
-            4: f"upper_{upper_q_label}%",
-            5: "max",
-        }
+    for i, symbol in enumerate(symbols):
+        for window, values in stats.items():
+            if np.isnan(values["realized"][i]):
+                continue
+            record: Dict[str, Any] = {} if symbol is None else {"symbol": symbol}
+            record["window"] = window
+            for name in [
+                "realized",
+                "min",
+                lower_q_label,
+                "median",
+                upper_q_label,
+                "max",
+            ]:
+                record[name] = float(values[name][i])
+            records.append(record)
+
+    return pd.DataFrame.from_records(
+        records,
+        columns=(["symbol"] if symbols != [None] else [])
+        + ["window", "realized", "min", lower_q_label, "median", upper_q_label, "max"],
     )
-    cones_df = df.copy()
-    return cones_df.transpose().reset_index().rename(columns={"index": "window"})
 
 
 def clenow_momentum(
@@ -1,7 +1,8 @@
 """Technical Analysis Router."""
 
 # pylint: disable=too-many-lines
-from typing import Any, Dict, List, Literal, Optional
+import inspect
+from typing import Any, Callable, Dict, List, Literal, Optional
 
 import pandas as pd
 import pandas_ta as ta
@@ -18,10 +19,15 @@ from openbb_core.provider.abstract.data import Data
 from pydantic import NonNegativeFloat, NonNegativeInt, PositiveFloat, PositiveInt
 
 from openbb_technical.helpers import (
+    PIPELINE_DROPNA,
+    PIPELINE_INDICATORS,
+    PIPELINE_LENGTHS,
+    apply_by_symbol,
     calculate_cones,
     calculate_fib_levels,
     clenow_momentum,
     validate_data,
+    validate_pipeline,
 )
 from openbb_technical.relative_rotation import (
     RelativeRotationData,
@@ -35,6 +41,7 @@ router = Router(prefix="", description="Technical Analysis tools.")
 
 @router.command(
     methods=["POST"],
+    cpu_bound=True,
     examples=[
         PythonEx(
             description="Calculate the Relative Strength Ratio and Relative Strength Momentum"
@@ -215,15 +222,15 @@ def atr(
     OBBject[List[Data]]
         List of data with the indicator applied.
     """
-    validate_data(data, length)
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_columns(df, ["high", "low", "close"])
-    df_atr = pd.DataFrame(
-        df_target.ta.atr(length=length, mamode=mamode, drift=drift, offset=offset)
+    validate_data(df, length)
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, ["high", "low", "close"]).ta.atr(
+            length=length, mamode=mamode, drift=drift, offset=offset
+        ),
     )
-
-    output = pd.concat([df, df_atr], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -294,7 +301,7 @@ def fib(
     df_fib["max_pr"] = max_pr
     df_fib["lvl_text"] = lvl_text
 
-    results = df_to_basemodel(df_fib)
+    results = df_to_basemodel(df_fib, validate=False)
 
     return OBBject(results=results)
 
@@ -343,11 +350,11 @@ def obv(
         List of data with the indicator applied.
     """
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_columns(df, ["close", "volume"])
-    df_obv = pd.DataFrame(df_target.ta.obv(offset=offset))
-
-    output = pd.concat([df, df_obv], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, ["close", "volume"]).ta.obv(offset=offset),
+    )
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -395,13 +402,15 @@ def fisher(
     OBBject[List[Data]]
         List of data with the indicator applied.
     """
-    validate_data(data, [length, signal])
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_columns(df, ["high", "low"])
-    df_fisher = pd.DataFrame(df_target.ta.fisher(length=length, signal=signal))
-
-    output = pd.concat([df, df_fisher], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    validate_data(df, [length, signal])
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, ["high", "low"]).ta.fisher(
+            length=length, signal=signal
+        ),
+    )
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -453,13 +462,15 @@ def adosc(
     OBBject[List[Data]]
         The calculated data.
     """
-    validate_data(data, [fast, slow])
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_columns(df, ["open", "high", "low", "close", "volume"])
-    df_adosc = pd.DataFrame(df_target.ta.adosc(fast=fast, slow=slow, offset=offset))
-
-    output = pd.concat([df, df_adosc], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    validate_data(df, [fast, slow])
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(
+            df, ["open", "high", "low", "close", "volume"]
+        ).ta.adosc(fast=fast, slow=slow, offset=offset),
+    )
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -523,22 +534,20 @@ def bbands(
     OBBject[List[Data]]
         The calculated data.
     """
-    validate_data(data, length)
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_column(df, target).to_frame()
-    bbands_df = pd.DataFrame(
-        df_target.ta.bbands(
+    validate_data(df, length)
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, [target]).ta.bbands(
             length=length,
             std=std,
             mamode=mamode,
             offset=offset,
             close=target,
             prefix=target,
-        )
+        ),
     )
-
-    output = pd.concat([df, bbands_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -590,20 +599,15 @@ def zlma(
     OBBject[List[Data]]
         The calculated data.
     """
-    validate_data(data, length)
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_column(df, target).to_frame()
-    zlma_df = pd.DataFrame(
-        df_target.ta.zlma(
-            length=length,
-            offset=offset,
-            close=target,
-            prefix=target,
-        )
-    ).dropna()
-
-    output = pd.concat([df, zlma_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    validate_data(df, length)
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, [target])
+        .ta.zlma(length=length, offset=offset, close=target, prefix=target)
+        .dropna(),
+    )
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -657,13 +661,15 @@ def aroon(
     OBBject[List[Data]]
         The calculated data.
     """
-    validate_data(data, length)
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_columns(df, ["high", "low", "close"])
-    df_aroon = pd.DataFrame(df_target.ta.aroon(length=length, scalar=scalar)).dropna()
-
-    output = pd.concat([df, df_aroon], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    validate_data(df, length)
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, ["high", "low", "close"])
+        .ta.aroon(length=length, scalar=scalar)
+        .dropna(),
+    )
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -716,26 +722,22 @@ def sma(
     OBBject[List[Data]]
         The calculated data.
     """
-    validate_data(data, length)
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_column(df, target).to_frame()
-    sma_df = pd.DataFrame(
-        df_target.ta.sma(
-            length=length,
-            offset=offset,
-            close=target,
-            prefix=target,
-        ).dropna()
+    validate_data(df, length)
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, [target])
+        .ta.sma(length=length, offset=offset, close=target, prefix=target)
+        .dropna(),
     )
-
-    output = pd.concat([df, sma_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
 
 @router.command(
     methods=["POST"],
+    cpu_bound=True,
     examples=[
         PythonEx(
             description="Get the Demark Sequential Indicator.",
@@ -784,12 +786,19 @@ def demark(
         The calculated data.
     """
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_column(df, target).to_frame()
-    _demark = ta.td_seq(
-        df_target[target], asint=asint, show_all=show_all, offset=offset
-    )
-    demark_df = df[[target]].reset_index().join(_demark)
-    results = df_to_basemodel(demark_df)
+    columns = [target, "symbol"] if "symbol" in df.columns else [target]
+
+    def td_seq(df: pd.DataFrame) -> pd.DataFrame:
+        _demark = ta.td_seq(
+            get_target_column(df, target),
+            asint=asint,
+            show_all=show_all,
+            offset=offset,
+        )
+        return df[columns].reset_index().join(_demark)
+
+    demark_df = apply_by_symbol(df, td_seq, join=False)
+    results = df_to_basemodel(demark_df, validate=False)
 
     return OBBject(results=results)
 
@@ -841,11 +850,13 @@ def vwap(
     df = basemodel_to_df(data, index=index)
     if index == "date":
         df.index = pd.to_datetime(df.index)
-    df_target = get_target_columns(df, ["high", "low", "close", "volume"])
-    df_vwap = pd.DataFrame(df_target.ta.vwap(anchor=anchor, offset=offset).dropna())
-
-    output = pd.concat([df, df_vwap], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, ["high", "low", "close", "volume"])
+        .ta.vwap(anchor=anchor, offset=offset)
+        .dropna(),
+    )
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -910,20 +921,15 @@ def macd(
     OBBject[List[Data]]
         The calculated data.
     """
-    validate_data(data, [fast, slow, signal])
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_column(df, target).to_frame()
-    macd_df = pd.DataFrame(
-        df_target.ta.macd(
-            fast=fast,
-            slow=slow,
-            signal=signal,
-            close=target,
-            prefix=target,
-        ).dropna()
+    validate_data(df, [fast, slow, signal])
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, [target])
+        .ta.macd(fast=fast, slow=slow, signal=signal, close=target, prefix=target)
+        .dropna(),
     )
-    output = pd.concat([df, macd_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -972,20 +978,15 @@ def hma(
     OBBject[List[Data]]
         The calculated data.
     """
-    validate_data(data, length)
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_column(df, target).to_frame()
-    hma_df = pd.DataFrame(
-        df_target.ta.hma(
-            length=length,
-            offset=offset,
-            close=target,
-            prefix=target,
-        ).dropna()
+    validate_data(df, length)
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, [target])
+        .ta.hma(length=length, offset=offset, close=target, prefix=target)
+        .dropna(),
     )
-
-    output = pd.concat([df, hma_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -1042,23 +1043,24 @@ def donchian(
     OBBject[List[Data]]
         The calculated data.
     """
-    validate_data(data, [lower_length, upper_length])
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_columns(df, ["high", "low"])
-    donchian_df = pd.DataFrame(
-        df_target.ta.donchian(
+    validate_data(df, [lower_length, upper_length])
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, ["high", "low"])
+        .ta.donchian(
             lower_length=lower_length, upper_length=upper_length, offset=offset
-        ).dropna()
+        )
+        .dropna(),
     )
-
-    output = pd.concat([df, donchian_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
 
 @router.command(
     methods=["POST"],
+    cpu_bound=True,
     examples=[
         PythonEx(
             description="Get the Ichimoku Cloud.",
@@ -1108,27 +1110,32 @@ def ichimoku(
     OBBject[List[Data]]
         The calculated data.
     """
-    validate_data(data, [conversion, base, lagging])
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_columns(df, ["high", "low", "close"])
-    df_ichimoku, df_span = df_target.ta.ichimoku(
-        tenkan=conversion,
-        kijun=base,
-        senkou=lagging,
-        offset=offset,
-        lookahead=lookahead,
-    )
+    validate_data(df, [conversion, base, lagging])
+
+    def cloud(df: pd.DataFrame) -> pd.DataFrame:
+        df_target = get_target_columns(df, ["high", "low", "close"])
+        df_ichimoku, df_span = df_target.ta.ichimoku(
+            tenkan=conversion,
+            kijun=base,
+            senkou=lagging,
+            offset=offset,
+            lookahead=lookahead,
+        )
+
+        df_result = df.join(df_span.add_prefix("span_"), how="left")
+        return df_result.join(df_ichimoku, how="left")
 
-    df_result = df.join(df_span.add_prefix("span_"), how="left")
-    df_result = df_result.join(df_ichimoku, how="left")
+    df_result = apply_by_symbol(df, cloud, join=False)
 
-    results = df_to_basemodel(df_result.reset_index())
+    results = df_to_basemodel(df_result.reset_index(), validate=False)
 
     return OBBject(results=results)
 
 
 @router.command(
     methods=["POST"],
+    cpu_bound=True,
     examples=[
         PythonEx(
             description="Get the Clenow Volatility Adjusted Momentum.",
@@ -1168,23 +1175,30 @@ def clenow(
     OBBject[List[Data]]
         The calculated data.
     """
-    validate_data(data, period)
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_column(df, target)
+    validate_data(df, period)
 
-    r2, coef, _ = clenow_momentum(df_target, period)
+    def momentum(df: pd.DataFrame) -> pd.DataFrame:
+        df_target = get_target_column(df, target)
+
+        r2, coef, _ = clenow_momentum(df_target, period)
+
+        df_clenow = pd.DataFrame.from_dict(
+            {
+                "r^2": f"{r2:.5f}",
+                "fit_coef": f"{coef:.5f}",
+                "factor": f"{coef * r2:.5f}",
+            },
+            orient="index",
+        ).transpose()
+        # The momentum is added as a last row, with the symbol it belongs to.
+        if "symbol" in df.columns:
+            df_clenow["symbol"] = df["symbol"].iloc[0]
 
-    df_clenow = pd.DataFrame.from_dict(
-        {
-            "r^2": f"{r2:.5f}",
-            "fit_coef": f"{coef:.5f}",
-            "factor": f"{coef * r2:.5f}",
-        },
-        orient="index",
-    ).transpose()
+        return pd.concat([df, df_clenow])
 
-    output = pd.concat([df, df_clenow], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    output = apply_by_symbol(df, momentum, join=False)
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -1233,11 +1247,13 @@ def ad(data: List[Data], index: str = "date", offset: int = 0) -> OBBject[List[D
         The calculated data.
     """
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_columns(df, ["high", "low", "close", "volume"])
-    ad_df = pd.DataFrame(df_target.ta.ad(offset=offset).dropna())
-
-    output = pd.concat([df, ad_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, ["high", "low", "close", "volume"])
+        .ta.ad(offset=offset)
+        .dropna(),
+    )
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -1286,15 +1302,15 @@ def adx(
     OBBject[List[Data]]
         The calculated data.
     """
-    validate_data(data, length)
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_columns(df, ["close", "high", "low"])
-    df_adx = pd.DataFrame(
-        df_target.ta.adx(length=length, scalar=scalar, drift=drift).dropna()
+    validate_data(df, length)
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, ["close", "high", "low"])
+        .ta.adx(length=length, scalar=scalar, drift=drift)
+        .dropna(),
     )
-
-    output = pd.concat([df, df_adx], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -1344,20 +1360,15 @@ def wma(
     OBBject[List[Data]]
         The WMA data.
     """
-    validate_data(data, length)
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_column(df, target).to_frame()
-    df_wma = pd.DataFrame(
-        df_target.ta.wma(
-            length=length,
-            offset=offset,
-            close=target,
-            prefix=target,
-        ).dropna()
+    validate_data(df, length)
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, [target])
+        .ta.wma(length=length, offset=offset, close=target, prefix=target)
+        .dropna(),
     )
-
-    output = pd.concat([df, df_wma], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -1405,13 +1416,15 @@ def cci(
     OBBject[List[Data]]
         The CCI data.
     """
-    validate_data(data, length)
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_columns(df, ["close", "high", "low"])
-    cci_df = pd.DataFrame(df_target.ta.cci(length=length, scalar=scalar).dropna())
-
-    output = pd.concat([df, cci_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    validate_data(df, length)
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, ["close", "high", "low"])
+        .ta.cci(length=length, scalar=scalar)
+        .dropna(),
+    )
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -1465,21 +1478,15 @@ def rsi(
     OBBject[List[Data]]
         The RSI data.
     """
-    validate_data(data, length)
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_column(df, target).to_frame()
-    rsi_df = pd.DataFrame(
-        df_target.ta.rsi(
-            length=length,
-            scalar=scalar,
-            drift=drift,
-            close=target,
-            prefix=target,
-        ).dropna()
+    validate_data(df, length)
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, [target])
+        .ta.rsi(length=length, scalar=scalar, drift=drift, close=target, prefix=target)
+        .dropna(),
     )
-
-    output = pd.concat([df, rsi_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -1530,19 +1537,19 @@ def stoch(
     OBBject[List[Data]]
         The Stochastic Oscillator data.
     """
-    validate_data(data, [fast_k_period, slow_d_period, slow_k_period])
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_columns(df, ["close", "high", "low"])
-    stoch_df = pd.DataFrame(
-        df_target.ta.stoch(
+    validate_data(df, [fast_k_period, slow_d_period, slow_k_period])
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, ["close", "high", "low"])
+        .ta.stoch(
             fast_k_period=fast_k_period,
             slow_d_period=slow_d_period,
             slow_k_period=slow_k_period,
-        ).dropna()
+        )
+        .dropna(),
     )
-
-    output = pd.concat([df, stoch_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -1596,19 +1603,15 @@ def kc(
     OBBject[List[Data]]
         The Keltner Channels data.
     """
-    validate_data(data, length)
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_columns(df, ["high", "low", "close"])
-    kc_df = pd.DataFrame(
-        df_target.ta.kc(
-            length=length,
-            scalar=scalar,
-            mamode=mamode,
-            offset=offset,
-        ).dropna()
+    validate_data(df, length)
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, ["high", "low", "close"])
+        .ta.kc(length=length, scalar=scalar, mamode=mamode, offset=offset)
+        .dropna(),
     )
-    output = pd.concat([df, kc_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -1651,13 +1654,15 @@ def cg(
     OBBject[List[Data]]
         The COG data.
     """
-    validate_data(data, length)
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_columns(df, ["high", "low", "close"])
-    cg_df = pd.DataFrame(df_target.ta.cg(length=length).dropna())
-
-    output = pd.concat([df, cg_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    validate_data(df, length)
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, ["high", "low", "close"])
+        .ta.cg(length=length)
+        .dropna(),
+    )
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
 
@@ -1711,6 +1716,7 @@ def cones(
     ----------
     data : List[Data]
         The data to use for the calculation.
+        With several symbols in a `symbol` column, the cones of each symbol are returned, with a `symbol` field.
     index : str, optional
         Index column name to use with `data`, by default "date"
     lower_q : float, optional
@@ -1762,7 +1768,7 @@ def cones(
         trading_periods=trading_periods,
     )
 
-    results = df_to_basemodel(df_cones)
+    results = df_to_basemodel(df_cones, validate=False)
 
     return OBBject(results=results)
 
@@ -1812,16 +1818,140 @@ def ema(
     OBBject[List[Data]]
         The calculated data.
     """
-    validate_data(data, length)
     df = basemodel_to_df(data, index=index)
-    df_target = get_target_column(df, target).to_frame()
-    ema_df = pd.DataFrame(
-        df_target.ta.ema(
-            length=length, offset=offset, close=target, prefix=target
-        ).dropna()
+    validate_data(df, length)
+    output = apply_by_symbol(
+        df,
+        lambda df: get_target_columns(df, [target])
+        .ta.ema(length=length, offset=offset, close=target, prefix=target)
+        .dropna(),
     )
+    results = df_to_basemodel(output.reset_index(), validate=False)
+
+    return OBBject(results=results)
+
 
-    output = pd.concat([df, ema_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+# The commands of the indicators of a pipeline, for their default parameters.
+PIPELINE_COMMANDS: Dict[str, Callable] = {
+    "ad": ad,
+    "adosc": adosc,
+    "adx": adx,
+    "aroon": aroon,
+    "atr": atr,
+    "bbands": bbands,
+    "cci": cci,
+    "cg": cg,
+    "donchian": donchian,
+    "ema": ema,
+    "fisher": fisher,
+    "hma": hma,
+    "kc": kc,
+    "macd": macd,
+    "obv": obv,
+    "rsi": rsi,
+    "sma": sma,
+    "stoch": stoch,
+    "wma": wma,
+    "zlma": zlma,
+}
+
+
+def _fill_defaults(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill the parameters missing from the spec of an indicator with the defaults of its command."""
+    parameters = inspect.signature(PIPELINE_COMMANDS[spec["name"]]).parameters
+    defaults = {
+        name: parameter.default
+        for name, parameter in parameters.items()
+        if name not in ("data", "index")
+        and parameter.default is not inspect.Parameter.empty
+    }
+    return {**defaults, **spec}
+
+
+def _calculate_indicator(df: pd.DataFrame, spec: Dict[str, Any]) -> pd.DataFrame:
+    """Calculate an indicator of a pipeline, with the columns of its command."""
+    params = dict(spec)
+    name = params.pop("name")
+    columns = PIPELINE_INDICATORS[name]
+    if columns is None:
+        target = params.pop("target", "close")
+        columns = [target]
+        params.update(close=target, prefix=target)
+    output = getattr(get_target_columns(df, columns).ta, name)(**params)
+    if name in PIPELINE_DROPNA:
+        output = output.dropna()
+    return pd.DataFrame(output)
+
+
+@router.command(
+    methods=["POST"],
+    cpu_bound=True,
+    examples=[
+        PythonEx(
+            description="Calculate several indicators at once.",
+            code=[
+                "stock_data = obb.equity.price.historical(symbol='TSLA', start_date='2023-01-01', provider='fmp')",
+                "pipeline_data = obb.technical.pipeline(data=stock_data.results, indicators=["
+                + "{'name': 'sma', 'length': 50}, {'name': 'rsi', 'length': 14}, {'name': 'atr'}])",
+            ],
+        ),
+        APIEx(
+            parameters={
+                "indicators": [
+                    {"name": "sma", "length": 2},
+                    {"name": "ema", "target": "high", "length": 2},
+                ],
+                "data": APIEx.mock_data("timeseries"),
+            }
+        ),
+    ],
+)
+def pipeline(
+    data: List[Data],
+    indicators: List[Dict[str, Any]],
+    index: str = "date",
+) -> OBBject[List[Data]]:
+    """Calculate several indicators at once.
+
+    The data is converted once for all the indicators, and their columns are
+    returned together, as the separate commands would add them to the data.
+
+    Parameters
+    ----------
+    data : List[Data]
+        List of data to be used for the calculation.
+    indicators : List[Dict[str, Any]]
+        The indicators, each with its "name" and the parameters of its command,
+        such as {"name": "sma", "target": "close", "length": 50}.
+        The parameters not given take the defaults of the command.
+        Available indicators are ad, adosc, adx, aroon, atr, bbands, cci, cg,
+        donchian, ema, fisher, hma, kc, macd, obv, rsi, sma, stoch, wma and zlma.
+    index : str, optional
+        Index column name to use with `data`, by default "date".
+
+    Returns
+    -------
+    OBBject[List[Data]]
+        The data with the columns of all the indicators.
+    """
+    validate_pipeline(indicators)
+    indicators = [_fill_defaults(spec) for spec in indicators]
+    df = basemodel_to_df(data, index=index)
+    validate_data(
+        df,
+        [
+            value
+            for spec in indicators
+            for name, value in spec.items()
+            if name in PIPELINE_LENGTHS
+        ],
+    )
+    output = apply_by_symbol(
+        df,
+        lambda df: pd.concat(
+            [_calculate_indicator(df, spec) for spec in indicators], axis=1
+        ),
+    )
+    results = df_to_basemodel(output.reset_index(), validate=False)
 
     return OBBject(results=results)
@@ -1,9 +1,15 @@
 """Test the technical helpers module."""
 
+import ast
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
 import pytest
 from extensions.technical.openbb_technical.helpers import (
+    PIPELINE_DROPNA,
+    PIPELINE_INDICATORS,
+    apply_by_symbol,
     calculate_cones,
     calculate_fib_levels,
     clenow_momentum,
@@ -12,6 +18,7 @@ from extensions.technical.openbb_technical.helpers import (
     parkinson,
     rogers_satchell,
     validate_data,
+    validate_pipeline,
     yang_zhang,
 )
 
@@ -99,3 +106,148 @@ def test_validate_data_with_mock_data(mock_data):
         validate_data(mock_data["close"].tolist(), 20)
     except ValueError:
         pytest.fail("validate_data raised ValueError unexpectedly!")
+
+
+def test_validate_data_symbols(mock_data):
+    """Test validate_data counts the rows of each symbol."""
+    data = pd.concat(
+        [mock_data.assign(symbol="A"), mock_data.iloc[:10].assign(symbol="B")]
+    )
+    validate_data(data, 10)
+    with pytest.raises(ValueError):
+        validate_data(data, 20)
+
+
+def test_validate_pipeline():
+    """Test the specs of a pipeline are validated."""
+    validate_pipeline([{"name": "sma", "target": "high"}, {"name": "atr"}])
+    with pytest.raises(ValueError):
+        validate_pipeline([])
+    with pytest.raises(ValueError):
+        validate_pipeline([{"name": "vwap"}])
+    with pytest.raises(ValueError):
+        validate_pipeline([{"name": "atr", "target": "close"}])
+
+
+def test_pipeline_dropna():
+    """Test the pipeline drops the missing values of the indicators whose commands do."""
+    router = Path(__file__).parent.parent / "openbb_technical" / "technical_router.py"
+    commands = {
+        node.name: node
+        for node in ast.parse(router.read_text()).body
+        if isinstance(node, ast.FunctionDef) and node.name in PIPELINE_INDICATORS
+    }
+    assert set(commands) == set(PIPELINE_INDICATORS)
+    dropna = {
+        name
+        for name, node in commands.items()
+        if any(
+            isinstance(n, ast.Attribute) and n.attr == "dropna" for n in ast.walk(node)
+        )
+    }
+    assert dropna == PIPELINE_DROPNA
+
+
+def test_apply_by_symbol(mock_data):
+    """Test an indicator is applied to the rows of each symbol."""
+    data = pd.concat(
+        [
+            mock_data.assign(symbol="A"),
+            (mock_data.iloc[:40] * 2).assign(symbol="B"),
+        ]
+    )
+
+    def sma(df):
+        return df["close"].rolling(5).mean().rename("SMA_5").dropna()
+
+    result = apply_by_symbol(data, sma)
+
+    assert list(result.columns) == [*data.columns, "SMA_5"]
+    assert list(result["symbol"].unique()) == ["A", "B"]
+    for symbol, prices in [("A", mock_data), ("B", mock_data.iloc[:40] * 2)]:
+        pd.testing.assert_frame_equal(
+            result[result["symbol"] == symbol].drop(columns="symbol"),
+            apply_by_symbol(prices, sma),
+            check_freq=False,
+        )
+
+
+@pytest.mark.parametrize(
+    "model, estimator",
+    [
+        ("parkinson", parkinson),
+        ("garman_klass", garman_klass),
+        ("hodges_tompkins", hodges_tompkins),
+        ("rogers_satchell", rogers_satchell),
+        ("yang_zhang", yang_zhang),
+    ],
+)
+def test_calculate_cones_matches_estimators(model, estimator):
+    """Test the cones match the estimators applied to each window."""
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 400)))
+    data = pd.DataFrame(
+        {
+            "open": close * np.exp(rng.normal(0, 0.005, 400)),
+            "close": close,
+        },
+        index=pd.date_range("2021-01-01", periods=400, freq="D"),
+    )
+    data["high"] = data[["open", "close"]].max(axis=1) * 1.01
+    data["low"] = data[["open", "close"]].min(axis=1) * 0.99
+
+    result = calculate_cones(data, 0.25, 0.75, is_crypto=False, model=model)
+
+    assert list(result["window"]) == [
+        3,
+        10,
+        30,
+        60,
+        90,
+        120,
+        150,
+        180,
+        210,
+        240,
+        300,
+        360,
+    ]
+    for row in result.to_dict("records"):
+        expected = estimator(data, window=row["window"])
+        assert row["realized"] == pytest.approx(expected.iloc[-1])
+        assert row["min"] == pytest.approx(expected.min())
+        assert row["lower_25%"] == pytest.approx(expected.quantile(0.25))
+        assert row["median"] == pytest.approx(expected.median())
+        assert row["upper_75%"] == pytest.approx(expected.quantile(0.75))
+        assert row["max"] == pytest.approx(expected.max())
+
+
+def test_calculate_cones_symbols(mock_data):
+    """Test the cones of several symbols are computed at once."""
+    data = pd.concat(
+        [
+            mock_data.assign(symbol="A"),
+            (mock_data.iloc[:40] * 2).assign(symbol="B"),
+        ]
+    )
+
+    result = calculate_cones(data, 0.1, 0.9, is_crypto=False, model="std")
+
+    assert list(result.columns) == [
+        "symbol",
+        "window",
+        "realized",
+        "min",
+        "lower_10%",
+        "median",
+        "upper_90%",
+        "max",
+    ]
+    for symbol, prices in [("A", mock_data), ("B", mock_data.iloc[:40] * 2)]:
+        expected = calculate_cones(prices, 0.1, 0.9, is_crypto=False, model="std")
+        pd.testing.assert_frame_equal(
+            result[result["symbol"] == symbol]
+            .drop(columns="symbol")
+            .reset_index(drop=True),
+            expected,
+        )
@@ -0,0 +1,70 @@
+"""Test the technical router."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from openbb_core.provider.abstract.data import Data
+
+pytest.importorskip("pandas_ta")
+
+# pylint: disable=redefined-outer-name,wrong-import-position
+from extensions.technical.openbb_technical.technical_router import (  # noqa: E402
+    PIPELINE_COMMANDS,
+    pipeline,
+)
+
+
+@pytest.fixture(scope="module")
+def mock_data(rows: int = 120):
+    """Mock the prices of two symbols."""
+    rng = np.random.default_rng(42)
+    data = []
+    for symbol in ["AAA", "BBB"]:
+        close = 100 + rng.normal(0, 1, rows).cumsum()
+        for i, day in enumerate(pd.date_range("2023-01-01", periods=rows)):
+            data.append(
+                Data(
+                    date=day.date(),
+                    symbol=symbol,
+                    open=close[i] + rng.normal(0, 0.5),
+                    high=close[i] + 1 + rng.random(),
+                    low=close[i] - 1 - rng.random(),
+                    close=close[i],
+                    volume=int(rng.integers(1000, 10000)),
+                )
+            )
+    return data
+
+
+def to_df(results):
+    """Convert the results of a command to a DataFrame."""
+    return pd.DataFrame([r.model_dump() for r in results])
+
+
+@pytest.mark.parametrize("name", list(PIPELINE_COMMANDS))
+def test_pipeline_defaults(mock_data, name):
+    """Test an indicator of a pipeline takes the defaults of its command."""
+    expected = to_df(PIPELINE_COMMANDS[name](data=mock_data).results)
+    result = to_df(pipeline(data=mock_data, indicators=[{"name": name}]).results)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_pipeline_matches_commands(mock_data):
+    """Test a pipeline returns the columns of the separate commands."""
+    indicators = [
+        {"name": "sma", "length": 5},
+        {"name": "ema", "target": "high", "length": 10},
+        {"name": "macd"},
+        {"name": "atr", "length": 7},
+        {"name": "adx", "length": 5},
+    ]
+
+    result = to_df(pipeline(data=mock_data, indicators=indicators).results)
+
+    for spec in indicators:
+        params = {k: v for k, v in spec.items() if k != "name"}
+        expected = to_df(
+            PIPELINE_COMMANDS[spec["name"]](data=mock_data, **params).results
+        )
+        pd.testing.assert_frame_equal(result[expected.columns], expected)
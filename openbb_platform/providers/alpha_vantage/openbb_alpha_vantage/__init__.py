@@ -3,6 +3,7 @@
 from openbb_alpha_vantage.models.equity_historical import AVEquityHistoricalFetcher
 from openbb_alpha_vantage.models.historical_eps import AVHistoricalEpsFetcher
 from openbb_core.provider.abstract.provider import Provider
+from openbb_core.provider.utils.rate_limiter import RateLimit
 
 alpha_vantage_provider = Provider(
     name="alpha_vantage",
@@ -22,5 +23,7 @@ cloud-based APIs, Excel, and Google Sheets. """,
     },
     repr_name="Alpha Vantage",
     v3_credentials=["API_KEY_ALPHAVANTAGE"],
+    # Premium plan quota: 75 requests per minute, the default of OPENBB_RATE_LIMITS.
+    rate_limit=RateLimit(requests_per_second=75 / 60, burst=5, max_concurrent=5),
     instructions='Go to: https://www.alphavantage.co/support/#api-key\n\n![AlphaVantage](https://user-images.githubusercontent.com/46355364/207820936-46c2ba00-81ff-4cd3-98a4-4fa44412996f.png)\n\nFill out the form, pass Captcha, and click on, "GET FREE API KEY".',  # noqa: E501  pylint: disable=line-too-long
 )
@@ -6,9 +6,9 @@ from datetime import date as dateType
 from io import BytesIO, StringIO
 from typing import Any, List, Literal, Optional
 
-from aiohttp_client_cache import SQLiteBackend
 from aiohttp_client_cache.session import CachedSession
 from openbb_core.app.utils import get_user_cache_directory
+from openbb_core.provider.utils.cache_db import get_sqlite_backend
 from openbb_core.provider.utils.client import ClientResponse
 from openbb_core.provider.utils.helpers import amake_request, to_snake_case
 from pandas import DataFrame, read_csv
@@ -77,7 +77,9 @@ CONSTITUENTS_EU = Literal[  # pylint: disable=invalid-name
 ]
 
 cache_dir = get_user_cache_directory()
-backend = SQLiteBackend(f"{cache_dir}/http/cboe_directories", expire_after=3600 * 24)
+backend = get_sqlite_backend(
+    f"{cache_dir}/http/cboe_directories", expire_after=3600 * 24
+)
 
 
 async def response_callback(response: ClientResponse, _: Any):
@@ -6,7 +6,6 @@ import asyncio
 from datetime import datetime
 from typing import Any, Dict, List, Literal, Optional, Union
 
-from aiohttp_client_cache import SQLiteBackend
 from aiohttp_client_cache.session import CachedSession
 from openbb_core.app.utils import get_user_cache_directory
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -14,6 +13,7 @@ from openbb_core.provider.standard_models.yield_curve import (
     YieldCurveData,
     YieldCurveQueryParams,
 )
+from openbb_core.provider.utils.cache_db import get_sqlite_backend
 from openbb_core.provider.utils.errors import EmptyDataError
 from openbb_core.provider.utils.helpers import amake_request
 from openbb_ecb.utils.yield_curve_series import MATURITIES, get_yield_curve_ids
@@ -89,7 +89,7 @@ class ECBYieldCurveFetcher(
             if use_cache is True:
                 cache_dir = f"{get_user_cache_directory()}/http/ecb_yield_curve"
                 async with CachedSession(
-                    cache=SQLiteBackend(cache_dir, expire_after=3600 * 4)
+                    cache=get_sqlite_backend(cache_dir, expire_after=3600 * 4)
                 ) as session:
                     try:
                         response = await amake_request(
@@ -303,7 +303,7 @@ class EconDbEconomicIndicatorsFetcher(
         if query.use_cache is True:
             cache_dir = f"{helpers.get_user_cache_directory()}/http/econdb_indicators"
             async with helpers.CachedSession(
-                cache=helpers.SQLiteBackend(
+                cache=helpers.get_sqlite_backend(
                     cache_dir, expire_after=3600 * 24, ignored_params=["token"]
                 )
             ) as session:
@@ -89,7 +89,7 @@ class EconDbYieldCurveFetcher(
         if query.use_cache is True:
             cache_dir = f"{helpers.get_user_cache_directory()}/http/econdb_yield_curve"
             async with helpers.CachedSession(
-                cache=helpers.SQLiteBackend(
+                cache=helpers.get_sqlite_backend(
                     cache_dir, expire_after=3600 * 4, ignored_params=["token"]
                 )
             ) as session:
@@ -6,9 +6,9 @@ from importlib.resources import files
 from io import StringIO
 from typing import Dict, List, Optional, Tuple, Union
 
-from aiohttp_client_cache import SQLiteBackend
 from aiohttp_client_cache.session import CachedSession
 from openbb_core.app.utils import get_user_cache_directory
+from openbb_core.provider.utils.cache_db import get_sqlite_backend
 from openbb_core.provider.utils.helpers import amake_request, amake_requests
 from pandas import DataFrame, concat, read_csv
 
@@ -405,7 +405,7 @@ async def create_token(use_cache: bool = True) -> str:
     if use_cache:
         cache_dir = f"{get_user_cache_directory()}/http/econdb_indicators_temp_token"
         async with CachedSession(
-            cache=SQLiteBackend(cache_dir, expire_after=3600 * 12)
+            cache=get_sqlite_backend(cache_dir, expire_after=3600 * 12)
         ) as session:
             try:
                 response = await amake_request(
@@ -430,7 +430,7 @@ async def download_indicators(use_cache: bool = True) -> DataFrame:
     if use_cache is True:
         cache_dir = f"{get_user_cache_directory()}/http/econdb_indicators"
         async with CachedSession(
-            cache=SQLiteBackend(cache_dir, expire_after=3600 * 24 * 7)
+            cache=get_sqlite_backend(cache_dir, expire_after=3600 * 24 * 7)
         ) as session:
             try:
                 response = await amake_request(url, session=session, response_callback=callback)  # type: ignore
@@ -497,7 +497,7 @@ async def get_context(
     if use_cache is True:
         cache_dir = f"{get_user_cache_directory()}/http/econdb_context"
         async with CachedSession(
-            cache=SQLiteBackend(cache_dir, expire_after=3600 * 24)
+            cache=get_sqlite_backend(cache_dir, expire_after=3600 * 24)
         ) as session:
             try:
                 response = await amake_requests(urls, session=session)
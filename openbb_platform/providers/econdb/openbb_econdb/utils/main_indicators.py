@@ -3,10 +3,10 @@
 from datetime import datetime, timedelta
 from typing import Dict, List, Literal, Union
 
-from aiohttp_client_cache import SQLiteBackend
 from aiohttp_client_cache.session import CachedSession
 from numpy import arange
 from openbb_core.app.utils import get_user_cache_directory
+from openbb_core.provider.utils.cache_db import get_sqlite_backend
 from openbb_core.provider.utils.helpers import amake_request
 from openbb_econdb.utils.helpers import COUNTRY_MAP, THREE_LETTER_ISO_MAP
 from pandas import Categorical, DataFrame, Series, concat, to_datetime
@@ -76,7 +76,7 @@ async def fetch_data(url, use_cache: bool = True):
     if use_cache is True:
         cache_dir = f"{get_user_cache_directory()}/http/econdb_main_indicators"
         async with CachedSession(
-            cache=SQLiteBackend(cache_dir, expire_after=3600 * 24)
+            cache=get_sqlite_backend(cache_dir, expire_after=3600 * 24)
         ) as session:
             try:
                 response = await amake_request(url, session=session)
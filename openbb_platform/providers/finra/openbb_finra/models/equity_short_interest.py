@@ -1,6 +1,5 @@
 """FINRA Equity Short Interest Model."""
 
-import sqlite3
 from typing import Any, Dict, List, Optional
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -8,7 +7,7 @@ from openbb_core.provider.standard_models.equity_short_interest import (
     ShortInterestData,
     ShortInterestQueryParams,
 )
-from openbb_finra.utils.data_storage import DB_PATH, prepare_data
+from openbb_finra.utils.data_storage import aprepare_data, get_short_interest
 
 # pylint: disable=unused-argument
 
@@ -45,37 +44,17 @@ class FinraShortInterestFetcher(
         return FinraShortInterestQueryParams(**params)
 
     @staticmethod
-    def extract_data(
+    async def aextract_data(
         query: FinraShortInterestQueryParams,
         credentials: Optional[Dict[str, str]],
         **kwargs: Any,
     ) -> List[Dict]:
         """Extract the data from the Finra endpoint."""
         # Put the data in the cache
-        prepare_data()
+        await aprepare_data()
         # Get the data from the cache
-        cnx = sqlite3.connect(DB_PATH)
-        cursor = cnx.cursor()
-        cursor.execute(
-            "SELECT * FROM short_interest where symbolCode = ?", (query.symbol,)
-        )
         # TODO: Check if we should allow general queries, it's more than 500k rows
-        # cursor.execute("SELECT * FROM short_interest")
-        result = cursor.fetchall()
-
-        titles = [
-            "symbolCode",
-            "issueName",
-            "marketClassCode",
-            "currentShortPositionQuantity",
-            "previousShortPositionQuantity",
-            "averageDailyVolumeQuantity",
-            "daysToCoverQuantity",
-            "changePercent",
-            "changePreviousNumber",
-            "settlementDate",
-        ]
-        return [dict(zip(titles, list(row)[1:])) for row in result]
+        return get_short_interest(query.symbol)
 
     @staticmethod
     def transform_data(
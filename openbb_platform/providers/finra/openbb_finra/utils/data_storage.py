@@ -4,67 +4,206 @@ This was created as a way to handle short interest data from the FINRA.
 The files do not change, so there is no need to download them every time.
 """
 
+import asyncio
 import random
 import sqlite3
 from io import StringIO
 from pathlib import Path
-from typing import List
+from typing import Dict, List
+from warnings import warn
 
+import aiohttp
 import requests
 from openbb_core.app.utils import get_user_cache_directory
+from openbb_core.provider.utils.cache_db import CacheDatabase, get_cache_db
+from openbb_core.provider.utils.helpers import amake_request, run_async
 from openbb_finra.utils.helpers import get_short_interest_dates
 from pandas import read_csv
 
 DB_PATH = Path(get_user_cache_directory()) / "caches/finra_short_volume.db"
-DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+SHORT_INTEREST_URL = "https://cdn.finra.org/equity/otcmarket/biweekly/shrt{date}.csv"
+# Maximum number of files downloaded at the same time by the backfill.
+MAX_CONCURRENT_DOWNLOADS = 8
+# Seconds to wait for a file, they are a few megabytes each.
+DOWNLOAD_TIMEOUT = 30
+# Retries of a failed download, waiting DOWNLOAD_BACKOFF seconds, doubled on each retry.
+DOWNLOAD_RETRIES = 3
+DOWNLOAD_BACKOFF = 1.0
+# Columns of the short interest files kept in the database, in the order of the files.
+COLUMNS = [
+    "symbolCode",
+    "issueName",
+    "marketClassCode",
+    "currentShortPositionQuantity",
+    "previousShortPositionQuantity",
+    "averageDailyVolumeQuantity",
+    "daysToCoverQuantity",
+    "changePercent",
+    "changePreviousNumber",
+    "settlementDate",
+]
+COLUMN_LIST = ", ".join(COLUMNS)
+INSERT_SQL = (
+    f"INSERT OR REPLACE INTO short_interest ({COLUMN_LIST}) "  # noqa: S608
+    f"VALUES ({', '.join('?' * len(COLUMNS))})"
+)
+
+
+def _create_tables(conn: sqlite3.Connection) -> None:
+    """Create the short interest table, keyed by symbol and settlement date."""
+    legacy = [row[1] for row in conn.execute("PRAGMA table_info(short_interest)")]
+    if "index" in legacy:
+        # Tables written by pandas have a row number column and no key.
+        conn.execute("ALTER TABLE short_interest RENAME TO short_interest_legacy")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS short_interest ("
+        + COLUMN_LIST
+        + ", PRIMARY KEY (symbolCode, settlementDate))"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS short_interest_settlement_date "
+        "ON short_interest (settlementDate)"
+    )
+    if "index" in legacy:
+        conn.execute(
+            f"INSERT OR REPLACE INTO short_interest ({COLUMN_LIST}) "  # noqa: S608
+            f"SELECT {COLUMN_LIST} FROM short_interest_legacy"
+        )
+        conn.execute("DROP TABLE short_interest_legacy")
+
+
+def get_db() -> CacheDatabase:
+    """Get the short interest database, creating its tables on first use."""
+    db = get_cache_db(DB_PATH)
+    db.initialize("finra_short_interest", _create_tables)
+    return db
 
 
 def get_cached_dates() -> List:
     """Return the dates that are cached in the DB file."""
-    cnx = sqlite3.connect(DB_PATH)
-    cursor = cnx.cursor()
+    # The settlement date index has the distinct dates, without reading the table.
+    rows = get_db().execute("SELECT DISTINCT settlementDate FROM short_interest")
+    return [row[0] for row in rows]
 
-    # Check if the table exists
-    cursor.execute(
-        "SELECT * FROM sqlite_master WHERE type='table' AND name='short_interest'"
-    )
-    if cursor.fetchone() is None:
-        # The table does not exist
-        return []
 
-    # If the table exists, fetch the data
-    cursor.execute("SELECT distinct settlementDate FROM short_interest")
-    result = cursor.fetchall()
-    return [row[0] for row in result]
+def _store_short_interest(text: str) -> None:
+    """Store a short interest file, in a single transaction."""
+    data = read_csv(StringIO(text), delimiter="|")[COLUMNS]
+    rows = data.astype(object).where(data.notna(), None).values.tolist()
+    get_db().executemany(INSERT_SQL, rows)
 
 
-def get_data_from_date_and_store(date):
-    """Get data from a specific date and place it in the cache."""
-    url = f"https://cdn.finra.org/equity/otcmarket/biweekly/shrt{date}.csv"
+def _get_headers() -> Dict:
+    """Get the request headers."""
     # add a random string to user agent to avoid getting blocked
-    headers = {
+    return {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         + str(random.randint(0, 9))  # noqa: S311
     }
-    req = requests.get(url, headers=headers, timeout=1)
+
+
+def get_data_from_date_and_store(date):
+    """Get data from a specific date and place it in the cache."""
+    req = requests.get(
+        SHORT_INTEREST_URL.format(date=date),
+        headers=_get_headers(),
+        timeout=DOWNLOAD_TIMEOUT,
+    )
     if req.status_code != 200:
         return
-    data = read_csv(StringIO(req.text), delimiter="|")
-    data = data.drop(
-        columns=[
-            "accountingYearMonthNumber",
-            "issuerServicesGroupExchangeCode",
-            "stockSplitFlag",
-            "revisionFlag",
-        ]
+    _store_short_interest(req.text)
+
+
+async def aget_data_from_date_and_store(date: str) -> bool:
+    """Get data from a specific date and place it in the cache, retrying failed downloads.
+
+    Returns
+    -------
+    bool
+        Whether the file was stored, False if it is not published.
+    """
+
+    async def callback(response, _):
+        """Return the file, None if it is not published."""
+        if response.status in (403, 404):
+            return None
+        response.raise_for_status()
+        return await response.text()
+
+    text = None
+    for attempt in range(DOWNLOAD_RETRIES + 1):
+        try:
+            text = await amake_request(
+                SHORT_INTEREST_URL.format(date=date),
+                headers=_get_headers(),
+                timeout=DOWNLOAD_TIMEOUT,
+                response_callback=callback,
+            )
+            break
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == DOWNLOAD_RETRIES:
+                raise
+            await asyncio.sleep(DOWNLOAD_BACKOFF * 2**attempt)
+    if text is None:
+        return False
+    # Parsing and writing a file takes a moment, it is done out of the event loop.
+    await asyncio.get_running_loop().run_in_executor(None, _store_short_interest, text)
+    return True
+
+
+def get_short_interest(symbol: str) -> List[Dict]:
+    """Get the cached short interest of a symbol, by settlement date."""
+    rows = get_db().execute(
+        f"SELECT {COLUMN_LIST} FROM short_interest "  # noqa: S608
+        "WHERE symbolCode = ? ORDER BY settlementDate",
+        (symbol,),
+    )
+    return [dict(zip(COLUMNS, row)) for row in rows]
+
+
+def get_missing_dates() -> List[str]:
+    """Get the settlement dates, as YYYYMMDD, of the files not in the cache."""
+    cached = set(get_cached_dates())
+    return [
+        date
+        for date in get_short_interest_dates()
+        if f"{date[:4]}-{date[4:6]}-{date[6:]}" not in cached
+    ]
+
+
+async def aprepare_data(max_concurrent: int = MAX_CONCURRENT_DOWNLOADS) -> None:
+    """Download the short interest files missing from the cache, concurrently.
+
+    Each file is stored in its own transaction as soon as it is downloaded,
+    so an interrupted backfill resumes from the files already stored.
+
+    Parameters
+    ----------
+    max_concurrent : int
+        Maximum number of files downloaded at the same time.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def download(date: str) -> bool:
+        async with semaphore:
+            return await aget_data_from_date_and_store(date)
+
+    dates = get_missing_dates()
+    outcomes = await asyncio.gather(
+        *[download(date) for date in dates], return_exceptions=True
     )
-    data.to_sql("short_interest", sqlite3.connect(DB_PATH), if_exists="append")
+    failed = [
+        date
+        for date, outcome in zip(dates, outcomes)
+        if isinstance(outcome, BaseException)
+    ]
+    if failed:
+        warn(
+            "The FINRA short interest files of these settlement dates could not be"
+            f" downloaded and will be retried on the next request: {', '.join(failed)}"
+        )
 
 
 def prepare_data():
     """Prepare the data."""
-    date_list = get_short_interest_dates()
-    cached_urls = get_cached_dates()
-    for date in date_list:
-        if f"{date[:4]}-{date[4:6]}-{date[6:]}" not in cached_urls:
-            get_data_from_date_and_store(date)
+    run_async(aprepare_data)
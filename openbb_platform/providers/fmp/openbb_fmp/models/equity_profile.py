@@ -115,6 +115,10 @@ class FMPEquityProfileFetcher(
 ):
     """FMP Equity Profile Fetcher."""
 
+    # Company profiles change rarely.
+    cache_ttl = 3600 * 24
+    result_ttl = 3600
+
     @staticmethod
     def transform_query(params: Dict[str, Any]) -> FMPEquityProfileQueryParams:
         """Transform the query params."""
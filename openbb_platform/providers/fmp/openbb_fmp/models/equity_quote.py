@@ -102,6 +102,10 @@ class FMPEquityQuoteFetcher(
 ):
     """Transform the query, extract and transform the data from the FMP endpoints."""
 
+    # Quotes are memoized briefly, so dashboards polling the same symbols share them.
+    result_ttl = 5
+    result_stale_ttl = 10
+
     @staticmethod
     def transform_query(params: Dict[str, Any]) -> FMPEquityQuoteQueryParams:
         """Transform the query params."""
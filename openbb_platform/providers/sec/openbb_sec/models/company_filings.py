@@ -8,7 +8,6 @@ from datetime import (
 )
 from typing import Any, Dict, List, Optional, Union
 
-from aiohttp_client_cache import SQLiteBackend
 from aiohttp_client_cache.session import CachedSession
 from openbb_core.app.utils import get_user_cache_directory
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -16,6 +15,7 @@ from openbb_core.provider.standard_models.company_filings import (
     CompanyFilingsData,
     CompanyFilingsQueryParams,
 )
+from openbb_core.provider.utils.cache_db import get_sqlite_backend
 from openbb_core.provider.utils.descriptions import QUERY_DESCRIPTIONS
 from openbb_core.provider.utils.errors import EmptyDataError
 from openbb_core.provider.utils.helpers import amake_request, amake_requests
@@ -175,7 +175,7 @@ class SecCompanyFilingsFetcher(
         if query.use_cache is True:
             cache_dir = f"{get_user_cache_directory()}/http/sec_company_filings"
             async with CachedSession(
-                cache=SQLiteBackend(cache_dir, expire_after=3600 * 24)
+                cache=get_sqlite_backend(cache_dir, expire_after=3600 * 24)
             ) as session:
                 try:
                     data = await amake_request(url, headers=HEADERS, session=session)  # type: ignore
@@ -219,7 +219,7 @@ class SecCompanyFilingsFetcher(
             if query.use_cache is True:
                 cache_dir = f"{get_user_cache_directory()}/http/sec_company_filings"
                 async with CachedSession(
-                    cache=SQLiteBackend(cache_dir, expire_after=3600 * 24)
+                    cache=get_sqlite_backend(cache_dir, expire_after=3600 * 24)
                 ) as session:
                     try:
                         await amake_requests(urls, headers=HEADERS, session=session, response_callback=callback)  # type: ignore
@@ -9,7 +9,6 @@ from warnings import warn
 
 import pandas as pd
 import xmltodict
-from aiohttp_client_cache import SQLiteBackend
 from aiohttp_client_cache.session import CachedSession
 from openbb_core.app.utils import get_user_cache_directory
 from openbb_core.provider.abstract.annotated_result import AnnotatedResult
@@ -18,10 +17,12 @@ from openbb_core.provider.standard_models.etf_holdings import (
     EtfHoldingsData,
     EtfHoldingsQueryParams,
 )
+from openbb_core.provider.utils.cache_db import get_sqlite_backend
 from openbb_core.provider.utils.descriptions import QUERY_DESCRIPTIONS
 from openbb_core.provider.utils.errors import EmptyDataError
 from openbb_core.provider.utils.helpers import amake_request
 from openbb_sec.utils.helpers import HEADERS, get_nport_candidates
+from openbb_sec.utils.parse_nport import parse_nport_holdings
 from pandas.tseries.offsets import MonthEnd
 from pydantic import Field, field_validator, model_validator
 
@@ -374,7 +375,7 @@ class SecEtfHoldingsFetcher(
         response: Union[dict, List[dict]] = []
         if query.use_cache is True:
             cache_dir = f"{get_user_cache_directory()}/http/sec_etf"
-            async with CachedSession(cache=SQLiteBackend(cache_dir)) as session:
+            async with CachedSession(cache=get_sqlite_backend(cache_dir)) as session:
                 try:
                     response = await amake_request(
                         filing_url, headers=HEADERS, session=session, response_callback=callback  # type: ignore
@@ -391,7 +392,7 @@ class SecEtfHoldingsFetcher(
 
     # pylint: disable=too-many-statements
     @staticmethod
-    def transform_data(  # noqa: PLR0912
+    def transform_data(
         query: SecEtfHoldingsQueryParams,
         data: Dict,
         **kwargs: Any,
@@ -412,340 +413,9 @@ class SecEtfHoldingsFetcher(
             and "invstOrSecs" in response["edgarSubmission"]["formData"]
             and "invstOrSec" in response["edgarSubmission"]["formData"]["invstOrSecs"]
         ):
-            df = pd.DataFrame.from_records(
+            results = parse_nport_holdings(
                 response["edgarSubmission"]["formData"]["invstOrSecs"]["invstOrSec"]
             )
-            # Conditionally flatten deeply nested values.
-            for i in df.index:
-                if "isin" in df.iloc[i]["identifiers"]:
-                    df.loc[i, "isin"] = df.iloc[i]["identifiers"]["isin"].get("@value")
-
-                if (
-                    "other" in df.iloc[i]["identifiers"]
-                    and "@value" in df.iloc[i]["identifiers"]["other"]
-                ):
-                    df.loc[i, "other_id"] = df.iloc[i]["identifiers"]["other"].get(
-                        "@value"
-                    )
-
-                if "securityLending" in df.iloc[i]:
-                    security_lending = df.iloc[i]["securityLending"]
-                    if "loanByFundCondition" in security_lending:
-                        loan_by_fund_condition = security_lending["loanByFundCondition"]
-                        df.loc[i, "isLoanByFund"] = loan_by_fund_condition.get(
-                            "@isLoanByFund"
-                        )
-                        df.loc[i, "loanVal"] = loan_by_fund_condition.get("@loanVal")
-                    if "isCashCollateral" in security_lending:
-                        df.loc[i, "isCashCollateral"] = security_lending.get(
-                            "isCashCollateral"
-                        )
-                    if "isNonCashCollateral" in security_lending:
-                        df.loc[i, "isNonCashCollateral"] = security_lending.get(
-                            "isNonCashCollateral"
-                        )
-
-                if "debtSec" in df.iloc[i] and isinstance(df.loc[i]["debtSec"], dict):
-                    debt_sec = df.iloc[i]["debtSec"]
-                    df.loc[i, "maturity_date"] = debt_sec.get("maturityDt")
-                    df.loc[i, "coupon_kind"] = debt_sec.get("couponKind")
-                    df.loc[i, "annualized_return"] = debt_sec.get("annualizedRt")
-                    df.loc[i, "is_default"] = debt_sec.get("isDefault")
-                    df.loc[i, "in_arrears"] = debt_sec.get("areIntrstPmntsInArrs")
-                    df.loc[i, "is_paid_kind"] = debt_sec.get("isPaidKind")
-
-                if "issuerConditional" in df.iloc[i] and isinstance(
-                    df.iloc[i]["issuerConditional"], dict
-                ):
-                    df.loc[i, "issuer_conditional"] = df.iloc[i][
-                        "issuerConditional"
-                    ].get("@desc")
-
-                if "assetConditional" in df.iloc[i] and isinstance(
-                    df.iloc[i]["assetConditional"], dict
-                ):
-                    df.loc[i, "asset_conditional"] = df.iloc[i]["assetConditional"].get(
-                        "@desc"
-                    )
-
-                if "derivativeInfo" in df.iloc[i] and isinstance(
-                    df.iloc[i]["derivativeInfo"], dict
-                ):
-                    derivative_info = df.iloc[i]["derivativeInfo"]
-
-                    if "optionSwaptionWarrantDeriv" in derivative_info:
-                        option_swaption_warrant_deriv = derivative_info[
-                            "optionSwaptionWarrantDeriv"
-                        ]
-                        df.loc[i, "derivative_category"] = (
-                            option_swaption_warrant_deriv.get("@derivCat")
-                        )
-                        df.loc[i, "counterparty"] = option_swaption_warrant_deriv[
-                            "counterparties"
-                        ].get("counterpartyName")
-                        df.loc[i, "lei"] = option_swaption_warrant_deriv[
-                            "counterparties"
-                        ].get("counterpartyLei")
-                        df.loc[i, "underlying_name"] = (
-                            option_swaption_warrant_deriv["descRefInstrmnt"]
-                            .get("otherRefInst", {})
-                            .get("issueTitle")
-                        )
-                        df.loc[i, "underlying_name"] = option_swaption_warrant_deriv[
-                            "descRefInstrmnt"
-                        ].get("nestedDerivInfo", {}).get("fwdDeriv", {}).get(
-                            "derivAddlInfo", {}
-                        ).get(
-                            "title"
-                        ) or option_swaption_warrant_deriv[
-                            "descRefInstrmnt"
-                        ].get(
-                            "otherRefInst", {}
-                        ).get(
-                            "issueTitle"
-                        )
-                        df.loc[i, "option_type"] = option_swaption_warrant_deriv.get(
-                            "putOrCall"
-                        )
-                        df.loc[i, "derivative_payoff"] = (
-                            option_swaption_warrant_deriv.get("writtenOrPur")
-                        )
-                        df.loc[i, "expiry_date"] = option_swaption_warrant_deriv.get(
-                            "expDt"
-                        )
-                        df.loc[i, "exercise_price"] = option_swaption_warrant_deriv.get(
-                            "exercisePrice"
-                        )
-                        df.loc[i, "exercise_currency"] = (
-                            option_swaption_warrant_deriv.get("exercisePriceCurCd")
-                        )
-                        df.loc[i, "shares_per_contract"] = (
-                            option_swaption_warrant_deriv.get("shareNo")
-                        )
-                        if option_swaption_warrant_deriv.get("delta") != "XXXX":
-                            df.loc[i, "delta"] = option_swaption_warrant_deriv.get(
-                                "delta"
-                            )
-                        df.loc[i, "unrealized_gain"] = float(
-                            option_swaption_warrant_deriv.get("unrealizedAppr")
-                        )
-
-                    if "futrDeriv" in derivative_info:
-                        futr_deriv = derivative_info["futrDeriv"]
-                        df.loc[i, "derivative_category"] = futr_deriv.get("@derivCat")
-                        if isinstance(futr_deriv.get("counterparties"), dict):
-                            df.loc[i, "counterparty"] = futr_deriv[
-                                "counterparties"
-                            ].get("counterpartyName")
-                            df.loc[i, "lei"] = futr_deriv["counterparties"].get(
-                                "counterpartyLei"
-                            )
-                        df.loc[i, "underlying_name"] = (
-                            futr_deriv["descRefInstrmnt"]
-                            .get("indexBasketInfo", {})
-                            .get("indexName")
-                        )
-                        df.loc[i, "other_id"] = (
-                            futr_deriv["descRefInstrmnt"]
-                            .get("indexBasketInfo", {})
-                            .get("indexIdentifier")
-                        )
-                        df.loc[i, "derivative_payoff"] = futr_deriv.get("payOffProf")
-                        df.loc[i, "expiry_date"] = futr_deriv.get(
-                            "expDt"
-                        ) or futr_deriv.get("expDate")
-                        df.loc[i, "notional_amount"] = float(
-                            futr_deriv.get("notionalAmt")
-                        )
-                        df.loc[i, "notional_currency"] = futr_deriv.get("curCd")
-                        df.loc[i, "unrealized_gain"] = float(
-                            futr_deriv.get("unrealizedAppr")
-                        )
-
-                    if "fwdDeriv" in derivative_info:
-                        fwd_deriv = derivative_info["fwdDeriv"]
-                        df.loc[i, "derivative_category"] = fwd_deriv.get("@derivCat")
-                        df.loc[i, "counterparty"] = fwd_deriv["counterparties"].get(
-                            "counterpartyName"
-                        )
-                        df.loc[i, "currency_sold"] = fwd_deriv.get("curSold")
-                        df.loc[i, "currency_amount_sold"] = float(
-                            fwd_deriv.get("amtCurSold")
-                        )
-                        df.loc[i, "currency_bought"] = fwd_deriv.get("curPur")
-                        df.loc[i, "currency_amount_bought"] = float(
-                            fwd_deriv.get("amtCurPur")
-                        )
-                        df.loc[i, "expiry_date"] = fwd_deriv.get("settlementDt")
-                        df.loc[i, "unrealized_gain"] = float(
-                            fwd_deriv.get("unrealizedAppr")
-                        )
-
-                    if "swapDeriv" in df.iloc[i]["derivativeInfo"]:
-                        swap_deriv = df.iloc[i]["derivativeInfo"]["swapDeriv"]
-                        df.loc[i, "derivative_category"] = swap_deriv.get("@derivCat")
-                        df.loc[i, "counterparty"] = swap_deriv["counterparties"].get(
-                            "counterpartyName"
-                        )
-                        df.loc[i, "lei"] = swap_deriv["counterparties"].get(
-                            "counterpartyLei"
-                        )
-                        if "otherRefInst" in swap_deriv["descRefInstrmnt"]:
-                            df.loc[i, "underlying_name"] = swap_deriv[
-                                "descRefInstrmnt"
-                            ]["otherRefInst"].get("issueTitle")
-                        if "indexBasketInfo" in swap_deriv["descRefInstrmnt"]:
-                            df.loc[i, "underlying_name"] = swap_deriv[
-                                "descRefInstrmnt"
-                            ]["indexBasketInfo"].get("indexName")
-                            df.loc[i, "other_id"] = swap_deriv["descRefInstrmnt"][
-                                "indexBasketInfo"
-                            ].get("indexIdentifier")
-                        df.loc[i, "swap_description"] = (
-                            swap_deriv["otherRecDesc"].get("#text")
-                            if "otherRecDesc" in swap_deriv["descRefInstrmnt"]
-                            else None
-                        )
-                        if "floatingRecDesc" in swap_deriv:
-                            df.loc[i, "rate_type_rec"] = swap_deriv[
-                                "floatingRecDesc"
-                            ].get("@fixedOrFloating")
-                            df.loc[i, "floating_rate_index_rec"] = swap_deriv[
-                                "floatingRecDesc"
-                            ].get("@floatingRtIndex")
-                            df.loc[i, "floating_rate_spread_rec"] = float(
-                                swap_deriv["floatingRecDesc"].get("@floatingRtSpread")
-                            )
-                            df.loc[i, "payment_amount_rec"] = float(
-                                swap_deriv["floatingRecDesc"].get("@pmntAmt")
-                            )
-                            df.loc[i, "rate_tenor_rec"] = swap_deriv["floatingRecDesc"][
-                                "rtResetTenors"
-                            ]["rtResetTenor"].get("@rateTenor")
-                            df.loc[i, "rate_tenor_unit_rec"] = swap_deriv[
-                                "floatingRecDesc"
-                            ]["rtResetTenors"]["rtResetTenor"].get("@rateTenorUnit")
-                            df.loc[i, "reset_date_rec"] = swap_deriv["floatingRecDesc"][
-                                "rtResetTenors"
-                            ]["rtResetTenor"].get("@resetDt")
-                            df.loc[i, "reset_date_unit_rec"] = swap_deriv[
-                                "floatingRecDesc"
-                            ]["rtResetTenors"]["rtResetTenor"].get("@resetDtUnit")
-                        if "floatingPmntDesc" in swap_deriv:
-                            df.loc[i, "rate_type_pmnt"] = swap_deriv[
-                                "floatingPmntDesc"
-                            ].get("@fixedOrFloating")
-                            df.loc[i, "floating_rate_index_pmnt"] = swap_deriv[
-                                "floatingPmntDesc"
-                            ].get("@floatingRtIndex")
-                            df.loc[i, "floating_rate_spread_pmnt"] = float(
-                                swap_deriv["floatingPmntDesc"].get("@floatingRtSpread")
-                            )
-                            df.loc[i, "payment_amount_pmnt"] = float(
-                                swap_deriv["floatingPmntDesc"].get("@pmntAmt")
-                            )
-                            df.loc[i, "rate_tenor_pmnt"] = swap_deriv[
-                                "floatingPmntDesc"
-                            ]["rtResetTenors"]["rtResetTenor"].get("@rateTenor")
-                            df.loc[i, "rate_tenor_unit_pmnt"] = swap_deriv[
-                                "floatingPmntDesc"
-                            ]["rtResetTenors"]["rtResetTenor"].get("@rateTenorUnit")
-                            df.loc[i, "reset_date_pmnt"] = swap_deriv[
-                                "floatingPmntDesc"
-                            ]["rtResetTenors"]["rtResetTenor"].get("@resetDt")
-                            df.loc[i, "reset_date_unit_rec"] = swap_deriv[
-                                "floatingPmntDesc"
-                            ]["rtResetTenors"]["rtResetTenor"].get("@resetDtUnit")
-                        df.loc[i, "expiry_date"] = swap_deriv.get("terminationDt")
-                        df.loc[i, "upfront_payment"] = float(
-                            swap_deriv.get("upfrontPmnt")
-                        )
-                        df.loc[i, "payment_currency"] = swap_deriv.get("pmntCurCd")
-                        df.loc[i, "upfront_receive"] = float(
-                            swap_deriv.get("upfrontRcpt")
-                        )
-                        df.loc[i, "receive_currency"] = swap_deriv.get("rcptCurCd")
-                        df.loc[i, "notional_amount"] = float(
-                            swap_deriv.get("notionalAmt")
-                        )
-                        df.loc[i, "notional_currency"] = swap_deriv.get("curCd")
-                        df.loc[i, "unrealized_gain"] = float(
-                            swap_deriv.get("unrealizedAppr")
-                        )
-
-                if "repurchaseAgrmt" in df.iloc[i] and isinstance(
-                    df.iloc[i]["repurchaseAgrmt"], dict
-                ):
-                    repurchase_agrmt = df.iloc[i]["repurchaseAgrmt"]
-                    df.loc[i, "repo_type"] = repurchase_agrmt.get("transCat")
-
-                    if "clearedCentCparty" in repurchase_agrmt and isinstance(
-                        repurchase_agrmt["clearedCentCparty"], dict
-                    ):
-                        cleared_cent_cparty = repurchase_agrmt["clearedCentCparty"]
-                        df.loc[i, "is_cleared"] = cleared_cent_cparty.get("@isCleared")
-                        df.loc[i, "counterparty"] = cleared_cent_cparty.get(
-                            "@centralCounterparty"
-                        )
-                    df.loc[i, "is_tri_party"] = repurchase_agrmt.get("isTriParty")
-                    df.loc[i, "annualized_return"] = repurchase_agrmt.get(
-                        "repurchaseRt"
-                    )
-                    df.loc[i, "maturity_date"] = repurchase_agrmt.get("maturityDt")
-
-                    if (
-                        "repurchaseCollaterals" in repurchase_agrmt
-                        and "repurchaseCollateral"
-                        in repurchase_agrmt["repurchaseCollaterals"]
-                    ):
-                        repurchase_collateral = repurchase_agrmt[
-                            "repurchaseCollaterals"
-                        ]["repurchaseCollateral"]
-                        df.loc[i, "principal_amount"] = float(
-                            repurchase_collateral.get("principalAmt")
-                        )
-                        df.loc[i, "principal_currency"] = repurchase_collateral.get(
-                            "@principalCd"
-                        )
-                        df.loc[i, "collateral_amount"] = float(
-                            repurchase_collateral.get("collateralVal")
-                        )
-                        df.loc[i, "collateral_currency"] = repurchase_collateral.get(
-                            "@collateralCd"
-                        )
-                        df.loc[i, "collateral_type"] = repurchase_collateral.get(
-                            "@invstCat"
-                        )
-
-                if "currencyConditional" in df.iloc[i] and isinstance(
-                    df.iloc[i]["currencyConditional"], dict
-                ):
-                    currency_conditional = df.iloc[i]["currencyConditional"]
-                    df.loc[i, "exchange_currency"] = currency_conditional.get("@curCd")
-                    df.loc[i, "exchange_rate"] = currency_conditional.get("@exchangeRt")
-
-            # Drop the flattened columns
-            to_drop = [
-                "identifiers",
-                "securityLending",
-                "issuerConditional",
-                "assetConditional",
-                "debtSec",
-                "currencyConditional",
-                "derivativeInfo",
-                "repurchaseAgrmt",
-            ]
-            for col in to_drop:
-                if col in df.columns:
-                    df = df.drop(col, axis=1)
-
-            df["pctVal"] = df["pctVal"].astype(float)
-            results = (
-                df.fillna("N/A")
-                .replace("N/A", None)
-                .sort_values(by="pctVal", ascending=False)
-                .to_dict(orient="records")
-            )
         # Extract additional information from the form that doesn't belong in the holdings table.
         metadata = {}
         month_1: str = ""
@@ -5,12 +5,12 @@
 from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
-from aiohttp_client_cache import SQLiteBackend
 from aiohttp_client_cache.session import CachedSession
 from openbb_core.app.utils import get_user_cache_directory
 from openbb_core.provider.abstract.data import Data
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.standard_models.cot_search import CotSearchQueryParams
+from openbb_core.provider.utils.cache_db import get_sqlite_backend
 from openbb_core.provider.utils.helpers import amake_request
 from openbb_sec.utils.helpers import SEC_HEADERS, sec_callback
 from pydantic import Field
@@ -66,7 +66,7 @@ class SecSicSearchFetcher(
         if query.use_cache is True:
             cache_dir = f"{get_user_cache_directory()}/http/sec_sic"
             async with CachedSession(
-                cache=SQLiteBackend(cache_dir, expire_after=3600 * 24 * 30)
+                cache=get_sqlite_backend(cache_dir, expire_after=3600 * 24 * 30)
             ) as session:
                 try:
                     response = await amake_request(
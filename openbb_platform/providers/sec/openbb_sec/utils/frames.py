@@ -4,16 +4,17 @@
 
 import asyncio
 from datetime import datetime
-from typing import Dict, List, Literal, Optional, Union
+from typing import Dict, List, Literal, Optional, Tuple, Union
 from warnings import warn
 
-from aiohttp_client_cache import SQLiteBackend
 from aiohttp_client_cache.session import CachedSession
 from openbb_core.app.utils import get_user_cache_directory
+from openbb_core.provider.utils.cache_db import get_sqlite_backend
 from openbb_core.provider.utils.errors import EmptyDataError
 from openbb_core.provider.utils.helpers import amake_request
 from openbb_sec.utils.definitions import HEADERS, TAXONOMIES
-from openbb_sec.utils.helpers import get_all_companies, symbol_map
+from openbb_sec.utils.helpers import SymbolResolver, get_symbol_resolver
+from openbb_sec.utils.xbrl_store import XbrlStore, get_xbrl_store
 from pandas import DataFrame
 
 FACTS = [
@@ -621,9 +622,9 @@ async def fetch_data(url, use_cache, persist) -> Union[Dict, List[Dict]]:
         cache_dir = f"{get_user_cache_directory()}/http/sec_frames"
         async with CachedSession(
             cache=(
-                SQLiteBackend(cache_dir, expire_after=3600 * 24)
+                get_sqlite_backend(cache_dir, expire_after=3600 * 24)
                 if persist is False
-                else SQLiteBackend(cache_dir)
+                else get_sqlite_backend(cache_dir)
             )
         ) as session:
             try:
@@ -720,36 +721,52 @@ async def get_frame(  # pylint: disable =too-many-arguments,too-many-locals, too
     if instantaneous:
         url = url + "I"
 
+    period = url.rsplit("/", 1)[-1]
     url = url + ".json"
     response: Union[Dict, List[Dict]] = {}
-    try:
-        response = await fetch_data(url, use_cache, persist)
-    except Exception as e:  # pylint: disable=W0718
-        message = (
-            "No frame was found with the combination of parameters supplied."
-            + " Try adjusting the period."
-            + " Not all GAAP measures have frames available."
+    store = get_xbrl_store()
+    if store is not None and use_cache is True:
+        # Late and amended filings still change the frames of the previous year.
+        response = (
+            store.get_frame(
+                taxonomy, fact, units, period, permanent=year < current_date.year - 1  # type: ignore
+            )
+            or {}
         )
-        if url.endswith("I.json"):
-            warn("No instantaneous frame was found, trying calendar period data.")
-            url = url.replace("I.json", ".json")
-            try:
-                response = await fetch_data(url, use_cache, persist)
-            except Exception:
-                raise ValueError(message) from e
-        elif "Q" in url and not url.endswith("I.json"):
-            warn(
-                "No frame was found for the requested quarter, trying instantaneous data."
+    if not response:
+        try:
+            response = await fetch_data(url, use_cache, persist)
+        except Exception as e:  # pylint: disable=W0718
+            message = (
+                "No frame was found with the combination of parameters supplied."
+                + " Try adjusting the period."
+                + " Not all GAAP measures have frames available."
             )
-            url = url.replace(".json", "I.json")
-            try:
-                response = await fetch_data(url, use_cache, persist)
-            except Exception:
+            if url.endswith("I.json"):
+                warn("No instantaneous frame was found, trying calendar period data.")
+                url = url.replace("I.json", ".json")
+                try:
+                    response = await fetch_data(url, use_cache, persist)
+                except Exception:
+                    raise ValueError(message) from e
+            elif "Q" in url and not url.endswith("I.json"):
+                warn(
+                    "No frame was found for the requested quarter, trying instantaneous data."
+                )
+                url = url.replace(".json", "I.json")
+                try:
+                    response = await fetch_data(url, use_cache, persist)
+                except Exception:
+                    raise ValueError(message) from e
+            else:
                 raise ValueError(message) from e
-        else:
-            raise ValueError(message) from e
 
-    data = sorted(response.get("data", {}), key=lambda x: x["val"], reverse=True)  # type: ignore
+        if store is not None and response:
+            # Store the frame under the period fetched, which differs after a fallback.
+            period = url.rsplit("/", 1)[-1].replace(".json", "")
+            store.put_frame(taxonomy, fact, units, period, response)  # type: ignore
+
+    data = response.get("data", [])  # type: ignore
     metadata = {
         "frame": response.get("ccp", ""),  # type: ignore
         "tag": response.get("tag", ""),  # type: ignore
@@ -759,10 +776,11 @@ async def get_frame(  # pylint: disable =too-many-arguments,too-many-locals, too
         "unit": response.get("uom", ""),  # type: ignore
         "count": response.get("pts", ""),  # type: ignore
     }
-    df = DataFrame(data)
-    companies = await get_all_companies(use_cache=use_cache)
-    cik_to_symbol = companies.set_index("cik")["symbol"].to_dict()
-    df["symbol"] = df["cik"].astype(str).map(cik_to_symbol)
+    # Frames read from the XBRL store are Arrow tables.
+    df = DataFrame(data) if isinstance(data, list) else data.to_pandas()
+    df = df.sort_values(by="val", ascending=False, kind="stable")
+    resolver = await get_symbol_resolver(use_cache=use_cache)
+    df["symbol"] = df["cik"].map(resolver.symbol)
     df["unit"] = metadata.get("unit")
     df["fact"] = metadata.get("label")
     df["frame"] = metadata.get("frame")
@@ -810,24 +828,33 @@ async def get_concept(
     results: List[Dict] = []
     messages: List = []
     metadata: Dict = {}
+    store = get_xbrl_store()
+    resolver = await get_symbol_resolver(use_cache=use_cache)
+    if any(resolver.cik(ticker) is None for ticker in symbols):
+        await resolver.load(companies=False, funds=True, use_cache=use_cache)
 
     async def get_one(ticker):
         """Get data for one symbol."""
         ticker = ticker.upper()
         message = f"Symbol Error: No data was found for, {ticker} and {fact}"
-        cik = await symbol_map(ticker)
-        if cik == "":
+        cik = resolver.cik(ticker)
+        if cik is None:
             message = f"Symbol Error: No CIK was found for, {ticker}"
             warn(message)
             messages.append(message)
         else:
             url = f"https://data.sec.gov/api/xbrl/companyconcept/CIK{cik}/{taxonomy}/{fact}.json"
             response: Union[Dict, List[Dict]] = {}
-            try:
-                response = await fetch_data(url, use_cache, False)
-            except Exception as _:  # pylint: disable=W0718
-                warn(message)
-                messages.append(message)
+            if store is not None and use_cache is True:
+                response = store.get_concept(taxonomy, fact, cik) or {}  # type: ignore
+            if not response:
+                try:
+                    response = await fetch_data(url, use_cache, False)
+                except Exception as _:  # pylint: disable=W0718
+                    warn(message)
+                    messages.append(message)
+                if store is not None and response:
+                    store.put_concept(taxonomy, fact, cik, response)  # type: ignore
             if response:
                 units = response.get("units", {})  # type: ignore
                 metadata[ticker] = {
@@ -871,3 +898,128 @@ async def get_concept(
         "metadata": metadata,
         "data": sorted(results, key=lambda x: (x["filed"], x["end"]), reverse=True),
     }
+
+
+async def _store_ciks(
+    symbols: Optional[List[str]], use_cache: bool
+) -> Tuple[Optional[List[int]], SymbolResolver]:
+    """Get the XBRL store filters of the CIKs of the symbols, and the resolver."""
+    resolver = await get_symbol_resolver(use_cache=use_cache)
+    if not symbols:
+        return None, resolver
+    if any(resolver.cik(symbol) is None for symbol in symbols):
+        await resolver.load(companies=False, funds=True, use_cache=use_cache)
+    ciks = [resolver.cik(symbol) for symbol in symbols]
+    return [int(cik) for cik in ciks if cik is not None], resolver
+
+
+def _require_store() -> XbrlStore:
+    """Get the XBRL store, or raise if pyarrow is not installed."""
+    store = get_xbrl_store()
+    if store is None:
+        raise ImportError("Querying the SEC XBRL store requires pyarrow.")
+    return store
+
+
+async def query_frames(
+    facts: Optional[List[str]] = None,
+    periods: Optional[List[str]] = None,
+    symbols: Optional[List[str]] = None,
+    taxonomy: Optional[TAXONOMIES] = None,
+    units: Optional[List[str]] = None,
+    use_cache: bool = True,
+) -> DataFrame:
+    """Query the frames stored by `get_frame`, across facts and periods.
+
+    Only the stored files of the matching taxonomy, facts, units and periods
+    are read, so screens over many frames run off the local disk.
+    Frames are stored when first requested with `get_frame`.
+
+    Parameters
+    ----------
+    facts : Optional[List[str]]
+        The facts to read, all by default.
+    periods : Optional[List[str]]
+        The periods to read, e.g. CY2023, CY2023Q1 or CY2023Q1I, all by default.
+    symbols : Optional[List[str]]
+        The ticker symbols of the companies to read, all by default.
+    taxonomy : Optional[Literal["us-gaap", "dei", "ifrs-full", "srt"]]
+        The taxonomy to read, all by default.
+    units : Optional[List[str]]
+        The units to read, all by default.
+    use_cache: bool
+        Whether to use cache for the ticker symbols. Defaults to True.
+
+    Returns
+    -------
+    DataFrame
+        The matching rows, with their taxonomy, fact, unit, period and symbol.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    """
+    store = _require_store()
+    ciks, resolver = await _store_ciks(symbols, use_cache)
+    df = store.query_frames(
+        taxonomy=[taxonomy] if taxonomy else None,
+        fact=facts,
+        unit=units,
+        period=periods,
+        cik=ciks,
+    ).to_pandas()
+    df["symbol"] = df["cik"].map(resolver.symbol)
+    return df
+
+
+async def query_concepts(
+    facts: Optional[List[str]] = None,
+    symbols: Optional[List[str]] = None,
+    fiscal_years: Optional[List[int]] = None,
+    fiscal_periods: Optional[List[str]] = None,
+    taxonomy: Optional[TAXONOMIES] = None,
+    use_cache: bool = True,
+) -> DataFrame:
+    """Query the company concepts stored by `get_concept`, across companies and facts.
+
+    Only the stored files of the matching taxonomy, facts and companies are read,
+    and their row groups outside the fiscal years and periods are skipped.
+    Company concepts are stored when first requested with `get_concept`.
+
+    Parameters
+    ----------
+    facts : Optional[List[str]]
+        The facts to read, all by default.
+    symbols : Optional[List[str]]
+        The ticker symbols of the companies to read, all by default.
+    fiscal_years : Optional[List[int]]
+        The fiscal years to read, all by default.
+    fiscal_periods : Optional[List[str]]
+        The fiscal periods to read, as reported, e.g. FY or Q1, all by default.
+    taxonomy : Optional[Literal["us-gaap", "dei", "ifrs-full", "srt"]]
+        The taxonomy to read, all by default.
+    use_cache: bool
+        Whether to use cache for the ticker symbols. Defaults to True.
+
+    Returns
+    -------
+    DataFrame
+        The matching rows, with their taxonomy, fact, CIK and symbol.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    """
+    store = _require_store()
+    ciks, resolver = await _store_ciks(symbols, use_cache)
+    df = store.query_concepts(
+        taxonomy=[taxonomy] if taxonomy else None,
+        fact=facts,
+        cik=ciks,
+        fy=fiscal_years,
+        fp=[period.upper() for period in fiscal_periods] if fiscal_periods else None,
+    ).to_pandas()
+    df["symbol"] = df["cik"].map(resolver.symbol)
+    return df
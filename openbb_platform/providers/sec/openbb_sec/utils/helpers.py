@@ -2,17 +2,23 @@
 
 # pylint: disable =unused-argument
 
+import asyncio
+import threading
+import time
 from io import BytesIO
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from zipfile import ZipFile
 
 import pandas as pd
-from aiohttp_client_cache import SQLiteBackend
 from aiohttp_client_cache.session import CachedSession
 from openbb_core.app.utils import get_user_cache_directory
+from openbb_core.provider.utils.cache_db import get_sqlite_backend
 from openbb_core.provider.utils.helpers import amake_request, make_request
 from openbb_sec.utils.definitions import HEADERS, SEC_HEADERS
 
+# Seconds before the symbol resolver tables are reloaded, the same as the HTTP cache expiry.
+RESOLVER_REFRESH_INTERVAL = 3600 * 24 * 2
+
 
 async def sec_callback(response, session):
     """Response callback for SEC requests."""
@@ -42,7 +48,7 @@ async def get_all_companies(use_cache: bool = True) -> pd.DataFrame:
     if use_cache is True:
         cache_dir = f"{get_user_cache_directory()}/http/sec_companies"
         async with CachedSession(
-            cache=SQLiteBackend(cache_dir, expire_after=3600 * 24 * 2)
+            cache=get_sqlite_backend(cache_dir, expire_after=3600 * 24 * 2)
         ) as session:
             try:
                 response = await amake_request(url, headers=SEC_HEADERS, session=session)  # type: ignore
@@ -69,7 +75,7 @@ async def get_all_ciks(use_cache: bool = True) -> pd.DataFrame:
     if use_cache is True:
         cache_dir = f"{get_user_cache_directory()}/http/sec_ciks"
         async with CachedSession(
-            cache=SQLiteBackend(cache_dir, expire_after=3600 * 24 * 2)
+            cache=get_sqlite_backend(cache_dir, expire_after=3600 * 24 * 2)
         ) as session:
             try:
                 response = await amake_request(url, headers=SEC_HEADERS, session=session, response_callback=callback)  # type: ignore
@@ -102,7 +108,7 @@ async def get_mf_and_etf_map(use_cache: bool = True) -> pd.DataFrame:
     if use_cache is True:
         cache_dir = f"{get_user_cache_directory()}/http/sec_mf_etf_map"
         async with CachedSession(
-            cache=SQLiteBackend(cache_dir, expire_after=3600 * 24 * 2)
+            cache=get_sqlite_backend(cache_dir, expire_after=3600 * 24 * 2)
         ) as session:
             try:
                 response = await amake_request(url, headers=SEC_HEADERS, session=session, response_callback=sec_callback)  # type: ignore
@@ -123,22 +129,151 @@ async def search_institutions(keyword: str, use_cache: bool = True) -> pd.DataFr
     return institutions[hp]
 
 
+class SymbolResolver:
+    """Hash indexes of the company and fund tickers registered with the SEC.
+
+    The company and fund tables are downloaded when first needed, indexed once
+    per process, and reloaded after `RESOLVER_REFRESH_INTERVAL` seconds.
+    Companies take precedence over funds when a ticker is in both tables, and
+    the first ticker of a company, by market cap order, is its main ticker.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the resolver."""
+        self.fund_columns: List[str] = []
+        self._ciks: Dict[str, str] = {}
+        self._symbols: Dict[str, str] = {}
+        self._fund_ciks: Dict[str, str] = {}
+        self._funds: Dict[Tuple[str, str], List[Dict]] = {}
+        self._updated: Dict[str, float] = {}
+        self._locks: Dict[int, Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_symbol(symbol: str) -> str:
+        """Normalize a ticker symbol to the SEC format, e.g. BRK.A to BRK-A."""
+        return symbol.upper().replace(".", "-")
+
+    @staticmethod
+    def normalize_cik(cik: Union[str, int]) -> str:
+        """Normalize a CIK number to an integer string without leading zeros."""
+        return str(cik).lstrip("0")
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Get the lock loading the tables in the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for loop_id, (other, _) in list(self._locks.items()):
+                if other.is_closed():
+                    del self._locks[loop_id]
+            if id(loop) not in self._locks:
+                self._locks[id(loop)] = (loop, asyncio.Lock())
+            return self._locks[id(loop)][1]
+
+    def _is_fresh(self, table: str) -> bool:
+        """Check if a table was loaded less than the refresh interval ago."""
+        updated = self._updated.get(table)
+        return (
+            updated is not None
+            and time.monotonic() - updated < RESOLVER_REFRESH_INTERVAL
+        )
+
+    def _index_companies(self, companies: pd.DataFrame) -> None:
+        """Index the companies of `get_all_companies`."""
+        ciks: Dict[str, str] = {}
+        symbols: Dict[str, str] = {}
+        for cik, symbol in zip(companies["cik"], companies["symbol"]):
+            ciks.setdefault(symbol, cik)
+            symbols.setdefault(cik, symbol)
+        self._ciks, self._symbols = ciks, symbols
+
+    def _index_funds(self, funds: pd.DataFrame) -> None:
+        """Index the mutual funds and ETFs of `get_mf_and_etf_map`."""
+        ciks: Dict[str, str] = {}
+        index: Dict[Tuple[str, str], List[Dict]] = {}
+        for fund in funds.to_dict("records"):
+            ciks.setdefault(fund["symbol"], fund["cik"])
+            for key in ("cik", "seriesId", "classId", "symbol"):
+                index.setdefault((key, fund[key]), []).append(fund)
+        self.fund_columns = list(funds.columns)
+        self._fund_ciks, self._funds = ciks, index
+
+    async def load(
+        self, companies: bool = True, funds: bool = False, use_cache: bool = True
+    ) -> "SymbolResolver":
+        """Load the company and fund tables, unless they are already loaded.
+
+        With `use_cache` set to False, the tables are downloaded again.
+        """
+        tables = [
+            table
+            for table, needed in (("companies", companies), ("funds", funds))
+            if needed and (not use_cache or not self._is_fresh(table))
+        ]
+        if not tables:
+            return self
+        async with self._get_lock():
+            for table in tables:
+                # Another task may have loaded it while this one was waiting.
+                if use_cache and self._is_fresh(table):
+                    continue
+                if table == "companies":
+                    self._index_companies(await get_all_companies(use_cache))
+                else:
+                    self._index_funds(await get_mf_and_etf_map(use_cache))
+                self._updated[table] = time.monotonic()
+        return self
+
+    def cik(self, symbol: str) -> Optional[str]:
+        """Get the 10 digit CIK number of a ticker symbol in the loaded tables."""
+        symbol = self.normalize_symbol(symbol)
+        cik = self._ciks.get(symbol) or self._fund_ciks.get(symbol)
+        return cik.zfill(10) if cik else None
+
+    def symbol(self, cik: Union[str, int]) -> Optional[str]:
+        """Get the main ticker symbol of a company CIK number."""
+        return self._symbols.get(self.normalize_cik(cik))
+
+    def funds(
+        self,
+        symbol: Optional[str] = None,
+        cik: Optional[Union[str, int]] = None,
+        series_id: Optional[str] = None,
+        class_id: Optional[str] = None,
+    ) -> List[Dict]:
+        """Get the fund share classes matching a symbol, CIK, series ID or class ID."""
+        if symbol:
+            return self._funds.get(("symbol", self.normalize_symbol(symbol)), [])
+        if cik:
+            return self._funds.get(("cik", self.normalize_cik(cik)), [])
+        if series_id:
+            return self._funds.get(("seriesId", series_id.upper()), [])
+        if class_id:
+            return self._funds.get(("classId", class_id.upper()), [])
+        return []
+
+
+_symbol_resolver = SymbolResolver()
+
+
+async def get_symbol_resolver(
+    companies: bool = True, funds: bool = False, use_cache: bool = True
+) -> SymbolResolver:
+    """Get the process-wide symbol resolver, with the requested tables loaded."""
+    return await _symbol_resolver.load(
+        companies=companies, funds=funds, use_cache=use_cache
+    )
+
+
 async def symbol_map(symbol: str, use_cache: bool = True) -> str:
     """Return the CIK number of a ticker symbol for querying the SEC API."""
-    symbol = symbol.upper().replace(".", "-")
-    symbols = await get_all_companies(use_cache=use_cache)
-
-    if symbol not in symbols["symbol"].to_list():
-        symbols = await get_mf_and_etf_map(use_cache=use_cache)
-        if symbol not in symbols["symbol"].to_list():
-            return ""
-    cik = symbols[symbols["symbol"] == symbol]["cik"].iloc[0]
-    cik_: str = ""
-    temp = 10 - len(cik)
-    for i in range(temp):  # pylint: disable=W0612
-        cik_ = cik_ + "0"
+    resolver = await get_symbol_resolver(use_cache=use_cache)
+    cik = resolver.cik(symbol)
+    if cik is None:
+        await resolver.load(companies=False, funds=True, use_cache=use_cache)
+        cik = resolver.cik(symbol)
 
-    return str(cik_ + cik)
+    return cik or ""
 
 
 async def cik_map(cik: Union[str, int], use_cache: bool = True) -> str:
@@ -155,13 +290,12 @@ async def cik_map(cik: Union[str, int], use_cache: bool = True) -> str:
     -------
     str: The ticker symbol associated with the CIK number.
     """
-    _cik = str(cik) if isinstance(cik, int) else cik.lstrip("0")
-    symbol = ""
-    companies = await get_all_companies(use_cache=use_cache)
-    if _cik in companies["cik"].to_list():
-        symbol = companies[companies["cik"] == _cik]["symbol"].iloc[0]
-    else:
-        return f"Error: CIK, {_cik}, does not have a unique ticker."
+    resolver = await get_symbol_resolver(use_cache=use_cache)
+    symbol = resolver.symbol(cik)
+    if symbol is None:
+        return (
+            f"Error: CIK, {resolver.normalize_cik(cik)}, does not have a unique ticker."
+        )
 
     return symbol
 
@@ -194,7 +328,7 @@ async def download_zip_file(
     response: Union[dict, List[dict]] = {}
     if use_cache is True:
         cache_dir = f"{get_user_cache_directory()}/http/sec_ftd"
-        async with CachedSession(cache=SQLiteBackend(cache_dir)) as session:
+        async with CachedSession(cache=get_sqlite_backend(cache_dir)) as session:
             try:
                 response = await amake_request(url, session=session, headers=HEADERS, response_callback=callback)  # type: ignore
             finally:
@@ -282,19 +416,12 @@ async def get_series_id(
     if not symbol and not cik:
         raise ValueError("Either symbol or cik must be provided.")
 
-    target = symbol if symbol else cik
-    choice = "cik" if not symbol else "symbol"
-    funds = await get_mf_and_etf_map(use_cache=use_cache)
-
-    results = funds[
-        funds["cik"].str.contains(target, case=False)
-        | funds["seriesId"].str.contains(target, case=False)
-        | funds["classId"].str.contains(target, case=False)
-        | funds["symbol"].str.contains(target, case=False)
-    ]
-
-    if len(results) > 0:
-        results = results[results[choice if not symbol else choice] == target]
+    resolver = await get_symbol_resolver(
+        companies=False, funds=True, use_cache=use_cache
+    )
+    funds = resolver.funds(symbol=symbol) if symbol else resolver.funds(cik=cik)
+    if funds:
+        results = pd.DataFrame(funds, columns=resolver.fund_columns)
 
         return results
 
@@ -318,7 +445,7 @@ async def get_nport_candidates(symbol: str, use_cache: bool = True) -> List[Dict
     response: Union[dict, List[dict]] = {}
     if use_cache is True:
         cache_dir = f"{get_user_cache_directory()}/http/sec_etf"
-        async with CachedSession(cache=SQLiteBackend(cache_dir)) as session:
+        async with CachedSession(cache=get_sqlite_backend(cache_dir)) as session:
             try:
                 response = await amake_request(url, session=session, headers=HEADERS, response_callback=sec_callback)  # type: ignore
             finally:
@@ -0,0 +1,220 @@
+"""Utility functions for parsing SEC Form N-PORT-P."""
+
+from math import isnan
+from typing import Any, Dict, List, Union
+
+# Nested sections of a holding, replaced by their flattened fields.
+NESTED_FIELDS = [
+    "identifiers",
+    "securityLending",
+    "issuerConditional",
+    "assetConditional",
+    "debtSec",
+    "currencyConditional",
+    "derivativeInfo",
+    "repurchaseAgrmt",
+]
+
+
+def _flatten_option(row: Dict, deriv: Dict) -> None:
+    """Flatten an option, swaption or warrant."""
+    row["derivative_category"] = deriv.get("@derivCat")
+    row["counterparty"] = deriv["counterparties"].get("counterpartyName")
+    row["lei"] = deriv["counterparties"].get("counterpartyLei")
+    instrument = deriv["descRefInstrmnt"]
+    row["underlying_name"] = instrument.get("nestedDerivInfo", {}).get(
+        "fwdDeriv", {}
+    ).get("derivAddlInfo", {}).get("title") or instrument.get("otherRefInst", {}).get(
+        "issueTitle"
+    )
+    row["option_type"] = deriv.get("putOrCall")
+    row["derivative_payoff"] = deriv.get("writtenOrPur")
+    row["expiry_date"] = deriv.get("expDt")
+    row["exercise_price"] = deriv.get("exercisePrice")
+    row["exercise_currency"] = deriv.get("exercisePriceCurCd")
+    row["shares_per_contract"] = deriv.get("shareNo")
+    if deriv.get("delta") != "XXXX":
+        row["delta"] = deriv.get("delta")
+    row["unrealized_gain"] = float(deriv.get("unrealizedAppr"))  # type: ignore
+
+
+def _flatten_future(row: Dict, deriv: Dict) -> None:
+    """Flatten a future."""
+    row["derivative_category"] = deriv.get("@derivCat")
+    if isinstance(deriv.get("counterparties"), dict):
+        row["counterparty"] = deriv["counterparties"].get("counterpartyName")
+        row["lei"] = deriv["counterparties"].get("counterpartyLei")
+    index_basket = deriv["descRefInstrmnt"].get("indexBasketInfo", {})
+    row["underlying_name"] = index_basket.get("indexName")
+    row["other_id"] = index_basket.get("indexIdentifier")
+    row["derivative_payoff"] = deriv.get("payOffProf")
+    row["expiry_date"] = deriv.get("expDt") or deriv.get("expDate")
+    row["notional_amount"] = float(deriv.get("notionalAmt"))  # type: ignore
+    row["notional_currency"] = deriv.get("curCd")
+    row["unrealized_gain"] = float(deriv.get("unrealizedAppr"))  # type: ignore
+
+
+def _flatten_forward(row: Dict, deriv: Dict) -> None:
+    """Flatten a currency forward."""
+    row["derivative_category"] = deriv.get("@derivCat")
+    row["counterparty"] = deriv["counterparties"].get("counterpartyName")
+    row["currency_sold"] = deriv.get("curSold")
+    row["currency_amount_sold"] = float(deriv.get("amtCurSold"))  # type: ignore
+    row["currency_bought"] = deriv.get("curPur")
+    row["currency_amount_bought"] = float(deriv.get("amtCurPur"))  # type: ignore
+    row["expiry_date"] = deriv.get("settlementDt")
+    row["unrealized_gain"] = float(deriv.get("unrealizedAppr"))  # type: ignore
+
+
+def _flatten_swap_leg(row: Dict, leg: Dict, suffix: str) -> None:
+    """Flatten the floating rate leg of a swap."""
+    tenor = leg["rtResetTenors"]["rtResetTenor"]
+    row[f"rate_type_{suffix}"] = leg.get("@fixedOrFloating")
+    row[f"floating_rate_index_{suffix}"] = leg.get("@floatingRtIndex")
+    row[f"floating_rate_spread_{suffix}"] = float(leg.get("@floatingRtSpread"))  # type: ignore
+    row[f"payment_amount_{suffix}"] = float(leg.get("@pmntAmt"))  # type: ignore
+    row[f"rate_tenor_{suffix}"] = tenor.get("@rateTenor")
+    row[f"rate_tenor_unit_{suffix}"] = tenor.get("@rateTenorUnit")
+    row[f"reset_date_{suffix}"] = tenor.get("@resetDt")
+    # The reset date unit of both legs has always been reported in the same field.
+    row["reset_date_unit_rec"] = tenor.get("@resetDtUnit")
+
+
+def _flatten_swap(row: Dict, deriv: Dict) -> None:
+    """Flatten a swap."""
+    row["derivative_category"] = deriv.get("@derivCat")
+    row["counterparty"] = deriv["counterparties"].get("counterpartyName")
+    row["lei"] = deriv["counterparties"].get("counterpartyLei")
+    instrument = deriv["descRefInstrmnt"]
+    if "otherRefInst" in instrument:
+        row["underlying_name"] = instrument["otherRefInst"].get("issueTitle")
+    if "indexBasketInfo" in instrument:
+        row["underlying_name"] = instrument["indexBasketInfo"].get("indexName")
+        row["other_id"] = instrument["indexBasketInfo"].get("indexIdentifier")
+    row["swap_description"] = (
+        deriv["otherRecDesc"].get("#text") if "otherRecDesc" in instrument else None
+    )
+    if "floatingRecDesc" in deriv:
+        _flatten_swap_leg(row, deriv["floatingRecDesc"], "rec")
+    if "floatingPmntDesc" in deriv:
+        _flatten_swap_leg(row, deriv["floatingPmntDesc"], "pmnt")
+    row["expiry_date"] = deriv.get("terminationDt")
+    row["upfront_payment"] = float(deriv.get("upfrontPmnt"))  # type: ignore
+    row["payment_currency"] = deriv.get("pmntCurCd")
+    row["upfront_receive"] = float(deriv.get("upfrontRcpt"))  # type: ignore
+    row["receive_currency"] = deriv.get("rcptCurCd")
+    row["notional_amount"] = float(deriv.get("notionalAmt"))  # type: ignore
+    row["notional_currency"] = deriv.get("curCd")
+    row["unrealized_gain"] = float(deriv.get("unrealizedAppr"))  # type: ignore
+
+
+def _flatten_repo(row: Dict, repo: Dict) -> None:
+    """Flatten a repurchase agreement."""
+    row["repo_type"] = repo.get("transCat")
+    cleared = repo.get("clearedCentCparty")
+    if isinstance(cleared, dict):
+        row["is_cleared"] = cleared.get("@isCleared")
+        row["counterparty"] = cleared.get("@centralCounterparty")
+    row["is_tri_party"] = repo.get("isTriParty")
+    row["annualized_return"] = repo.get("repurchaseRt")
+    row["maturity_date"] = repo.get("maturityDt")
+    collaterals = repo.get("repurchaseCollaterals")
+    if collaterals and "repurchaseCollateral" in collaterals:
+        collateral = collaterals["repurchaseCollateral"]
+        row["principal_amount"] = float(collateral.get("principalAmt"))
+        row["principal_currency"] = collateral.get("@principalCd")
+        row["collateral_amount"] = float(collateral.get("collateralVal"))
+        row["collateral_currency"] = collateral.get("@collateralCd")
+        row["collateral_type"] = collateral.get("@invstCat")
+
+
+def flatten_holding(holding: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten the nested sections of an N-PORT holding, `invstOrSec`, into one record."""
+    row = {k: v for k, v in holding.items() if k not in NESTED_FIELDS}
+
+    identifiers = holding.get("identifiers")
+    if isinstance(identifiers, dict):
+        if "isin" in identifiers:
+            row["isin"] = identifiers["isin"].get("@value")
+        if "other" in identifiers and "@value" in identifiers["other"]:
+            row["other_id"] = identifiers["other"].get("@value")
+
+    security_lending = holding.get("securityLending")
+    if isinstance(security_lending, dict):
+        if "loanByFundCondition" in security_lending:
+            condition = security_lending["loanByFundCondition"]
+            row["isLoanByFund"] = condition.get("@isLoanByFund")
+            row["loanVal"] = condition.get("@loanVal")
+        if "isCashCollateral" in security_lending:
+            row["isCashCollateral"] = security_lending.get("isCashCollateral")
+        if "isNonCashCollateral" in security_lending:
+            row["isNonCashCollateral"] = security_lending.get("isNonCashCollateral")
+
+    debt_sec = holding.get("debtSec")
+    if isinstance(debt_sec, dict):
+        row["maturity_date"] = debt_sec.get("maturityDt")
+        row["coupon_kind"] = debt_sec.get("couponKind")
+        row["annualized_return"] = debt_sec.get("annualizedRt")
+        row["is_default"] = debt_sec.get("isDefault")
+        row["in_arrears"] = debt_sec.get("areIntrstPmntsInArrs")
+        row["is_paid_kind"] = debt_sec.get("isPaidKind")
+
+    if isinstance(holding.get("issuerConditional"), dict):
+        row["issuer_conditional"] = holding["issuerConditional"].get("@desc")
+
+    if isinstance(holding.get("assetConditional"), dict):
+        row["asset_conditional"] = holding["assetConditional"].get("@desc")
+
+    derivative_info = holding.get("derivativeInfo")
+    if isinstance(derivative_info, dict):
+        if "optionSwaptionWarrantDeriv" in derivative_info:
+            _flatten_option(row, derivative_info["optionSwaptionWarrantDeriv"])
+        if "futrDeriv" in derivative_info:
+            _flatten_future(row, derivative_info["futrDeriv"])
+        if "fwdDeriv" in derivative_info:
+            _flatten_forward(row, derivative_info["fwdDeriv"])
+        if "swapDeriv" in derivative_info:
+            _flatten_swap(row, derivative_info["swapDeriv"])
+
+    if isinstance(holding.get("repurchaseAgrmt"), dict):
+        _flatten_repo(row, holding["repurchaseAgrmt"])
+
+    currency_conditional = holding.get("currencyConditional")
+    if isinstance(currency_conditional, dict):
+        row["exchange_currency"] = currency_conditional.get("@curCd")
+        row["exchange_rate"] = currency_conditional.get("@exchangeRt")
+
+    return row
+
+
+def parse_nport_holdings(
+    holdings: Union[Dict[str, Any], List[Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """Parse the holdings of an N-PORT filing, sorted by their percentage of net assets.
+
+    Each holding is flattened in a single pass, and the records are aligned on
+    the same fields, the reported fields first and the flattened fields after,
+    without building a DataFrame. Missing and "N/A" values are None.
+    """
+    if isinstance(holdings, dict):
+        # A filing with a single holding is parsed as a dictionary.
+        holdings = [holdings]
+    rows = [flatten_holding(holding) for holding in holdings]
+    columns = {
+        k: None for holding in holdings for k in holding if k not in NESTED_FIELDS
+    }
+    columns.update({k: None for row in rows for k in row})
+    records = []
+    for row in rows:
+        record = {}
+        for column in columns:
+            value = row.get(column)
+            record[column] = None if value is None or value == "N/A" else value
+        pct = None if record.get("pctVal") is None else float(record["pctVal"])
+        record["pctVal"] = None if pct is None or isnan(pct) else pct
+        records.append(record)
+    # Highest percentage first, the holdings without one last.
+    return sorted(
+        records,
+        key=lambda r: (r["pctVal"] is None, -(r["pctVal"] or 0)),
+    )
@@ -0,0 +1,337 @@
+"""SEC XBRL Store."""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from warnings import warn
+
+if TYPE_CHECKING:
+    from pyarrow import Table  # type: ignore
+
+# Seconds before the stored company concepts and recent frames are stale.
+XBRL_STORE_EXPIRY = 3600 * 24
+# Columns of the frames table, other than the partition columns.
+FRAME_COLUMNS = {
+    "accn": "string",
+    "cik": "int64",
+    "entityName": "string",
+    "loc": "string",
+    "start": "string",
+    "end": "string",
+    "val": "float64",
+}
+# Columns of the concepts table, other than the partition columns.
+CONCEPT_COLUMNS = {
+    "start": "string",
+    "end": "string",
+    "val": "float64",
+    "accn": "string",
+    "fy": "int64",
+    "fp": "string",
+    "form": "string",
+    "filed": "string",
+    "frame": "string",
+    "unit": "string",
+}
+FRAME_PARTITIONS = ["taxonomy", "fact", "unit", "period"]
+CONCEPT_PARTITIONS = ["taxonomy", "fact", "cik"]
+
+
+class XbrlStore:
+    """Local Parquet store of the XBRL frames and company concepts.
+
+    The responses of the frames and company concept APIs are stored as Parquet
+    files in Hive partitioned directories, one file per request:
+
+    - frames/taxonomy=<taxonomy>/fact=<fact>/unit=<unit>/period=<period>/data.parquet
+    - concepts/taxonomy=<taxonomy>/fact=<fact>/cik=<cik>/data.parquet
+
+    The remaining fields of a response are kept in the file metadata. Stored
+    tables can be queried across files with `query_frames` and `query_concepts`,
+    which only open the files of the partitions matching the filters, and skip
+    their row groups that don't match the other filters.
+
+    Parameters
+    ----------
+    path : Optional[Union[str, Path]]
+        Root directory of the store, by default `sec_xbrl` in the user cache directory.
+    expire_after : int
+        Seconds before the company concepts and the frames of the current and
+        previous years are downloaded again. Older frames don't expire.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        expire_after: int = XBRL_STORE_EXPIRY,
+    ) -> None:
+        """Initialize the store."""
+        # pylint: disable=import-outside-toplevel
+        import pyarrow  # type: ignore  # noqa: F401
+
+        if path is None:
+            from openbb_core.app.utils import get_user_cache_directory
+
+            path = Path(get_user_cache_directory(), "sec_xbrl")
+        self.path = Path(path)
+        self.expire_after = expire_after
+
+    @staticmethod
+    def _schema(columns: Dict[str, str]):
+        """Get the Arrow schema of a table."""
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+        return pa.schema([(name, pa.type_for_alias(t)) for name, t in columns.items()])
+
+    def _file(self, table: str, **partitions: Any) -> Path:
+        """Get the file of a partition."""
+        return Path(
+            self.path,
+            table,
+            *[f"{k}={v}" for k, v in partitions.items()],
+            "data.parquet",
+        )
+
+    def _is_fresh(self, file: Path, permanent: bool) -> bool:
+        """Check if a stored response can be used."""
+        try:
+            modified = file.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return permanent or time.time() - modified < self.expire_after
+
+    def _write(
+        self,
+        file: Path,
+        records: List[Dict],
+        columns: Dict[str, str],
+        metadata: Dict,
+    ) -> None:
+        """Write the records of a response, replacing the stored ones atomically."""
+        # pylint: disable=import-outside-toplevel
+        import pyarrow as pa
+        import pyarrow.parquet as pq  # type: ignore
+
+        schema = self._schema(columns).with_metadata({"openbb": json.dumps(metadata)})
+        temp = file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            table = pa.Table.from_pylist(
+                [{k: r.get(k) for k in columns} for r in records], schema=schema
+            )
+            file.parent.mkdir(parents=True, exist_ok=True)
+            pq.write_table(table, temp)
+            os.replace(temp, file)
+        except (OSError, TypeError, ValueError) as e:
+            # The response is still returned, it is only not stored.
+            temp.unlink(missing_ok=True)
+            warn(f"The SEC XBRL store could not be updated: {e}")
+
+    @staticmethod
+    def _read(file: Path) -> Optional["Table"]:
+        """Read a stored response, None if it is missing or unreadable."""
+        import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+
+        try:
+            # Read the file alone, without the partition columns of its path.
+            return pq.ParquetFile(file).read()
+        except (OSError, ValueError):
+            return None
+
+    def get_frame(
+        self, taxonomy: str, fact: str, unit: str, period: str, permanent: bool = False
+    ) -> Optional[Dict]:
+        """Get a stored frame, as returned by the frames API.
+
+        Parameters
+        ----------
+        taxonomy : str
+            The taxonomy of the fact.
+        fact : str
+            The fact name.
+        unit : str
+            The unit of measure of the fact.
+        period : str
+            The period requested, e.g. CY2023, CY2023Q1 or CY2023Q1I.
+        permanent : bool
+            Whether the frame doesn't expire, for periods no longer amended.
+
+        Returns
+        -------
+        Optional[Dict]
+            The frame, with the data as an Arrow table, None if it is not stored or stale.
+        """
+        file = self._file(
+            "frames", taxonomy=taxonomy, fact=fact, unit=unit, period=period
+        )
+        if not self._is_fresh(file, permanent):
+            return None
+        table = self._read(file)
+        if table is None:
+            return None
+        response = json.loads(table.schema.metadata[b"openbb"])
+        response["data"] = table.replace_schema_metadata()
+        return response
+
+    def put_frame(
+        self, taxonomy: str, fact: str, unit: str, period: str, response: Dict
+    ) -> None:
+        """Store a frame returned by the frames API."""
+        metadata = {k: v for k, v in response.items() if k != "data"}
+        self._write(
+            self._file(
+                "frames", taxonomy=taxonomy, fact=fact, unit=unit, period=period
+            ),
+            response.get("data", []),
+            FRAME_COLUMNS,
+            metadata,
+        )
+
+    def get_concept(
+        self, taxonomy: str, fact: str, cik: Union[str, int]
+    ) -> Optional[Dict]:
+        """Get a stored company concept, as returned by the company concept API.
+
+        Returns
+        -------
+        Optional[Dict]
+            The company concept, None if it is not stored or stale.
+        """
+        file = self._file("concepts", taxonomy=taxonomy, fact=fact, cik=int(cik))
+        if not self._is_fresh(file, False):
+            return None
+        table = self._read(file)
+        if table is None:
+            return None
+        response = json.loads(table.schema.metadata[b"openbb"])
+        units: Dict[str, List[Dict]] = {unit: [] for unit in response.pop("units")}
+        for record in table.to_pylist():
+            units[record.pop("unit")].append(record)
+        response["units"] = units
+        return response
+
+    def put_concept(
+        self, taxonomy: str, fact: str, cik: Union[str, int], response: Dict
+    ) -> None:
+        """Store a company concept returned by the company concept API."""
+        units = response.get("units", {})
+        metadata = {k: v for k, v in response.items() if k != "units"}
+        metadata["units"] = list(units)
+        self._write(
+            self._file("concepts", taxonomy=taxonomy, fact=fact, cik=int(cik)),
+            [dict(item, unit=unit) for unit, items in units.items() for item in items],
+            CONCEPT_COLUMNS,
+            metadata,
+        )
+
+    def _query(
+        self,
+        table: str,
+        partitions: List[str],
+        columns: Dict[str, str],
+        filters: Dict[str, Optional[List[Any]]],
+    ) -> "Table":
+        """Query a table, reading only the partitions and row groups matching the filters."""
+        # pylint: disable=import-outside-toplevel
+        import pyarrow as pa
+        import pyarrow.dataset as ds  # type: ignore
+
+        partition_schema = pa.schema(
+            [
+                (name, pa.int64() if name == "cik" else pa.string())
+                for name in partitions
+            ]
+        )
+        schema = pa.unify_schemas([self._schema(columns), partition_schema])
+        root = Path(self.path, table)
+        # Only the stored files, without the temporary files of the writes in progress.
+        files = sorted(str(file) for file in root.rglob("data.parquet"))
+        if not files:
+            return schema.empty_table()
+        dataset = ds.dataset(
+            files,
+            schema=schema,
+            format="parquet",
+            partitioning=ds.partitioning(partition_schema, flavor="hive"),
+            partition_base_dir=str(root),
+        )
+        expression = None
+        for name, values in filters.items():
+            if values is None:
+                continue
+            condition = ds.field(name).isin(values)
+            expression = condition if expression is None else expression & condition
+        return dataset.to_table(filter=expression)
+
+    def query_frames(
+        self,
+        taxonomy: Optional[List[str]] = None,
+        fact: Optional[List[str]] = None,
+        unit: Optional[List[str]] = None,
+        period: Optional[List[str]] = None,
+        cik: Optional[List[int]] = None,
+    ) -> "Table":
+        """Query the stored frames, across facts and periods.
+
+        Each filter is a list of accepted values, None accepts all.
+
+        Returns
+        -------
+        pyarrow.Table
+            The matching rows, with the partition columns.
+        """
+        return self._query(
+            "frames",
+            FRAME_PARTITIONS,
+            FRAME_COLUMNS,
+            {
+                "taxonomy": taxonomy,
+                "fact": fact,
+                "unit": unit,
+                "period": period,
+                "cik": cik,
+            },
+        )
+
+    def query_concepts(
+        self,
+        taxonomy: Optional[List[str]] = None,
+        fact: Optional[List[str]] = None,
+        cik: Optional[List[int]] = None,
+        fy: Optional[List[int]] = None,
+        fp: Optional[List[str]] = None,
+    ) -> "Table":
+        """Query the stored company concepts, across companies and facts.
+
+        Each filter is a list of accepted values, None accepts all.
+
+        Returns
+        -------
+        pyarrow.Table
+            The matching rows, with the partition columns.
+        """
+        return self._query(
+            "concepts",
+            CONCEPT_PARTITIONS,
+            CONCEPT_COLUMNS,
+            {"taxonomy": taxonomy, "fact": fact, "cik": cik, "fy": fy, "fp": fp},
+        )
+
+
+_xbrl_store: Optional[XbrlStore] = None
+_xbrl_store_lock = threading.Lock()
+
+
+def get_xbrl_store() -> Optional[XbrlStore]:
+    """Get the process-wide XBRL store, None if pyarrow is not installed."""
+    global _xbrl_store  # pylint: disable=global-statement  # noqa: PLW0603
+
+    with _xbrl_store_lock:
+        if _xbrl_store is None:
+            try:
+                _xbrl_store = XbrlStore()
+            except ImportError:
+                return None
+        return _xbrl_store
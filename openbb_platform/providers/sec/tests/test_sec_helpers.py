@@ -0,0 +1,106 @@
+"""Test the SEC helpers."""
+
+import pandas as pd
+import pytest
+from openbb_sec.utils import helpers
+from openbb_sec.utils.helpers import SymbolResolver
+
+# pylint: disable=redefined-outer-name
+
+COMPANIES = pd.DataFrame(
+    {
+        "cik": ["320193", "1067983", "1067983", "1652044"],
+        "symbol": ["AAPL", "BRK-B", "BRK-A", "GOOGL"],
+        "name": ["Apple Inc.", "Berkshire", "Berkshire", "Alphabet"],
+    }
+)
+FUNDS = pd.DataFrame(
+    {
+        "cik": ["36405", "36405", "999"],
+        "seriesId": ["S000002277", "S000002277", "S000000001"],
+        "classId": ["C000006113", "C000092055", "C000000001"],
+        "symbol": ["VFIAX", "VOO", "AAPL"],
+    }
+)
+
+
+@pytest.fixture
+def tables(monkeypatch):
+    """Mock the company and fund tables, counting the downloads."""
+    downloads = {"companies": 0, "funds": 0}
+
+    async def get_all_companies(use_cache=True):
+        downloads["companies"] += 1
+        return COMPANIES.copy()
+
+    async def get_mf_and_etf_map(use_cache=True):
+        downloads["funds"] += 1
+        return FUNDS.copy()
+
+    monkeypatch.setattr(helpers, "get_all_companies", get_all_companies)
+    monkeypatch.setattr(helpers, "get_mf_and_etf_map", get_mf_and_etf_map)
+    return downloads
+
+
+@pytest.mark.asyncio
+async def test_symbol_resolver_ticker(tables):
+    """Test the CIK of a ticker, in the company table first."""
+    resolver = await SymbolResolver().load(funds=True)
+
+    assert resolver.cik("AAPL") == "0000320193"
+    assert resolver.cik("brk.a") == "0001067983"
+    assert resolver.cik("VOO") == "0000036405"
+    assert resolver.cik("UNKNOWN") is None
+
+
+@pytest.mark.asyncio
+async def test_symbol_resolver_cik(tables):
+    """Test the main ticker of a CIK, with or without leading zeros."""
+    resolver = await SymbolResolver().load()
+
+    assert resolver.symbol("1067983") == "BRK-B"
+    assert resolver.symbol("0001067983") == "BRK-B"
+    assert resolver.symbol(320193) == "AAPL"
+    assert resolver.symbol("0000000001") is None
+
+
+@pytest.mark.asyncio
+async def test_symbol_resolver_funds(tables):
+    """Test the fund share classes are found by any of their identifiers."""
+    resolver = await SymbolResolver().load(companies=False, funds=True)
+
+    assert [f["symbol"] for f in resolver.funds(cik="0000036405")] == ["VFIAX", "VOO"]
+    assert [f["symbol"] for f in resolver.funds(series_id="s000002277")] == [
+        "VFIAX",
+        "VOO",
+    ]
+    assert [f["symbol"] for f in resolver.funds(class_id="C000092055")] == ["VOO"]
+    assert resolver.funds(symbol="UNKNOWN") == []
+    assert resolver.funds() == []
+
+
+@pytest.mark.asyncio
+async def test_symbol_resolver_refresh(tables, monkeypatch):
+    """Test the tables are downloaded once, until they are stale or the cache is off."""
+    resolver = SymbolResolver()
+    await resolver.load()
+    await resolver.load()
+    assert tables == {"companies": 1, "funds": 0}
+
+    await resolver.load(use_cache=False)
+    assert tables["companies"] == 2
+
+    monkeypatch.setattr(helpers, "RESOLVER_REFRESH_INTERVAL", 0)
+    await resolver.load()
+    assert tables["companies"] == 3
+
+
+@pytest.mark.asyncio
+async def test_symbol_map_falls_back_to_funds(tables, monkeypatch):
+    """Test symbol_map and cik_map use the process-wide resolver."""
+    monkeypatch.setattr(helpers, "_symbol_resolver", SymbolResolver())
+
+    assert await helpers.symbol_map("VOO") == "0000036405"
+    assert await helpers.symbol_map("UNKNOWN") == ""
+    assert await helpers.cik_map(1652044) == "GOOGL"
+    assert (await helpers.cik_map(1)).startswith("Error")
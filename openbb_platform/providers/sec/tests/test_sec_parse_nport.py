@@ -0,0 +1,268 @@
+"""Test the N-PORT parser."""
+
+from openbb_sec.utils.parse_nport import flatten_holding, parse_nport_holdings
+
+EQUITY = {
+    "name": "Apple Inc.",
+    "lei": "HWUPKR0MPOU8FGXBT394",
+    "title": "Apple Inc.",
+    "cusip": "037833100",
+    "identifiers": {"isin": {"@value": "US0378331005"}},
+    "balance": "100",
+    "valUSD": "19000",
+    "pctVal": "1.5",
+    "assetCat": "EC",
+    "securityLending": {
+        "isCashCollateral": "N",
+        "isNonCashCollateral": "N",
+        "loanByFundCondition": {"@isLoanByFund": "Y", "@loanVal": "500"},
+    },
+}
+
+OPTION = {
+    "name": "SPX Put",
+    "pctVal": "0.2",
+    "derivativeInfo": {
+        "optionSwaptionWarrantDeriv": {
+            "@derivCat": "OPT",
+            "counterparties": {"counterpartyName": "CBOE", "counterpartyLei": "N/A"},
+            "putOrCall": "Put",
+            "writtenOrPur": "Purchased",
+            "descRefInstrmnt": {"otherRefInst": {"issueTitle": "S&P 500 Index"}},
+            "shareNo": "100",
+            "exercisePrice": "4000",
+            "exercisePriceCurCd": "USD",
+            "expDt": "2024-12-20",
+            "delta": "XXXX",
+            "unrealizedAppr": "-12.5",
+        }
+    },
+}
+
+FUTURE = {
+    "name": "E-mini S&P 500",
+    "pctVal": "0.1",
+    "derivativeInfo": {
+        "futrDeriv": {
+            "@derivCat": "FUT",
+            "counterparties": {"counterpartyName": "CME", "counterpartyLei": "LEI1"},
+            "descRefInstrmnt": {
+                "indexBasketInfo": {"indexName": "S&P 500", "indexIdentifier": "SPX"}
+            },
+            "payOffProf": "Long",
+            "expDate": "2024-12-20",
+            "notionalAmt": "250000",
+            "curCd": "USD",
+            "unrealizedAppr": "1000",
+        }
+    },
+}
+
+FORWARD = {
+    "name": "EUR/USD Forward",
+    "pctVal": "0.05",
+    "derivativeInfo": {
+        "fwdDeriv": {
+            "@derivCat": "FWD",
+            "counterparties": {"counterpartyName": "Bank"},
+            "curSold": "EUR",
+            "amtCurSold": "1000",
+            "curPur": "USD",
+            "amtCurPur": "1100",
+            "settlementDt": "2024-09-30",
+            "unrealizedAppr": "3",
+        }
+    },
+}
+
+LEG = {
+    "@fixedOrFloating": "Floating",
+    "@floatingRtIndex": "SOFR",
+    "@floatingRtSpread": "0.5",
+    "@pmntAmt": "100",
+    "rtResetTenors": {
+        "rtResetTenor": {
+            "@rateTenor": "3",
+            "@rateTenorUnit": "Month",
+            "@resetDt": "1",
+            "@resetDtUnit": "Day",
+        }
+    },
+}
+
+SWAP = {
+    "name": "Interest Rate Swap",
+    "pctVal": "0.3",
+    "derivativeInfo": {
+        "swapDeriv": {
+            "@derivCat": "SWP",
+            "counterparties": {"counterpartyName": "Dealer", "counterpartyLei": "LEI2"},
+            "descRefInstrmnt": {
+                "indexBasketInfo": {"indexName": "SOFR", "indexIdentifier": "SOFR"}
+            },
+            "floatingRecDesc": LEG,
+            "floatingPmntDesc": LEG,
+            "terminationDt": "2030-01-01",
+            "upfrontPmnt": "0",
+            "pmntCurCd": "USD",
+            "upfrontRcpt": "0",
+            "rcptCurCd": "USD",
+            "notionalAmt": "1000000",
+            "curCd": "USD",
+            "unrealizedAppr": "-50",
+        }
+    },
+}
+
+REPO = {
+    "name": "Repo",
+    "pctVal": "2.0",
+    "repurchaseAgrmt": {
+        "transCat": "Repurchase",
+        "clearedCentCparty": {"@isCleared": "Y", "@centralCounterparty": "FICC"},
+        "isTriParty": "N",
+        "repurchaseRt": "5.3",
+        "maturityDt": "2024-07-01",
+        "repurchaseCollaterals": {
+            "repurchaseCollateral": {
+                "principalAmt": "1000",
+                "@principalCd": "USD",
+                "collateralVal": "1020",
+                "@collateralCd": "USD",
+                "@invstCat": "UST",
+            }
+        },
+    },
+}
+
+
+def test_flatten_equity():
+    """Test the identifiers and securities lending fields are flattened."""
+    row = flatten_holding(EQUITY)
+
+    assert "identifiers" not in row
+    assert "securityLending" not in row
+    assert row["isin"] == "US0378331005"
+    assert row["isLoanByFund"] == "Y"
+    assert row["loanVal"] == "500"
+    assert row["isCashCollateral"] == "N"
+    assert row["cusip"] == "037833100"
+
+
+def test_flatten_option():
+    """Test an option, without a reported delta."""
+    row = flatten_holding(OPTION)
+
+    assert row["derivative_category"] == "OPT"
+    assert row["counterparty"] == "CBOE"
+    assert row["underlying_name"] == "S&P 500 Index"
+    assert row["option_type"] == "Put"
+    assert row["exercise_price"] == "4000"
+    assert row["unrealized_gain"] == -12.5
+    assert "delta" not in row
+
+
+def test_flatten_future():
+    """Test a future with its expiration in the alternative field."""
+    row = flatten_holding(FUTURE)
+
+    assert row["derivative_category"] == "FUT"
+    assert row["underlying_name"] == "S&P 500"
+    assert row["other_id"] == "SPX"
+    assert row["expiry_date"] == "2024-12-20"
+    assert row["notional_amount"] == 250000.0
+    assert row["lei"] == "LEI1"
+
+
+def test_flatten_forward():
+    """Test a currency forward."""
+    row = flatten_holding(FORWARD)
+
+    assert row["currency_sold"] == "EUR"
+    assert row["currency_amount_sold"] == 1000.0
+    assert row["currency_bought"] == "USD"
+    assert row["currency_amount_bought"] == 1100.0
+    assert row["expiry_date"] == "2024-09-30"
+    assert "lei" not in row
+
+
+def test_flatten_swap():
+    """Test a swap with two floating legs."""
+    row = flatten_holding(SWAP)
+
+    assert row["underlying_name"] == "SOFR"
+    assert row["swap_description"] is None
+    for suffix in ["rec", "pmnt"]:
+        assert row[f"floating_rate_index_{suffix}"] == "SOFR"
+        assert row[f"floating_rate_spread_{suffix}"] == 0.5
+        assert row[f"rate_tenor_unit_{suffix}"] == "Month"
+    assert row["reset_date_unit_rec"] == "Day"
+    assert row["notional_amount"] == 1000000.0
+    assert row["unrealized_gain"] == -50.0
+
+
+def test_flatten_repo():
+    """Test a repurchase agreement and its collateral."""
+    row = flatten_holding(REPO)
+
+    assert row["repo_type"] == "Repurchase"
+    assert row["is_cleared"] == "Y"
+    assert row["counterparty"] == "FICC"
+    assert row["principal_amount"] == 1000.0
+    assert row["collateral_amount"] == 1020.0
+    assert row["collateral_type"] == "UST"
+
+
+def test_flatten_missing_sections():
+    """Test sections that are missing or not dictionaries are skipped."""
+    row = flatten_holding(
+        {"name": "Cash", "identifiers": None, "repurchaseAgrmt": "N/A"}
+    )
+    assert row == {"name": "Cash"}
+
+    row = flatten_holding(
+        {"name": "Repo", "repurchaseAgrmt": {"transCat": "Repurchase"}}
+    )
+    assert row["repo_type"] == "Repurchase"
+    assert "is_cleared" not in row
+    assert "principal_amount" not in row
+
+
+def test_parse_nport_holdings():
+    """Test the records are aligned and sorted by their percentage of net assets."""
+    holdings = [
+        OPTION,
+        {"name": "No percentage", "pctVal": "N/A"},
+        EQUITY,
+        {"name": "NaN percentage", "pctVal": "nan"},
+        REPO,
+        FUTURE,
+        FORWARD,
+        SWAP,
+    ]
+
+    records = parse_nport_holdings(holdings)
+
+    assert [r["name"] for r in records[:6]] == [
+        "Repo",
+        "Apple Inc.",
+        "Interest Rate Swap",
+        "SPX Put",
+        "E-mini S&P 500",
+        "EUR/USD Forward",
+    ]
+    assert {r["name"] for r in records[6:]} == {"No percentage", "NaN percentage"}
+    assert all(r["pctVal"] is None for r in records[6:])
+    assert len({tuple(r) for r in records}) == 1
+    columns = list(records[0])
+    assert columns.index("pctVal") < columns.index("isin")
+    assert records[3]["lei"] is None
+    assert records[1]["option_type"] is None
+
+
+def test_parse_nport_single_holding():
+    """Test a filing with a single holding, parsed as a dictionary."""
+    records = parse_nport_holdings(EQUITY)
+
+    assert len(records) == 1
+    assert records[0]["pctVal"] == 1.5
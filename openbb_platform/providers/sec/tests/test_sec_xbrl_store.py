@@ -0,0 +1,283 @@
+"""Test the SEC XBRL store."""
+
+import os
+import time
+from datetime import datetime
+
+import pytest
+from openbb_sec.utils import frames
+from openbb_sec.utils.xbrl_store import XbrlStore
+
+# pylint: disable=redefined-outer-name
+
+FRAME = {
+    "taxonomy": "us-gaap",
+    "tag": "Revenues",
+    "ccp": "CY2019",
+    "uom": "USD",
+    "label": "Revenues",
+    "description": "Amount of revenue.",
+    "pts": 2,
+    "data": [
+        {
+            "accn": "0000320193-19-000119",
+            "cik": 320193,
+            "entityName": "Apple Inc.",
+            "loc": "US-CA",
+            "start": "2018-09-30",
+            "end": "2019-09-28",
+            "val": 260174000000,
+        },
+        {
+            "accn": "0001652044-20-000008",
+            "cik": 1652044,
+            "entityName": "Alphabet Inc.",
+            "loc": "US-CA",
+            "start": "2019-01-01",
+            "end": "2019-12-31",
+            "val": 161857000000,
+        },
+    ],
+}
+CONCEPT = {
+    "cik": 320193,
+    "taxonomy": "us-gaap",
+    "tag": "Revenues",
+    "label": "Revenues",
+    "description": "Amount of revenue.",
+    "entityName": "Apple Inc.",
+    "units": {
+        "USD": [
+            {
+                "start": "2018-09-30",
+                "end": "2019-09-28",
+                "val": 260174000000,
+                "accn": "0000320193-19-000119",
+                "fy": 2019,
+                "fp": "FY",
+                "form": "10-K",
+                "filed": "2019-10-31",
+                "frame": "CY2019",
+            }
+        ],
+        "EUR": [],
+    },
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Get an empty store."""
+    return XbrlStore(tmp_path, expire_after=60)
+
+
+def _age(store, table, seconds):
+    """Set the modification time of the stored files to the past."""
+    for file in store.path.joinpath(table).rglob("data.parquet"):
+        past = time.time() - seconds
+        os.utime(file, (past, past))
+
+
+def test_frame_round_trip(store):
+    """Test a stored frame is read back as returned by the API."""
+    assert store.get_frame("us-gaap", "Revenues", "USD", "CY2019") is None
+
+    store.put_frame("us-gaap", "Revenues", "USD", "CY2019", FRAME)
+    frame = store.get_frame("us-gaap", "Revenues", "USD", "CY2019")
+
+    assert frame is not None
+    assert {k: v for k, v in frame.items() if k != "data"} == {
+        k: v for k, v in FRAME.items() if k != "data"
+    }
+    assert frame["data"].to_pylist() == [
+        dict(row, val=float(row["val"])) for row in FRAME["data"]
+    ]
+    assert store.get_frame("us-gaap", "Revenues", "USD", "CY2019Q1") is None
+
+
+def test_concept_round_trip(store):
+    """Test a stored company concept is read back with its units."""
+    store.put_concept("us-gaap", "Revenues", "0000320193", CONCEPT)
+
+    assert store.get_concept("us-gaap", "Revenues", 320193) == CONCEPT
+    assert store.get_concept("us-gaap", "Revenues", 1652044) is None
+
+
+def test_expiry(store):
+    """Test concepts and frames expire, unless the frame is permanent."""
+    store.put_frame("us-gaap", "Revenues", "USD", "CY2019", FRAME)
+    store.put_concept("us-gaap", "Revenues", 320193, CONCEPT)
+    _age(store, "frames", 30)
+    _age(store, "concepts", 30)
+
+    assert store.get_frame("us-gaap", "Revenues", "USD", "CY2019") is not None
+    assert store.get_concept("us-gaap", "Revenues", 320193) is not None
+
+    _age(store, "frames", 120)
+    _age(store, "concepts", 120)
+
+    assert store.get_frame("us-gaap", "Revenues", "USD", "CY2019") is None
+    assert store.get_concept("us-gaap", "Revenues", 320193) is None
+    assert store.get_frame("us-gaap", "Revenues", "USD", "CY2019", True) is not None
+
+
+def test_unreadable_file(store):
+    """Test an unreadable file is treated as missing."""
+    file = store.path.joinpath(
+        "frames", "taxonomy=us-gaap", "fact=Revenues", "unit=USD", "period=CY2019"
+    )
+    file.mkdir(parents=True)
+    file.joinpath("data.parquet").write_bytes(b"not parquet")
+
+    assert store.get_frame("us-gaap", "Revenues", "USD", "CY2019") is None
+
+
+@pytest.fixture
+def get_frame(store, monkeypatch):
+    """Mock the downloads of get_frame, recording the URLs requested."""
+    requested = []
+
+    async def fetch_data(url, use_cache, persist):
+        """Fail on the quarterly frames, to fall back to the instantaneous ones."""
+        requested.append(url)
+        if url.endswith("Q1.json"):
+            raise OSError("Not found")
+        return dict(FRAME, ccp=url.rsplit("/", 1)[-1].replace(".json", ""))
+
+    class Resolver:
+        """Resolve no symbol."""
+
+        def symbol(self, cik):
+            """Get the symbol of a CIK."""
+            return None
+
+    async def get_symbol_resolver(use_cache=True):
+        """Get the resolver."""
+        return Resolver()
+
+    monkeypatch.setattr(frames, "fetch_data", fetch_data)
+    monkeypatch.setattr(frames, "get_symbol_resolver", get_symbol_resolver)
+    monkeypatch.setattr(frames, "get_xbrl_store", lambda: store)
+    return requested
+
+
+@pytest.mark.asyncio
+async def test_get_frame_stores_fetched_period(store, get_frame):
+    """Test a frame fetched by the fallback is stored under the period fetched."""
+    with pytest.warns(UserWarning, match="instantaneous"):
+        results = await frames.get_frame(year=2019, fiscal_period="q1")
+
+    assert results["metadata"]["frame"] == "CY2019Q1I"
+    assert get_frame[-1].endswith("CY2019Q1I.json")
+    assert store.get_frame("us-gaap", "Revenues", "USD", "CY2019Q1") is None
+    assert store.get_frame("us-gaap", "Revenues", "USD", "CY2019Q1I") is not None
+
+
+@pytest.mark.asyncio
+async def test_get_frame_previous_year_expires(store, get_frame):
+    """Test the frames of the previous year expire, and older frames don't."""
+    last_year = datetime.now().year - 1
+    for year in [last_year, last_year - 1]:
+        await frames.get_frame(year=year, fiscal_period="fy")
+    _age(store, "frames", 120)
+    del get_frame[:]
+
+    for year in [last_year, last_year - 1]:
+        await frames.get_frame(year=year, fiscal_period="fy")
+
+    assert get_frame == [
+        f"https://data.sec.gov/api/xbrl/frames/us-gaap/Revenues/USD/CY{last_year}.json"
+    ]
+
+
+def _corrupt(store, *partition):
+    """Replace a stored file with one that can't be read."""
+    store.path.joinpath(*partition, "data.parquet").write_bytes(b"not parquet")
+
+
+def test_query_frames_prunes_partitions(store):
+    """Test only the files of the partitions matching the filters are read."""
+    for fact in ["Revenues", "Assets"]:
+        for period in ["CY2019", "CY2020"]:
+            store.put_frame(
+                "us-gaap", fact, "USD", period, dict(FRAME, tag=fact, ccp=period)
+            )
+    _corrupt(
+        store, "frames", "taxonomy=us-gaap", "fact=Assets", "unit=USD", "period=CY2019"
+    )
+
+    table = store.query_frames(fact=["Revenues"], period=["CY2020"], cik=[320193])
+
+    assert table.column("fact").to_pylist() == ["Revenues"]
+    assert table.column("period").to_pylist() == ["CY2020"]
+    assert table.column("entityName").to_pylist() == ["Apple Inc."]
+    assert store.query_frames(period=["CY2020"]).num_rows == 4
+    # The file of the other partition is only read without the filters.
+    with pytest.raises(ValueError, match="Parquet"):
+        store.query_frames(fact=["Assets"])
+
+
+def test_query_concepts_filters(store):
+    """Test the company concepts are filtered by CIK, fiscal year and period."""
+    store.put_concept("us-gaap", "Revenues", 320193, CONCEPT)
+    previous = {
+        **CONCEPT["units"]["USD"][0],
+        "fy": 2018,
+        "fp": "Q4",
+        "accn": "0000320193-18-000145",
+    }
+    store.put_concept(
+        "us-gaap",
+        "Revenues",
+        1652044,
+        dict(CONCEPT, cik=1652044, units={"USD": [previous]}),
+    )
+    _corrupt(store, "concepts", "taxonomy=us-gaap", "fact=Revenues", "cik=1652044")
+
+    table = store.query_concepts(cik=[320193], fy=[2019], fp=["FY"])
+
+    assert table.column("accn").to_pylist() == ["0000320193-19-000119"]
+    assert table.column("cik").to_pylist() == [320193]
+    assert store.query_concepts(cik=[320193], fy=[2018]).num_rows == 0
+    assert store.query_frames().num_rows == 0
+
+
+@pytest.mark.asyncio
+async def test_query_frames_by_symbol(store, monkeypatch):
+    """Test the stored frames are queried by ticker symbol."""
+
+    class Resolver:
+        """Resolve the symbols of Apple and Alphabet."""
+
+        ciks = {"AAPL": "0000320193", "GOOGL": "0001652044"}
+
+        def cik(self, symbol):
+            """Get the CIK of a symbol."""
+            return self.ciks.get(symbol)
+
+        def symbol(self, cik):
+            """Get the symbol of a CIK."""
+            return {int(v): k for k, v in self.ciks.items()}.get(cik)
+
+        async def load(self, **kwargs):
+            """Load nothing more."""
+            return self
+
+    async def get_symbol_resolver(use_cache=True):
+        """Get the resolver."""
+        return Resolver()
+
+    monkeypatch.setattr(frames, "get_symbol_resolver", get_symbol_resolver)
+    monkeypatch.setattr(frames, "get_xbrl_store", lambda: store)
+    store.put_frame("us-gaap", "Revenues", "USD", "CY2019", FRAME)
+    store.put_concept("us-gaap", "Revenues", 320193, CONCEPT)
+
+    df = await frames.query_frames(symbols=["GOOGL", "UNKNOWN"], periods=["CY2019"])
+    assert df["symbol"].tolist() == ["GOOGL"]
+    assert df["val"].tolist() == [161857000000.0]
+
+    df = await frames.query_concepts(
+        facts=["Revenues"], fiscal_years=[2019], fiscal_periods=["fy"]
+    )
+    assert df["symbol"].tolist() == ["AAPL"]
+    assert df["form"].tolist() == ["10-K"]
@@ -3,8 +3,8 @@
 # pylint: disable=too-many-lines
 # pylint: disable=unused-argument
 # pylint: disable=simplifiable-if-expression
-import asyncio
 import json
+from copy import deepcopy
 from datetime import (
     date as dateType,
     datetime,
@@ -17,10 +17,12 @@ from typing import Any, Dict, List, Literal, Optional, Union
 import exchange_calendars as xcals
 import pandas as pd
 import pytz
-from aiohttp_client_cache import SQLiteBackend
+from aiohttp_client_cache.backends import CacheBackend
 from aiohttp_client_cache.session import CachedSession
-from dateutil import rrule
+from openbb_core.app.model.abstract.error import OpenBBError
 from openbb_core.app.utils import get_user_cache_directory
+from openbb_core.provider.utils.cache_db import get_sqlite_backend
+from openbb_core.provider.utils.date_range import download_date_range
 from openbb_core.provider.utils.helpers import amake_request, to_snake_case
 from openbb_tmx.utils import gql
 from pandas.tseries.holiday import next_workday
@@ -28,6 +30,9 @@ from random_user_agent.user_agent import UserAgent
 
 cache_dir = get_user_cache_directory()
 
+# Date range chunks of the price history requested at the same time.
+MAX_CONCURRENT_CHUNKS = 8
+
 
 def get_random_agent() -> str:
     """Get a random user agent."""
@@ -37,21 +42,21 @@ def get_random_agent() -> str:
 
 
 # Only used for obtaining the directory of all valid company tickers.
-tmx_companies_backend = SQLiteBackend(
+tmx_companies_backend = get_sqlite_backend(
     f"{cache_dir}/http/tmx_companies", expire_after=timedelta(days=2)
 )
 
 # Only used for obtaining the directory of all valid indices.
-tmx_indices_backend = SQLiteBackend(
+tmx_indices_backend = get_sqlite_backend(
     f"{cache_dir}/http/tmx_indices", expire_after=timedelta(days=1)
 )
 
 # Only used for obtaining the all ETFs JSON file.
-tmx_etfs_backend = SQLiteBackend(
+tmx_etfs_backend = get_sqlite_backend(
     f"{cache_dir}/http/tmx_etfs", expire_after=timedelta(hours=4)
 )
 
-tmx_bonds_backend = SQLiteBackend(
+tmx_bonds_backend = get_sqlite_backend(
     f"{cache_dir}/http/tmx_bonds", expire_after=timedelta(days=1)
 )
 
@@ -277,7 +282,7 @@ async def response_callback(response, _: Any):
 async def get_data_from_url(
     url: str,
     use_cache: bool = True,
-    backend: Optional[SQLiteBackend] = None,
+    backend: Optional[CacheBackend] = None,
     **kwargs: Any,
 ) -> Any:
     """Make an asynchronous HTTP request to a static file."""
@@ -726,7 +731,6 @@ async def get_daily_price_history(
         else end_date
     )
     user_agent = get_random_agent()
-    results: List[Dict] = []
     symbol = symbol.upper().replace("-", ".").replace(".TO", "").replace(".TSX", "")
     start_date = (
         (datetime.now() - timedelta(weeks=52)).date()
@@ -735,26 +739,9 @@ async def get_daily_price_history(
     )
     end_date = datetime.now() if end_date is None else end_date
 
-    # Generate a list of dates from start_date to end_date with a frequency of 4 weeks
-    dates = list(
-        rrule.rrule(rrule.WEEKLY, interval=4, dtstart=start_date, until=end_date)
-    )
-
-    # Add end_date to the list if it's not there already
-    if dates[-1] != end_date:
-        dates.append(end_date)  # type: ignore
-
-    # Create a list of 4-week chunks
-    chunks = [
-        (dates[i], dates[i + 1] - timedelta(days=1)) for i in range(len(dates) - 1)
-    ]
-
-    # Adjust the end date of the last chunk to be the final end date
-    chunks[-1] = (chunks[-1][0], end_date)  # type: ignore
-
-    async def create_task(start, end, results):
-        """Create a task from a start and end date chunk."""
-        payload = gql.get_company_price_history_payload.copy()
+    async def get_chunk(start: dateType, end: dateType) -> List[Dict]:
+        """Get the prices of a date range."""
+        payload = deepcopy(gql.get_company_price_history_payload)
         payload["variables"]["adjusted"] = (
             False if adjustment == "unadjusted" else True  # noqa: SIM211
         )
@@ -769,54 +756,33 @@ async def get_daily_price_history(
         )
         if payload["variables"]["adjustmentType"] is None:
             payload["variables"].pop("adjustmentType")
-        url = "https://app-money.tmx.com/graphql"
-
-        async def try_again():
-            """Try again if it fails."""
-            return await get_data_from_gql(
-                method="POST",
-                url=url,
-                data=json.dumps(payload),
-                headers={
-                    "authority": "app-money.tmx.com",
-                    "referer": f"https://money.tmx.com/en/quote/{symbol}",
-                    "locale": "en",
-                    "Content-Type": "application/json",
-                    "User-Agent": user_agent,
-                    "Accept": "*/*",
-                },
-                timeout=3,
-            )
-
-        try:
-            data = await get_data_from_gql(
-                method="POST",
-                url=url,
-                data=json.dumps(payload),
-                headers={
-                    "authority": "app-money.tmx.com",
-                    "referer": f"https://money.tmx.com/en/quote/{symbol}",
-                    "locale": "en",
-                    "Content-Type": "application/json",
-                    "User-Agent": user_agent,
-                    "Accept": "*/*",
-                },
-                timeout=3,
-            )
-        except Exception:
-            data = await try_again()
-
+        data = await get_data_from_gql(
+            method="POST",
+            url="https://app-money.tmx.com/graphql",
+            data=json.dumps(payload),
+            headers={
+                "authority": "app-money.tmx.com",
+                "referer": f"https://money.tmx.com/en/quote/{symbol}",
+                "locale": "en",
+                "Content-Type": "application/json",
+                "User-Agent": user_agent,
+                "Accept": "*/*",
+            },
+            timeout=3,
+        )
         if isinstance(data, str):
-            data = await try_again()
-
-        if data.get("data") and data["data"].get("getCompanyPriceHistory"):
-            results.extend(data["data"].get("getCompanyPriceHistory"))
-
-        return results
-
-    tasks = [create_task(chunk[0], chunk[1], results) for chunk in chunks]
-
-    await asyncio.gather(*tasks)
+            raise OpenBBError(f"Unexpected response from TMX: {data[:100]}")
+        return (data.get("data") or {}).get("getCompanyPriceHistory") or []
+
+    # The prices are requested in 4-week chunks.
+    results = await download_date_range(
+        get_chunk,
+        start_date,  # type: ignore
+        end_date,  # type: ignore
+        timedelta(weeks=4),
+        max_concurrent=MAX_CONCURRENT_CHUNKS,
+        key=lambda d: d["datetime"],
+    )
 
     results = [d for d in results if d["openPrice"] is not None]
 
@@ -931,7 +897,6 @@ async def get_intraday_price_history(
             else end_date
         )
     user_agent = get_random_agent()
-    results: List[Dict] = []
     symbol = symbol.upper().replace("-", ".").replace(".TO", "").replace(".TSX", "")
     start_date = (
         (datetime.now() - timedelta(weeks=4)).date()
@@ -944,53 +909,25 @@ async def get_intraday_price_history(
     start_date = max(start_date, date_check)
     if end_date < date_check:  # type: ignore
         end_date = datetime.now().date()
-    # Generate a list of dates from start_date to end_date with a frequency of 3 weeks
-    dates = list(
-        rrule.rrule(rrule.WEEKLY, interval=4, dtstart=start_date, until=end_date)  # type: ignore
-    )
-
-    if dates[-1] != end_date:
-        dates.append(end_date)  # type: ignore
-
-    # Create a list of 4-week chunks
-    chunks = [
-        (dates[i], dates[i + 1] - timedelta(days=1)) for i in range(len(dates) - 1)
-    ]
 
-    # Adjust the end date of the last chunk to be the final end date
-    chunks[-1] = (chunks[-1][0], end_date)  # type: ignore
-
-    async def create_task(start, end, results):
-        """Create a task from a start and end date chunk."""
-        # Create a datetime object representing 9:30 AM on the date
-        start_obj = datetime.combine(start, time(9, 30))
-        end_obj = datetime.combine(end, time(16, 0))
-
-        # Convert the datetime object to EST
+    async def get_chunk(start: dateType, end: dateType) -> List[Dict]:
+        """Get the intraday prices of a date range."""
+        # Convert 9:30 AM on the start date, and 4 PM on the end date, from EST to timestamps.
         est = pytz.timezone("US/Eastern")
-        start_obj_est = est.localize(start_obj)
-        end_obj_est = est.localize(end_obj)
-
-        # Convert the datetime object to a timestamp
-        start_time = int(start_obj_est.timestamp())
-        end_time = int(end_obj_est.timestamp())
-
-        payload = gql.get_timeseries_payload.copy()
-        payload["variables"]["interval"] = None
-        if payload["variables"].get("start"):
-            payload["variables"].pop("start")
-        payload["variables"]["startDateTime"] = int(start_time)
-        if payload["variables"].get("end"):
-            payload["variables"].pop("end")
-        payload["variables"]["endDateTime"] = int(end_time)
+        start_time = int(est.localize(datetime.combine(start, time(9, 30))).timestamp())
+        end_time = int(est.localize(datetime.combine(end, time(16, 0))).timestamp())
+
+        payload = deepcopy(gql.get_timeseries_payload)
+        payload["variables"].pop("start", None)
+        payload["variables"]["startDateTime"] = start_time
+        payload["variables"].pop("end", None)
+        payload["variables"]["endDateTime"] = end_time
         payload["variables"]["interval"] = interval
         payload["variables"]["symbol"] = symbol
-        if payload["variables"].get("freq"):
-            payload["variables"].pop("freq")
-        url = "https://app-money.tmx.com/graphql"
+        payload["variables"].pop("freq", None)
         data = await get_data_from_gql(
             method="POST",
-            url=url,
+            url="https://app-money.tmx.com/graphql",
             data=json.dumps(payload),
             headers={
                 "authority": "app-money.tmx.com",
@@ -1002,36 +939,20 @@ async def get_intraday_price_history(
             },
             timeout=3,
         )
-
-        async def try_again():
-            """Try again if the request fails."""
-            return await get_data_from_gql(
-                method="POST",
-                url=url,
-                data=json.dumps(payload),
-                headers={
-                    "authority": "app-money.tmx.com",
-                    "referer": f"https://money.tmx.com/en/quote/{symbol}",
-                    "locale": "en",
-                    "Content-Type": "application/json",
-                    "User-Agent": user_agent,
-                    "Accept": "*/*",
-                },
-                timeout=3,
-            )
-
         if isinstance(data, str):
-            data = await try_again()
-
-        if data.get("data") and data["data"].get("getTimeSeriesData"):
-            result = data["data"].get("getTimeSeriesData")
-            results.extend(result)
-
-        return results
-
-    tasks = [create_task(chunk[0], chunk[1], results) for chunk in chunks]
-
-    await asyncio.gather(*tasks)
+            raise OpenBBError(f"Unexpected response from TMX: {data[:100]}")
+        return (data.get("data") or {}).get("getTimeSeriesData") or []
+
+    # The prices are requested in 4-week chunks.
+    results = await download_date_range(
+        get_chunk,
+        start_date,  # type: ignore
+        end_date,  # type: ignore
+        timedelta(weeks=4),
+        max_concurrent=MAX_CONCURRENT_CHUNKS,
+        # The records without a timestamp have no key, and are all kept.
+        key=lambda d: d.get("dateTime"),
+    )
 
     if len(results) > 0 and "dateTime" in results[0]:
         results = sorted(results, key=lambda x: x["dateTime"], reverse=False)
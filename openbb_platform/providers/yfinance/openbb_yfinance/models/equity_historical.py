@@ -15,11 +15,16 @@ from openbb_core.provider.standard_models.equity_historical import (
 )
 from openbb_core.provider.utils.descriptions import QUERY_DESCRIPTIONS
 from openbb_core.provider.utils.errors import EmptyDataError
-from openbb_yfinance.utils.helpers import yf_download
+from openbb_yfinance.utils.helpers import ayf_download, df_to_columnar
 from openbb_yfinance.utils.references import INTERVALS_DICT, PERIODS
-from pandas import DataFrame, Timestamp
+from pandas import DataFrame, Timestamp, concat
 from pydantic import Field, PrivateAttr, field_validator, model_validator
 
+# Maximum number of symbols downloaded by a yf.download call.
+BATCH_SIZE = 100
+# Maximum number of threads downloading the symbols of a batch.
+MAX_THREADS = 8
+
 
 class YFinanceEquityHistoricalQueryParams(EquityHistoricalQueryParams):
     """Yahoo Finance Equity Historical Price Query.
@@ -148,7 +153,7 @@ class YFinanceEquityHistoricalFetcher(
         return YFinanceEquityHistoricalQueryParams(**params)
 
     @staticmethod
-    def extract_data(
+    async def aextract_data(
         query: YFinanceEquityHistoricalQueryParams,
         credentials: Optional[Dict[str, str]],
         **kwargs: Any,
@@ -156,28 +161,43 @@ class YFinanceEquityHistoricalFetcher(
         """Return the raw data from the Yahoo Finance endpoint."""
         adjusted = query.adjustment == "splits_and_dividends"
         kwargs = {"auto_adjust": True, "back_adjust": True} if adjusted is True else {}
-        # pylint: disable=protected-access
-        data = yf_download(
-            symbol=query.symbol,
-            start_date=query.start_date,
-            end_date=query.end_date,
-            interval=INTERVALS_DICT[query.interval],  # type: ignore
-            period=query._period,
-            prepost=query.extended_hours,
-            actions=query.include_actions,
-            progress=query._progress,
-            ignore_tz=query._ignore_tz,
-            keepna=query._keepna,
-            repair=query._repair,
-            rounding=query._rounding,
-            group_by=query._group_by,
-            adjusted=adjusted,
-            **kwargs,
-        )
+        symbols = list(dict.fromkeys(query.symbol.upper().split(",")))
+        batches = [
+            symbols[i : i + BATCH_SIZE] for i in range(0, len(symbols), BATCH_SIZE)
+        ]
+        results = []
+        for batch in batches:
+            # pylint: disable=protected-access
+            data = await ayf_download(
+                ",".join(batch),
+                start_date=query.start_date,
+                end_date=query.end_date,
+                interval=INTERVALS_DICT[query.interval],  # type: ignore
+                period=query._period,
+                prepost=query.extended_hours,
+                actions=query.include_actions,
+                progress=query._progress,
+                ignore_tz=query._ignore_tz,
+                keepna=query._keepna,
+                repair=query._repair,
+                rounding=query._rounding,
+                group_by=query._group_by,
+                adjusted=adjusted,
+                threads=min(len(batch), MAX_THREADS) if len(batch) > 1 else False,
+                **kwargs,
+            )
+            if len(batches) > 1 and not data.empty and "symbol" not in data.columns:
+                data = data.assign(symbol=batch[0])
+            results.append(data)
 
+        data = concat(results) if len(results) > 1 else results[0]
         if data.empty:
             raise EmptyDataError()
 
+        if len(batches) > 1:
+            data = data.sort_values(["date", "symbol"], kind="stable")
+            data = data.reset_index(drop=True)
+
         return data
 
     @staticmethod
@@ -186,14 +206,21 @@ class YFinanceEquityHistoricalFetcher(
         data: DataFrame,
         **kwargs: Any,
     ) -> List[YFinanceEquityHistoricalData]:
-        """Transform the data to the standard format."""
+        """Transform the data to the standard format.
+
+        The rows are returned as a columnar result, without validating each of
+        them, when pyarrow is installed.
+        """
         if "capital_gains" in data.columns:
             data = (
                 data.drop(columns=["capital_gains"])
                 if query.include_actions is False
                 else data
             )
-        return [
-            YFinanceEquityHistoricalData.model_validate(d)
-            for d in data.to_dict("records")
-        ]
+        try:
+            return df_to_columnar(data, YFinanceEquityHistoricalData)  # type: ignore[return-value]
+        except ImportError:
+            return [
+                YFinanceEquityHistoricalData.model_validate(d)
+                for d in data.to_dict("records")
+            ]
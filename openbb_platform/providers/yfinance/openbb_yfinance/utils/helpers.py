@@ -1,20 +1,68 @@
 """Yahoo Finance helpers module."""
 
 # pylint: disable=unused-argument
+from concurrent.futures import ThreadPoolExecutor
 from datetime import (
     date as dateType,
     datetime,
 )
 from pathlib import Path
-from typing import Any, Literal, Optional, Union
+from typing import Any, List, Literal, Optional, Type, Union
 
 import pandas as pd
 import yfinance as yf
 from dateutil.relativedelta import relativedelta
+from openbb_core.provider.abstract.columnar_result import ColumnarResult
+from openbb_core.provider.abstract.data import Data
 from openbb_core.provider.utils.errors import EmptyDataError
+from openbb_core.provider.utils.executor import run_blocking
 from openbb_yfinance.utils.references import INTERVALS, MONTHS, PERIODS
 
 
+def _download_tickers(
+    tickers: List[str],
+    threads: Union[bool, int] = False,
+    ignore_tz: bool = True,
+    group_by: Literal["ticker", "column"] = "ticker",
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Download the history of tickers in the shape `yf.download` returns.
+
+    yf.download collects the data of a call in module globals, reset by every
+    call, so calls from different threads would mix or drop each other's
+    tickers. Each ticker is downloaded with its own `yf.Ticker` instead.
+    """
+
+    def download_one(ticker: str) -> pd.DataFrame:
+        try:
+            data = yf.Ticker(ticker).history(raise_errors=True, **kwargs)
+        except Exception:  # pylint: disable=broad-except
+            return yf.utils.empty_df()
+        if ignore_tz and not data.empty:
+            data.index = data.index.tz_localize(None)
+        return data
+
+    tickers = list(dict.fromkeys(tickers))
+    if threads and len(tickers) > 1:
+        workers = len(tickers) if threads is True else threads
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            dfs = list(executor.map(download_one, tickers))
+    else:
+        dfs = [download_one(ticker) for ticker in tickers]
+
+    if len(tickers) == 1:
+        return dfs[0]
+
+    data = pd.concat(dfs, axis=1, sort=True, keys=tickers, names=["Ticker", "Price"])
+    if not ignore_tz:
+        # The tickers may trade in different time zones.
+        data.index = pd.to_datetime(data.index, utc=True)
+    if group_by == "column":
+        data.columns = data.columns.swaplevel(0, 1)
+        data = data.sort_index(level=0, axis=1)
+    return data
+
+
 def get_futures_data() -> pd.DataFrame:
     """Return the dataframe of the futures csv file."""
     return pd.read_csv(Path(__file__).resolve().parent / "futures.csv")
@@ -53,7 +101,9 @@ def get_futures_curve(symbol: str, date: Optional[dateType]) -> pd.DataFrame:
         future_symbol = (
             f"{symbol}{MONTHS[future.month]}{str(future.year)[-2:]}.{exchange}"
         )
-        data = yf.download(future_symbol, progress=False, ignore_tz=True, threads=False)
+        data = _download_tickers(
+            [future_symbol], period="max", auto_adjust=False, back_adjust=False
+        )
 
         if data.empty:
             empty_count += 1
@@ -95,9 +145,14 @@ def yf_download(
     rounding: bool = False,
     group_by: Literal["ticker", "column"] = "ticker",
     adjusted: bool = False,
+    threads: Union[bool, int] = False,
     **kwargs: Any,
 ) -> pd.DataFrame:
-    """Get yFinance OHLC data for any ticker and interval available."""
+    """Get yFinance OHLC data for any ticker and interval available.
+
+    Several tickers, separated by commas, are downloaded in a single call, by
+    `threads` threads.
+    """
     symbol = symbol.upper()
     _start_date = start_date
     intraday = False
@@ -121,22 +176,21 @@ def yf_download(
         kwargs = dict(auto_adjust=False, back_adjust=False)
 
     try:
-        data = yf.download(
-            tickers=symbol,
+        data = _download_tickers(
+            symbol.replace(",", " ").split(),
+            threads=threads,
+            ignore_tz=ignore_tz,
+            group_by=group_by,
             start=_start_date,
             end=None,
             interval=interval,
             period=period,
             prepost=prepost,
             actions=actions,
-            progress=progress,
-            ignore_tz=ignore_tz,
             keepna=keepna,
             repair=repair,
             rounding=rounding,
-            group_by=group_by,
-            threads=False,
-            **kwargs,
+            **{"auto_adjust": False, "back_adjust": False, **kwargs},
         )
     except ValueError as exc:
         raise EmptyDataError() from exc
@@ -185,6 +239,53 @@ def yf_download(
     return data
 
 
+async def ayf_download(symbol: str, **kwargs: Any) -> pd.DataFrame:
+    """Get yFinance OHLC data in the provider executor, see `yf_download` for the arguments.
+
+    The download blocks, so it is run out of the event loop.
+    """
+    return await run_blocking("yfinance", yf_download, symbol, **kwargs)
+
+
+def df_to_columnar(data: pd.DataFrame, data_type: Type[Data]) -> ColumnarResult:
+    """Convert the output of `yf_download` to a columnar result of a data model.
+
+    The columns are renamed and coerced as the data model would for each row,
+    the fields of the model come first, in their order, then the extra columns.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    """
+    import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+    aliases = {
+        source: field
+        for field, source in getattr(data_type, "__alias_dict__", {}).items()
+    }
+    data = data.rename(columns=aliases)
+    if "date" in data.columns:
+        dates = pd.to_datetime(data["date"])
+        intraday = data["date"].astype(str).str.contains(":").any()
+        data = data.assign(date=dates if intraday else dates.dt.date)
+    columns: List[str] = []
+    for name, field in data_type.model_fields.items():
+        if name not in data.columns:
+            if field.is_required():
+                raise ValueError(f"The column '{name}' is missing.")
+            data = data.assign(**{name: None})
+        elif field.annotation is float:
+            data = data.assign(**{name: data[name].astype(float)})
+        columns.append(name)
+    columns.extend(c for c in data.columns if c not in columns)
+    # Arrow reads NaN as null, keep it as the data model does for each row.
+    table = pa.table(
+        {c: pa.array(data[c], from_pandas=data[c].dtype.kind != "f") for c in columns}
+    )
+    return ColumnarResult(table, data_type)
+
+
 def df_transform_numbers(data: pd.DataFrame, columns: list) -> pd.DataFrame:
     """Replace abbreviations of numbers with actual numbers."""
     multipliers = {"M": 1e6, "B": 1e9, "T": 1e12}
@@ -1,11 +1,27 @@
 """Test yfinance helpers."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import numpy as np
 import pandas as pd
 import pytest
 
+from providers.yfinance.openbb_yfinance.models import equity_historical
+from providers.yfinance.openbb_yfinance.models.equity_historical import (
+    YFinanceEquityHistoricalData,
+    YFinanceEquityHistoricalFetcher,
+    YFinanceEquityHistoricalQueryParams,
+)
+from providers.yfinance.openbb_yfinance.utils import helpers
 from providers.yfinance.openbb_yfinance.utils.helpers import (
+    ayf_download,
+    df_to_columnar,
     df_transform_numbers,
     get_futures_data,
+    yf_download,
 )
 
 # pylint: disable=redefined-outer-name, unused-argument
@@ -34,3 +50,131 @@ def test_df_transform_numbers():
     transformed = df_transform_numbers(data, ["Value", "% Change"])
     assert transformed["Value"].equals(pd.Series([1e6, 2.5e9, 3e12]))
     assert transformed["% Change"].equals(pd.Series([1.0, -2.0, 3.5]))
+
+
+@pytest.mark.parametrize(
+    "dates",
+    [
+        ["2024-01-02", "2024-01-03", "2024-01-04"],
+        ["2024-01-02 09:30:00", "2024-01-02 09:31:00", "2024-01-02 09:32:00"],
+    ],
+)
+def test_df_to_columnar(dates):
+    """Test the columnar rows are the rows validated one by one."""
+    data = pd.DataFrame(
+        {
+            "date": dates,
+            "open": [1.0, 2.0, 3.0],
+            "high": [1.5, 2.5, 3.5],
+            "low": [0.5, 1.5, 2.5],
+            "close": [1.2, np.nan, 3.2],
+            "volume": [100, 200, 300],
+            "dividends": [0.0, np.nan, 0.25],
+            "stock_splits": [0.0, 2.0, 0.0],
+            "capital_gains": [np.nan, 0.0, 0.0],
+            "symbol": ["A", "B", "A"],
+        }
+    )
+
+    rows = df_to_columnar(data, YFinanceEquityHistoricalData)
+    expected = [
+        YFinanceEquityHistoricalData.model_validate(d) for d in data.to_dict("records")
+    ]
+
+    assert len(rows) == 3
+    assert [type(r.date) for r in rows] == [type(r.date) for r in expected]
+    pd.testing.assert_frame_equal(
+        pd.DataFrame([r.model_dump() for r in rows]),
+        pd.DataFrame([r.model_dump() for r in expected]),
+    )
+
+
+@pytest.mark.asyncio
+async def test_equity_historical_batches(monkeypatch):
+    """Test the symbols are downloaded in batches, tagged and sorted by date."""
+    calls = []
+
+    async def ayf_download(symbol, **kwargs):
+        """Return two days of prices, with a symbol column for several symbols."""
+        calls.append((symbol, kwargs["threads"]))
+        tickers = symbol.split(",")
+        data = pd.DataFrame(
+            {
+                "date": [d for d in ["2024-01-03", "2024-01-02"] for _ in tickers],
+                "close": [1.0] * 2 * len(tickers),
+            }
+        )
+        return data.assign(symbol=tickers * 2) if len(tickers) > 1 else data
+
+    monkeypatch.setattr(equity_historical, "ayf_download", ayf_download)
+    monkeypatch.setattr(equity_historical, "BATCH_SIZE", 2)
+    query = YFinanceEquityHistoricalQueryParams(
+        symbol="c,a,b,a", start_date=date(2024, 1, 2), end_date=date(2024, 1, 3)
+    )
+
+    data = await YFinanceEquityHistoricalFetcher.aextract_data(query, None)
+
+    assert calls == [("C,A", 2), ("B", False)]
+    assert data["date"].tolist() == ["2024-01-02"] * 3 + ["2024-01-03"] * 3
+    assert data["symbol"].tolist() == ["A", "B", "C"] * 2
+    assert data.index.tolist() == list(range(6))
+
+
+class MockTicker:
+    """Ticker returning a day of prices, its close set by the ticker."""
+
+    barrier = threading.Barrier(4, timeout=5)
+
+    def __init__(self, ticker):
+        """Initialize the ticker."""
+        self.ticker = ticker
+
+    def history(self, **kwargs):
+        """Return the prices once all the downloads are running."""
+        self.barrier.wait()
+        time.sleep(0.01)
+        close = float(ord(self.ticker[0]))
+        return pd.DataFrame(
+            {
+                "Open": [close],
+                "High": [close],
+                "Low": [close],
+                "Close": [close],
+                "Adj Close": [close],
+                "Volume": [100],
+            },
+            index=pd.DatetimeIndex(["2024-01-02"], tz="America/New_York", name="Date"),
+        )
+
+
+def test_yf_download_concurrent(monkeypatch):
+    """Test concurrent downloads, from several threads, keep their own tickers."""
+    monkeypatch.setattr(helpers.yf, "Ticker", MockTicker)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first, second = executor.map(
+            lambda s: yf_download(s, start_date="2024-01-01", threads=2),
+            ["A,B", "C,D"],
+        )
+
+    assert first["symbol"].tolist() == ["A", "B"]
+    assert first["close"].tolist() == [65.0, 66.0]
+    assert second["symbol"].tolist() == ["C", "D"]
+    assert second["close"].tolist() == [67.0, 68.0]
+
+
+@pytest.mark.asyncio
+async def test_ayf_download_executor(monkeypatch):
+    """Test the download is run in the executor of the provider."""
+    calls = []
+
+    async def run_blocking(key, func, *args, **kwargs):
+        """Record the call and run the function."""
+        calls.append(key)
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr(helpers, "run_blocking", run_blocking)
+    monkeypatch.setattr(helpers, "yf_download", lambda symbol, **kwargs: symbol)
+
+    assert await ayf_download("A", threads=False) == "A"
+    assert calls == ["yfinance"]